@@ -0,0 +1,159 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: All-pairs shortest paths for the directed graph
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from priority_queues import IndexedMinHeap
+from shared_csr import SharedCSR, attach
+from shortest_paths import INFINITY, dijkstra_with_queue
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DistanceMatrix:
+    """
+    V x V table of shortest path lengths stored in one flat array of doubles
+    - matrix[i][j] is the distance from i to j (INFINITY if j is unreachable)
+    - matrix[i] is a memoryview of row i, so reading a row copies nothing
+    """
+
+    def __init__(self, v_count: int, values=None):
+        self.v_count = v_count
+        if values is None:
+            values = array('d', [INFINITY]) * (v_count * v_count)
+        self.values = values
+
+    def __len__(self) -> int:
+        return self.v_count
+
+    def __getitem__(self, i: int):
+        n = self.v_count
+        return memoryview(self.values)[i * n:(i + 1) * n]
+
+    def __iter__(self):
+        for i in range(self.v_count):
+            yield self[i]
+
+    def tolist(self) -> []:
+        return [row.tolist() for row in self]
+
+    def to_numpy(self):
+        """
+        This method returns the distances as a V x V numpy array sharing the same memory.
+        Requires numpy.
+        """
+        if numpy is None:
+            raise ImportError('to_numpy() requires numpy')
+        return numpy.frombuffer(self.values, dtype=numpy.float64).reshape(self.v_count, self.v_count)
+
+
+def floyd_warshall(storage) -> DistanceMatrix:
+    """
+    This function computes all-pairs distances with the Floyd-Warshall algorithm, O(V^3).
+    It is meant for small, dense graphs. With numpy each pass over k is one vectorized
+    minimum over the whole matrix; without it the passes run row by row in Python.
+    """
+    n = storage.vertex_count()
+    if numpy is not None:
+        if storage.kind == 'numpy':
+            matrix = storage.matrix()
+            dist = numpy.where(matrix > 0, matrix, INFINITY).astype(numpy.float64)
+        else:
+            dist = numpy.full((n, n), INFINITY)
+            for src, dst, weight in storage.edges():
+                if weight > 0:
+                    dist[src, dst] = weight
+        numpy.fill_diagonal(dist, 0)
+        for k in range(n):
+            numpy.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+        return DistanceMatrix(n, array('d', dist.tobytes()))
+
+    dist = [[INFINITY] * n for _ in range(n)]
+    for src, dst, weight in storage.edges():
+        if weight > 0:
+            dist[src][dst] = weight
+    for i in range(n):
+        dist[i][i] = 0
+    for k in range(n):
+        row_k = dist[k]
+        for row in dist:
+            via = row[k]
+            if via == INFINITY:
+                continue
+            row[:] = [a if a <= via + b else via + b for a, b in zip(row, row_k)]
+
+    result = DistanceMatrix(n)
+    for i, row in enumerate(dist):
+        result.values[i * n:(i + 1) * n] = array('d', row)
+    return result
+
+
+def dijkstra_rows(storage, sources, out) -> None:
+    """
+    This function runs Dijkstra from each vertex in SOURCES and writes the distances into
+    the matching rows of OUT, a flat writable buffer of doubles (V x V).
+    """
+    n = storage.vertex_count()
+    for src in sources:
+        distances, _ = dijkstra_with_queue(storage.neighbors, n, src, IndexedMinHeap(n))
+        out[src * n:(src + 1) * n] = array('d', distances)
+
+
+# state of a pool worker, set once by _init_worker()
+_worker = None
+
+
+def _init_worker(graph_handle, result_name: str) -> None:
+    global _worker
+    shm, storage = attach(graph_handle)
+    result = SharedMemory(name=result_name)
+    _worker = (shm, storage, result, result.buf.cast('d'))
+
+
+def _worker_rows(sources) -> int:
+    _, storage, _, out = _worker
+    dijkstra_rows(storage, sources, out)
+    return len(sources)
+
+
+def parallel_dijkstra(storage, workers=None, chunk_size=64) -> DistanceMatrix:
+    """
+    This function computes all-pairs distances by running Dijkstra from every vertex,
+    with the sources split into chunks across a pool of WORKERS processes.
+
+    The graph is packed once into shared memory as CSR arrays, and each worker writes its
+    rows straight into a shared result block, so neither the graph nor the results are
+    pickled between processes.
+    """
+    n = storage.vertex_count()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or n <= chunk_size:
+        result = DistanceMatrix(n)
+        dijkstra_rows(storage, range(n), memoryview(result.values))
+        return result
+
+    result_shm = SharedMemory(create=True, size=max(8 * n * n, 8))
+    try:
+        with SharedCSR(storage) as graph:
+            chunks = [range(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(graph.handle(), result_shm.name)) as pool:
+                for _ in pool.map(_worker_rows, chunks):
+                    pass
+        values = array('d')
+        with result_shm.buf[:8 * n * n] as raw:
+            values.frombytes(raw)
+        return DistanceMatrix(n, values)
+    finally:
+        result_shm.close()
+        result_shm.unlink()
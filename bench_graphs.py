@@ -0,0 +1,357 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Benchmarks for DirectedGraph and UndirectedGraph on seeded synthetic graphs
+#
+# Usage: python bench_graphs.py --sizes 100 1000 10000 --output bench.json
+#        python bench_graphs.py --compare bench.json     (exit code 1 on a regression)
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from d_graph import DirectedGraph
+from ud_graph import UndirectedGraph
+
+
+# ------------------------------ generators ------------------------------ #
+# every generator returns a list of (src, dst, weight) edges on vertices 0 .. n - 1
+
+def random_sparse(n: int, seed: int, degree=4) -> []:
+    """
+    Uniform random graph with about DEGREE out-edges per vertex.
+    """
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(n * degree):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((u, v, rng.randint(1, 20)))
+    return edges
+
+
+def power_law(n: int, seed: int, links=2) -> []:
+    """
+    Preferential attachment (Barabasi-Albert): every new vertex is linked from LINKS earlier
+    vertices picked in proportion to their degree, which gives a few very large hubs.
+    Edges point from old to new vertices, so vertex 0 reaches the whole graph.
+    """
+    rng = random.Random(seed)
+    edges = []
+    # every vertex appears here once per edge it touches, so a uniform pick is degree-weighted
+    ends = [0]
+    for v in range(1, n):
+        for u in {rng.choice(ends) for _ in range(links)}:
+            edges.append((u, v, rng.randint(1, 20)))
+            ends.append(u)
+            ends.append(v)
+    return edges
+
+
+def grid(n: int, seed: int) -> []:
+    """
+    Square grid of about N vertices with edges going right and down.
+    """
+    rng = random.Random(seed)
+    side = max(1, math.isqrt(n))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            v = r * side + c
+            if c + 1 < side:
+                edges.append((v, v + 1, rng.randint(1, 20)))
+            if r + 1 < side:
+                edges.append((v, v + side, rng.randint(1, 20)))
+    return edges
+
+
+def deep_chain(n: int, seed: int) -> []:
+    """
+    A single path 0 -> 1 -> ... -> n - 1, the worst case for recursive traversals.
+    """
+    rng = random.Random(seed)
+    return [(v, v + 1, rng.randint(1, 20)) for v in range(n - 1)]
+
+
+GENERATORS = {
+    'random_sparse': random_sparse,
+    'power_law': power_law,
+    'grid': grid,
+    'deep_chain': deep_chain,
+}
+
+
+def vertex_count(edges) -> int:
+    return max((max(u, v) for u, v, _ in edges), default=-1) + 1
+
+
+def names(edges) -> []:
+    return [(f'v{u}', f'v{v}') for u, v, _ in edges]
+
+
+# ------------------------------ cases ------------------------------ #
+# a case takes (edges, storage) and returns RUN, which is timed and returns how many
+# operations it performed, for throughput. Everything else is setup and is not timed.
+# Searches count the vertices they actually reached, not the size of the graph.
+
+def directed_graph(edges, storage) -> DirectedGraph:
+    return DirectedGraph.from_edges(edges, storage, vertex_count(edges))
+
+
+def undirected_graph(edges) -> UndirectedGraph:
+    graph = UndirectedGraph()
+    graph.add_edges(names(edges))
+    return graph
+
+
+def single_call(call):
+    """
+    Wraps a query that answers one question per call, so it counts as one operation.
+    """
+    def run() -> int:
+        call()
+        return 1
+    return run
+
+
+def d_add_vertex(edges, storage) -> tuple:
+    graph = DirectedGraph()
+    graph.set_storage(storage)
+    n = vertex_count(edges)
+
+    def run() -> int:
+        for _ in range(n):
+            graph.add_vertex()
+        return n
+    return run
+
+
+def d_add_edge(edges, storage) -> tuple:
+    graph = DirectedGraph.from_edges([], storage, vertex_count(edges))
+
+    def run() -> int:
+        for u, v, w in edges:
+            graph.add_edge(u, v, w)
+        return len(edges)
+    return run
+
+
+def d_query(method: str):
+    def case(edges, storage) -> tuple:
+        graph = directed_graph(edges, storage)
+        call = getattr(graph, method)
+        if method in ('dfs', 'bfs'):
+            return lambda: len(call(0))
+        if method == 'dijkstra':
+            return lambda: sum(1 for d in call(0) if d != math.inf)
+        if method == 'get_edges':
+            return lambda: len(call())
+        return single_call(call)
+    return case
+
+
+def u_add_vertex(edges, storage) -> tuple:
+    graph = UndirectedGraph()
+    labels = [f'v{v}' for v in range(vertex_count(edges))]
+
+    def run() -> int:
+        for v in labels:
+            graph.add_vertex(v)
+        return len(labels)
+    return run
+
+
+def u_add_edge(edges, storage) -> tuple:
+    graph = UndirectedGraph()
+    pairs = names(edges)
+
+    def run() -> int:
+        for u, v in pairs:
+            graph.add_edge(u, v)
+        return len(pairs)
+    return run
+
+
+def u_remove_vertex(edges, storage) -> tuple:
+    graph = undirected_graph(edges)
+    victims = random.Random(0).sample(list(graph.adj_list), min(1000, len(graph.adj_list)))
+
+    def run() -> int:
+        for v in victims:
+            graph.remove_vertex(v)
+        return len(victims)
+    return run
+
+
+def u_query(method: str):
+    def case(edges, storage) -> tuple:
+        graph = undirected_graph(edges)
+        call = getattr(graph, method)
+        if method in ('dfs', 'bfs'):
+            return lambda: len(call('v0'))
+        if method == 'get_edges':
+            return lambda: len(call())
+        return single_call(call)
+    return case
+
+
+CASES = {
+    'directed': {
+        'add_vertex': d_add_vertex,
+        'add_edge': d_add_edge,
+        'get_edges': d_query('get_edges'),
+        'dfs': d_query('dfs'),
+        'bfs': d_query('bfs'),
+        'has_cycle': d_query('has_cycle'),
+        'dijkstra': d_query('dijkstra'),
+    },
+    'undirected': {
+        'add_vertex': u_add_vertex,
+        'add_edge': u_add_edge,
+        'remove_vertex': u_remove_vertex,
+        'get_edges': u_query('get_edges'),
+        'dfs': u_query('dfs'),
+        'bfs': u_query('bfs'),
+        'has_cycle': u_query('has_cycle'),
+        'count_connected_components': u_query('count_connected_components'),
+    },
+}
+
+
+# ------------------------------ runner ------------------------------ #
+
+def measure(case, edges, storage, repeat: int, memory: bool) -> dict:
+    """
+    Runs CASE REPEAT times, each on a fresh setup, and keeps the fastest time. With MEMORY
+    it runs once more under tracemalloc for the peak memory of the timed part alone.
+    """
+    best = math.inf
+    ops = 0
+    for _ in range(repeat):
+        run = case(edges, storage)
+        start = time.perf_counter()
+        ops = run()
+        best = min(best, time.perf_counter() - start)
+
+    result = {'ops': ops, 'seconds': best,
+              'ops_per_sec': ops / best if best > 0 else None, 'peak_bytes': None}
+    if memory:
+        run = case(edges, storage)
+        tracemalloc.start()
+        try:
+            run()
+            result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def scaling_exponent(points) -> float:
+    """
+    Least squares slope of log(seconds) against log(n): about 1 for linear work,
+    2 for quadratic. Returns None with fewer than two usable sizes.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in points if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run_benchmarks(sizes, families, graphs, methods=None, storage='dict', repeat=3,
+                   memory=True, seed=261, log=None) -> dict:
+    """
+    This function runs every selected case and returns the report as a JSON-ready dict.
+    """
+    results = []
+    for family in families:
+        for n in sizes:
+            edges = GENERATORS[family](n, seed)
+            for graph in graphs:
+                for method, case in CASES[graph].items():
+                    if methods and method not in methods:
+                        continue
+                    row = {'family': family, 'graph': graph, 'method': method, 'n': n,
+                           'edges': len(edges)}
+                    row.update(measure(case, edges, storage, repeat, memory))
+                    results.append(row)
+                    if log is not None:
+                        log(f"{family:>13} {graph:>10} {method:>26} n={n:<8} "
+                            f"{row['seconds']:.6f}s")
+
+    scaling = []
+    keys = sorted({(r['family'], r['graph'], r['method']) for r in results})
+    for family, graph, method in keys:
+        points = [(r['n'], r['seconds']) for r in results
+                  if (r['family'], r['graph'], r['method']) == (family, graph, method)]
+        scaling.append({'family': family, 'graph': graph, 'method': method,
+                        'exponent': scaling_exponent(points)})
+
+    meta = {'python': platform.python_version(), 'platform': platform.platform(),
+            'seed': seed, 'sizes': list(sizes), 'storage': storage, 'repeat': repeat}
+    return {'meta': meta, 'results': results, 'scaling': scaling}
+
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> []:
+    """
+    This function returns the cases that got more than TOLERANCE times slower than in
+    BASELINE, as (family, graph, method, n, old seconds, new seconds) tuples.
+    """
+    old = {(r['family'], r['graph'], r['method'], r['n']): r['seconds'] for r in baseline['results']}
+    slower = []
+    for r in report['results']:
+        key = (r['family'], r['graph'], r['method'], r['n'])
+        if key in old and r['seconds'] > old[key] * tolerance:
+            slower.append(key + (old[key], r['seconds']))
+    return slower
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark DirectedGraph and UndirectedGraph')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--families', nargs='+', choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument('--graphs', nargs='+', choices=sorted(CASES), default=sorted(CASES))
+    parser.add_argument('--methods', nargs='+', help='only run these methods')
+    parser.add_argument('--storage', default='dict', help="DirectedGraph backend, see set_storage()")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=261)
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc run')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--compare', help='baseline JSON report to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=1.5,
+                        help='slowdown factor that counts as a regression')
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.families, args.graphs, args.methods, args.storage,
+                            args.repeat, not args.no_memory, args.seed,
+                            log=lambda line: print(line, file=sys.stderr))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            slower = regressions(report, json.load(f), args.tolerance)
+        for family, graph, method, n, before, after in slower:
+            print(f'REGRESSION {family} {graph} {method} n={n}: {before:.6f}s -> {after:.6f}s',
+                  file=sys.stderr)
+        if slower:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,7 +4,25 @@
 # Description: Assignment 6
 
 import heapq 
-from collections import deque
+from array import array
+from numbers import Integral
+
+from all_pairs import floyd_warshall, parallel_dijkstra
+from edge_stream import parse_weighted, read_edge_batches
+from graph_io import read_graph, write_graph
+from graph_stats import GraphStats
+from graph_storage import CSRStorage, DenseStorage, MatrixView, convert_storage, numpy
+from shared_csr import SharedCSR
+from graph_traversal import (VisitedBits, bfs_order, dfs_order, has_directed_cycle, iter_bfs, iter_dfs,
+                             strongly_connected_components)
+from parallel_bfs import level_bfs
+from path_cache import ShortestPathCache
+from path_batches import flatten_paths, storage_checks, validate_flat, validate_parallel
+from priority_queues import BucketQueue, IndexedMinHeap, LazyHeap
+from reachability import ReachabilityIndex
+from shortest_paths import (INFINITY, astar, bidirectional_dijkstra, bounded_dijkstra, build_path,
+                            dijkstra_with_queue)
+from topological_order import DynamicTopologicalOrder, kahn_order
 
 
 class DirectedGraph:
@@ -14,8 +32,29 @@ class DirectedGraph:
     - loops not allowed
     - only positive edge weights
     - vertex names are integers
+    - storage is a dense adjacency matrix by default, see set_storage()
     """
 
+    # storage backend; None until first use, then a DenseStorage over adj_matrix
+    _storage = None
+    # bumped on every change to the vertices or edges
+    _version = 0
+    # ShortestPathCache when enabled with enable_path_cache()
+    _path_cache = None
+    # DynamicTopologicalOrder when enabled with enable_topological_order()
+    _topo = None
+    # (version, component ids, condensation graph) from the last condensation() call
+    _condensed = None
+    # ReachabilityIndex from the last reachable() call
+    _reach = None
+    # GraphStats when enabled with enable_stats()
+    _stats = None
+    # methods whose wall time is recorded while stats are enabled
+    _timed_methods = ('add_vertex', 'add_vertices', 'add_edge', 'try_add_edge', 'add_edges',
+                      'remove_edge', 'remove_edges', 'get_edges', 'is_valid_path', 'validate_paths',
+                      'dfs', 'bfs', 'has_cycle', 'topological_sort', 'reachable', 'dijkstra', 'multi_source_dijkstra',
+                      'k_nearest', 'shortest_path', 'all_pairs_shortest_paths')
+
     def __init__(self, start_edges=None):
         """
         Store graph info as adjacency matrix
@@ -54,6 +93,60 @@ class DirectedGraph:
 
     # ------------------------------------------------------------------ #
 
+    def _store(self):
+        """
+        Returns the storage backend, wrapping adj_matrix the first time it is needed.
+        """
+        if self._storage is None:
+            self._storage = DenseStorage(self.adj_matrix)
+        return self._storage
+
+    def _writable(self):
+        """
+        Returns a storage backend that accepts writes. Frozen CSR storage is
+        converted back to adjacency dicts before the first change.
+        """
+        if self._store().kind == 'csr':
+            self.set_storage('dict')
+        return self._storage
+
+    def get_storage(self) -> str:
+        """
+        This method returns the name of the storage backend: 'dense', 'dict', 'csr' or 'numpy'.
+        """
+        return self._store().kind
+
+    def set_storage(self, kind: str, dtype=None) -> None:
+        """
+        This method converts the graph to another storage backend.
+
+        'dense' is the original adjacency matrix.
+        'dict' keeps one {dst: weight} dict per vertex and is O(V + E) in memory.
+        'csr' packs the edges into frozen arrays; the graph switches back to 'dict'
+        automatically the next time it is modified.
+        'numpy' keeps the matrix in a numpy array and enables the vectorized bulk methods.
+        Without a DTYPE it is 'int32', or whatever the current weights need ('int64' for
+        big integers, 'float64' for fractions). A weight added later that the dtype cannot
+        hold exactly widens the array the same way, so no weight is ever truncated.
+
+        In all modes but 'dense', adj_matrix becomes a read-only view that builds rows on demand.
+        """
+        store = self._store()
+        if kind == store.kind and (dtype is None or kind != 'numpy' or store.dtype == dtype):
+            return
+
+        self._use_storage(convert_storage(store, kind, dtype))
+
+    def _use_storage(self, storage) -> None:
+        self._storage = storage
+        if storage.kind == 'dense':
+            self.adj_matrix = storage.rows
+        else:
+            self.adj_matrix = MatrixView(storage)
+
+    def _valid_vertex(self, v) -> bool:
+        return isinstance(v, Integral) and 0 <= v < self.v_count
+
     def add_vertex(self) -> int:
         """
         This method adds a new vertex to the graph. Vertex does not need to be provided,
@@ -64,15 +157,125 @@ class DirectedGraph:
         
         This method returns a single integer - the number of vertices after the addition.
         """
-        for i in range(self.v_count):
-            self.adj_matrix[i].append(0)
-        
-        new_list = [0] * (self.v_count + 1)
-        self.adj_matrix.append(new_list)
-        self.v_count += 1
+        self.v_count = self._writable().add_vertex()
+        self._vertices_added()
 
         return self.v_count
     
+    def add_vertices(self, count: int) -> int:
+        """
+        This method adds COUNT new vertices in one step and returns the number of vertices
+        after the addition. The new vertices get the next free indexes, same as add_vertex().
+
+        Dense storage grows each row once, sparse storage just appends empty rows, so this
+        is much cheaper than calling add_vertex() COUNT times.
+        """
+        if count > 0:
+            self.v_count = self._writable().add_vertices(count)
+            self._vertices_added()
+
+        return self.v_count
+
+    @classmethod
+    def from_edges(cls, edges, storage='dict', v_count=0) -> 'DirectedGraph':
+        """
+        This method builds a graph from (src, dst, weight) tuples, like the constructor does,
+        but sizes the storage once instead of adding vertices one at a time.
+
+        STORAGE picks the backend (see set_storage()), and defaults to sparse adjacency dicts.
+        V_COUNT reserves that many vertices up front. If EDGES is a list or tuple the vertex count
+        is taken from it; any other iterable is read once and the graph grows as edges arrive.
+        """
+        graph = cls()
+        #frozen CSR cannot take writes, so the edges go into dicts and are packed once at the end
+        graph.set_storage('dict' if storage == 'csr' else storage)
+
+        if isinstance(edges, (list, tuple)):
+            for u, v, _ in edges:
+                v_count = max(v_count, u + 1, v + 1)
+        graph.add_vertices(v_count)
+
+        for u, v, weight in edges:
+            top = max(u, v)
+            if top >= graph.v_count:
+                graph.add_vertices(top + 1 - graph.v_count)
+            graph.add_edge(u, v, weight)
+
+        graph.set_storage(storage)
+        return graph
+
+    @classmethod
+    def from_edge_file(cls, source, storage='dict', batch_size=65536, delimiter=None,
+                       skip_header=False, progress=None) -> 'DirectedGraph':
+        """
+        This method builds a graph from a CSV/TSV edge list with src, dst and an optional
+        weight column, without ever holding the whole list in memory.
+
+        Edges are read and parsed BATCH_SIZE at a time (see edge_stream.read_edge_batches()
+        for SOURCE, DELIMITER, SKIP_HEADER and PROGRESS); the graph grows once per batch to
+        fit the largest vertex seen and the batch goes in through add_edges(). A repeated
+        edge keeps the weight it was given last, same as add_edge(). With STORAGE 'csr' the
+        graph is built in dicts and packed once after the last batch.
+        """
+        graph = cls()
+        graph.set_storage('dict' if storage == 'csr' else storage)
+
+        for batch in read_edge_batches(source, parse_weighted, batch_size, delimiter, skip_header, progress):
+            top = max(max(u, v) for u, v, _ in batch)
+            if top >= graph.v_count:
+                graph.add_vertices(top + 1 - graph.v_count)
+            graph.add_edges(batch)
+
+        graph.set_storage(storage)
+        return graph
+
+    def fork(self) -> 'DirectedGraph':
+        """
+        This method returns an independent copy of the graph with 'dict' storage.
+
+        With 'dict' storage the copy is copy-on-write and costs O(V): both graphs share
+        their adjacency rows until one of them changes a row, which copies just that row
+        (see AdjacencyDictStorage.fork()). Other storage is converted to 'dict' in full.
+        """
+        store = self._store()
+        if store.kind != 'dict':
+            storage = convert_storage(store, 'dict')
+        else:
+            storage = store.fork()
+
+        copy = type(self)()
+        copy._use_storage(storage)
+        copy.v_count = self.v_count
+        copy._version = self._version
+        return copy
+
+    def save(self, path) -> None:
+        """
+        This method writes the graph to PATH in the binary CSR format of graph_io.
+        """
+        store = self._store()
+        if store.kind != 'csr':
+            store = CSRStorage.from_storage(store)
+        write_graph(path, 'directed', store.offsets, store.targets, store.weights)
+
+    @classmethod
+    def load(cls, path, mmap=True) -> 'DirectedGraph':
+        """
+        This method reads a graph written by save().
+
+        With MMAP the file is memory mapped and the graph gets CSR storage over it directly,
+        so nothing is parsed or copied and the OS pages edges in as they are used. The mapping
+        is read-only; the first change copies the graph into 'dict' storage like any CSR graph.
+        """
+        data = read_graph(path, mmap)
+        if data.kind != 'directed':
+            raise ValueError(f'{path} holds an undirected graph')
+
+        graph = cls()
+        graph._use_storage(CSRStorage(data.offsets, data.targets, data.weights))
+        graph.v_count = data.v_count
+        return graph
+
     def add_edge(self, src: int, dst: int, weight=1) -> None:
         """
         This method adds a new edge to the graph, connecting the two vertices with provided indices.
@@ -87,16 +290,92 @@ class DirectedGraph:
         if src == dst:
             return 
 
-        if src >= self.v_count:
+        if not self._valid_vertex(src):
             return 
 
-        if dst >= self.v_count:
+        if not self._valid_vertex(dst):
             return 
 
         if weight < 0:
             return
     
-        self.adj_matrix[src][dst] = weight
+        old_weight = self._store().weight(src, dst)
+        if weight == old_weight:
+            if self._stats is not None and weight != 0:
+                self._stats.count('duplicate_edges')
+            return
+
+        self._writable().set_weight(src, dst, weight)
+        self._edge_changed(src, dst, old_weight, weight)
+
+    def add_edges(self, edges) -> None:
+        """
+        This method adds many edges at once. EDGES is a sequence of (src, dst, weight) rows,
+        such as a list of tuples or a K x 3 numpy array.
+
+        Rows that add_edge() would ignore (unknown vertices, src == dst, negative weight) are
+        skipped, and an existing edge gets the new weight, same as add_edge().
+        With numpy storage the whole batch is checked and written with array operations;
+        there a vertex id may also be a whole float such as 2.0, since an array with
+        fractional weights stores every column as floats. 2.5 is still skipped.
+        """
+        store = self._writable()
+        if store.kind != 'numpy':
+            for src, dst, weight in edges:
+                self.add_edge(src, dst, weight)
+            return
+
+        batch = numpy.asarray(edges)
+        if batch.size == 0:
+            return
+        if batch.dtype.kind not in 'biuf':
+            #mixed rows (None, strings, ...) cannot be checked as arrays
+            for src, dst, weight in edges:
+                self.add_edge(src, dst, weight)
+            return
+        keep, srcs, dsts = self._valid_pairs(batch)
+        weights = batch[:, 2]
+        keep &= weights >= 0
+        store.set_weights(srcs[keep], dsts[keep], weights[keep])
+        self._edges_changed()
+
+    def remove_edges(self, pairs) -> None:
+        """
+        This method removes many edges at once. PAIRS is a sequence of (src, dst) rows,
+        such as a list of tuples or a K x 2 numpy array. Pairs that are not edges are ignored.
+        """
+        store = self._writable()
+        if store.kind != 'numpy':
+            for src, dst in pairs:
+                self.remove_edge(src, dst)
+            return
+
+        batch = numpy.asarray(pairs)
+        if batch.size == 0:
+            return
+        if batch.dtype.kind not in 'biuf':
+            for src, dst in pairs:
+                self.remove_edge(src, dst)
+            return
+        keep, srcs, dsts = self._valid_pairs(batch)
+        store.set_weights(srcs[keep], dsts[keep], 0)
+        self._edges_changed()
+
+    def _valid_pairs(self, batch) -> tuple:
+        """
+        Vectorized add_edge() checks on the first two columns of BATCH: both ends are whole
+        numbers (like _valid_vertex(), so 0.6 is not vertex 0), in the graph, and not a loop.
+        Returns (keep mask, srcs, dsts) with the ends as int64.
+        """
+        ends = batch[:, :2]
+        n = self.v_count
+        inside = ((ends >= 0) & (ends < n)).all(axis=1)
+        if ends.dtype.kind == 'f':
+            inside &= (ends == numpy.floor(ends)).all(axis=1)
+        #rows that failed are read as vertex 0, so the cast never sees NaN or infinity
+        ends = numpy.where(inside[:, None], ends, 0).astype(numpy.int64)
+        srcs, dsts = ends[:, 0], ends[:, 1]
+        return inside & (srcs != dsts), srcs, dsts
 
     def remove_edge(self, src: int, dst: int) -> None:
         """
@@ -106,16 +385,132 @@ class DirectedGraph:
         OR there is no edge between them, the method does nothing (no exception needs to be raised.)
         """
 
-        if (src < 0) or (dst < 0):
+        if not (self._valid_vertex(src) and self._valid_vertex(dst)):
             return 
 
-        if (src >= len(self.get_vertices())) or (dst >= len(self.get_vertices())):
+        old_weight = self._store().weight(src, dst)
+        if old_weight == 0:
+            return 
+
+        self._writable().set_weight(src, dst, 0)
+        self._edge_changed(src, dst, old_weight, 0)
+
+    def try_add_edge(self, src: int, dst: int, weight=1) -> bool:
+        """
+        This method adds the edge SRC -> DST like add_edge(), unless it would close a cycle,
+        and returns True if the edge is in the graph afterwards. If the edge would close a
+        cycle, or add_edge() would ignore it, the graph is left unchanged and it returns False.
+
+        With enable_topological_order() the check is the same bounded search add_edge()
+        already does to repair the order, so adding through this method costs no extra
+        search and never rebuilds the order. Otherwise it is one DFS from DST.
+        """
+        if src == dst or not (self._valid_vertex(src) and self._valid_vertex(dst)) or weight <= 0:
+            return False
+
+        #an edge that is already there cannot close a new cycle, only change weight
+        if self._store().weight(src, dst) == 0:
+            topo = self._current_topo() if self._topo is not None else None
+            if topo is not None and topo.is_valid():
+                if not topo.try_add_edge(src, dst):
+                    return False
+            elif self.would_create_cycle(src, dst):
+                return False
+
+        self.add_edge(src, dst, weight)
+        return True
+
+    def _vertices_added(self) -> None:
+        """
+        Bookkeeping after new (isolated) vertices were added.
+        """
+        self._version += 1
+        if self._path_cache is not None:
+            self._path_cache.grow(self.v_count, self._version)
+        if self._topo is not None:
+            self._topo.add_vertices(self.v_count)
+
+    def _edge_changed(self, src: int, dst: int, old_weight, new_weight) -> None:
+        """
+        Bookkeeping after the weight of SRC -> DST changed (0 meaning no edge).
+        Cached shortest paths are repaired when the edge got cheaper and dropped otherwise.
+        """
+        self._version += 1
+        if self._topo is not None:
+            if old_weight == 0:
+                self._topo.add_edge(src, dst)
+            elif new_weight == 0:
+                self._topo.remove_edge()
+
+        cache = self._path_cache
+        if cache is None:
             return
+        if new_weight != 0 and (old_weight == 0 or new_weight < old_weight):
+            cache.repair_decrease(src, dst, new_weight, self._store().neighbors, self._version)
+        else:
+            cache.clear(self._version)
 
-        if self.adj_matrix[src][dst] == 0:
-            return 
+    def _edges_changed(self) -> None:
+        """
+        Bookkeeping after a bulk edit that may have changed any number of edges.
+        """
+        self._version += 1
+        if self._path_cache is not None:
+            self._path_cache.clear(self._version)
+        if self._topo is not None:
+            self._topo.stale = True
+
+    def enable_path_cache(self, max_entries=128, max_bytes=None) -> None:
+        """
+        This method turns on memoization of dijkstra() results.
+
+        Up to MAX_ENTRIES sources are remembered (least recently used are dropped first), and if
+        MAX_BYTES is given results are also dropped until their estimated size fits in it.
+        Cached results stay valid across add_vertex() and across add_edge() calls that add an edge
+        or lower its weight; any other change empties the cache.
+        """
+        self._path_cache = ShortestPathCache(max_entries, max_bytes)
+        self._path_cache.version = self._version
+
+    def disable_path_cache(self) -> None:
+        """
+        This method turns off dijkstra() memoization and frees the cached results.
+        """
+        self._path_cache = None
+
+    def enable_stats(self, callback=None) -> GraphStats:
+        """
+        This method turns on instrumentation and returns the GraphStats that collects it:
+        counters for vertices visited, neighbor scans, edges relaxed, heap pushes, heap pops,
+        stale pops and duplicate edges, plus a wall-time histogram per public method.
+
+        CALLBACK, if given, is called after every timed method call with a dict of the method
+        name, its wall time and the counters it changed. Until this is called the graph pays
+        nothing for instrumentation beyond one attribute check per method.
+        """
+        if self._stats is None:
+            self._stats = GraphStats(callback)
+            self._stats.attach(self, self._timed_methods)
+        elif callback is not None:
+            self._stats.callback = callback
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """
+        This method turns instrumentation off and drops what was recorded.
+        """
+        if self._stats is not None:
+            self._stats.detach(self, self._timed_methods)
+            self._stats = None
 
-        self.adj_matrix[src][dst] = 0
+    def get_stats(self) -> dict:
+        """
+        This method returns a snapshot of the recorded counters and timings (see
+        GraphStats.snapshot()), or None when stats are not enabled.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
 
     def get_vertices(self) -> []:
         """
@@ -135,16 +530,7 @@ class DirectedGraph:
         Third element in the tuple is the weight of the edge.
         Order of the edges does not matter.
         """
-        edge_list = []
-
-        for r in range(self.v_count):
-            for c in range(self.v_count):
-                weight = self.adj_matrix[r][c]
-                if self.adj_matrix[r][c] != 0:
-                    tupe = (r, c, weight)
-                    edge_list.append(tupe)
-
-        return edge_list
+        return list(self._store().edges())
 
     def is_valid_path(self, path: []) -> bool:
         """
@@ -160,28 +546,71 @@ class DirectedGraph:
         if len(path) == 1:
             return True
 
+        store = self._store()
+        if store.kind == 'numpy':
+            #every step of the path is checked with one fancy-indexed lookup
+            steps = numpy.asarray(path)
+            if steps.dtype.kind not in 'iu' or steps.min() < 0 or steps.max() >= self.v_count:
+                return False
+            return bool(store.has_edges(steps[:-1], steps[1:]).all())
+
         cur = path[0]
+        if not self._valid_vertex(cur):
+            return False
         for v in path[1:]:
-            if v < 0:
+            if not self._valid_vertex(v):
                 return False
-            if self.adj_matrix[cur][v] != 0:
+            if store.weight(cur, v) != 0:
                 cur = v
             else:
                 return False
         return True
         
-    def _dfs_helper(self, u, discovered,result, v_end=None) -> []:
+    def validate_paths(self, paths, offsets=None, workers=1) -> bytearray:
+        """
+        This method runs is_valid_path() on a whole batch of paths and returns a bytearray with
+        one entry per path: 1 if the path is valid, 0 if not.
+
+        PATHS is either a list of paths, or (when OFFSETS is given) one flat sequence of
+        vertices where path i is paths[offsets[i]:offsets[i + 1]]; a numpy array works for both.
+        With numpy storage the whole batch is checked with array operations. Otherwise,
+        WORKERS > 1 splits the batch into chunks checked by that many processes, which read
+        the graph from shared memory.
+        """
+        flat, offsets = flatten_paths(paths, offsets)
+        store = self._store()
+        if store.kind == 'numpy':
+            return self._validate_paths_numpy(flat, offsets)
 
-        result.append(u)
-        discovered[u] = True
-     
-        for i in range(len(self.adj_matrix[u])):
-            if (self.adj_matrix[u][i] != 0 and (not discovered[i])): 
-                self._dfs_helper(i, discovered, result) 
-       
-        return result
+        if workers > 1:
+            with SharedCSR(store) as shared:
+                return validate_parallel(flat, offsets, workers, 'csr', shared.handle())
 
+        return validate_flat(flat, offsets, *storage_checks(store))
 
+    def _validate_paths_numpy(self, flat, offsets) -> bytearray:
+        """
+        Checks every step of every path with one fancy-indexed lookup, then counts failed
+        steps per path with a running sum.
+        """
+        steps = numpy.asarray(flat)
+        if steps.size and steps.dtype.kind not in 'iu':
+            #non-integer vertices are never valid; let the per-step checks reject them
+            return validate_flat(flat, offsets, *storage_checks(self._store()))
+        flat = steps.astype(numpy.int64)
+        offsets = numpy.asarray(offsets, dtype=numpy.int64)
+        inside = (flat >= 0) & (flat < self.v_count)
+        safe = numpy.where(inside, flat, 0)
+
+        #step j goes from flat[j] to flat[j + 1]; steps that cross into the next path are ignored
+        step_ok = inside[:-1] & inside[1:] & self._store().has_edges(safe[:-1], safe[1:])
+        failed = numpy.concatenate(([0], numpy.cumsum(~step_ok)))
+
+        lo, hi = offsets[:-1], offsets[1:]
+        result = numpy.ones(len(lo), dtype=bool)
+        longer = hi - lo >= 2
+        result[longer] = failed[hi[longer] - 1] == failed[lo[longer]]
+        return bytearray(result.astype(numpy.uint8).tobytes())
 
     def dfs(self, v_start, v_end=None) -> []:
         """
@@ -202,68 +631,245 @@ class DirectedGraph:
         Inspiration from G4G:
         https://www.geeksforgeeks.org/implementation-of-dfs-using-adjacency-matrix/
         """
-        discovered = [False] * self.v_count
-        result = []
-
-        if v_start not in self.get_vertices():
+        if not self._valid_vertex(v_start):
             return []
 
-        return self._dfs_helper(v_start, discovered, result)
+        if not self._valid_vertex(v_end):
+            v_end = None
+
+        return dfs_order(v_start, *self._search_inputs(), v_end)
+
+    def iter_dfs(self, v_start, v_end=None, predicate=None, max_depth=None):
+        """
+        This method is a generator version of dfs(). It yields (vertex, depth) tuples in the
+        same order dfs() lists the vertices, where depth is the depth in the search tree.
+        Vertices are produced lazily, so a caller can stop as soon as it has what it needs.
+
+        V_END stops the search once that vertex is reached, same as dfs().
+        PREDICATE(v), if given, is called on each newly reached vertex; vertices for which it
+        returns False are skipped and not explored further.
+        MAX_DEPTH, if given, keeps the search from going further than that many edges from V_START.
+
+        Nothing is yielded if the starting vertex is not in the graph.
+        """
+        if not self._valid_vertex(v_start):
+            return
+
+        if not self._valid_vertex(v_end):
+            v_end = None
+
+        yield from iter_dfs(v_start, *self._search_inputs(), v_end, predicate, max_depth)
 
     def bfs(self, v_start, v_end=None) -> []:
         """
         This method works the same as DFS above, except it implements a breadth-first search.
         """
-        to_visit = deque()
-        to_visit.append(v_start)
+        if not self._valid_vertex(v_start):
+            return []
 
-        visited = []
+        if not self._valid_vertex(v_end):
+            v_end = None
+
+        return bfs_order(v_start, *self._search_inputs(), v_end)
+
+    def iter_bfs(self, v_start, v_end=None, predicate=None, max_depth=None):
+        """
+        This method is a generator version of bfs(). It yields (vertex, depth) tuples in the
+        same order bfs() lists the vertices, where depth is the number of edges from V_START.
+        V_END, PREDICATE and MAX_DEPTH work the same way as in iter_dfs().
 
-        while len(to_visit) > 0:
-            v = to_visit.popleft()
-            visited.append(v)
-            for i in range(len(self.adj_matrix[v])):
-                if self.adj_matrix[v][i] != 0:
-                    if i not in visited and i not in to_visit:
-                        to_visit.append(i)
+        Nothing is yielded if the starting vertex is not in the graph.
+        """
+        if not self._valid_vertex(v_start):
+            return
 
-        return visited
+        if not self._valid_vertex(v_end):
+            v_end = None
 
-    def _has_cycle_helper(self, v, visited, stack):
+        yield from iter_bfs(v_start, *self._search_inputs(), v_end, predicate, max_depth)
 
-        visited[v] = True
-        stack[v] = True
+    def parallel_bfs(self, v_start, workers=None, direction_optimizing=True, deterministic=False) -> tuple:
+        """
+        This method runs a level-synchronous breadth-first search from V_START and returns
+        (levels, parents, order) arrays: levels[v] is the distance in edges from V_START
+        (-1 if unreachable), parents[v] the vertex v was reached from (-1 if none), and
+        order the reached vertices level by level.
+
+        Each level is expanded in chunks on a pool of WORKERS processes (defaults to the
+        number of CPUs) that share the graph as CSR arrays; small graphs and small levels
+        stay in this process. With DIRECTION_OPTIMIZING, levels with a large frontier are
+        expanded bottom-up from the unreached vertices instead. DETERMINISTIC keeps every
+        level top-down, so order is the same list bfs() returns.
+        See parallel_bfs.level_bfs() for the details.
+        """
+        if not self._valid_vertex(v_start):
+            return array('q', [-1]) * self.v_count, array('q', [-1]) * self.v_count, array('q')
 
-        for sibling in range(len(self.get_vertices())): 
-            if self.adj_matrix[v][sibling] != 0:
-                if visited[sibling] == False: 
-                    if self._has_cycle_helper(sibling, visited, stack) == True: 
-                        return True
-                elif stack[sibling] == True: 
-                    return True
+        store = self._store()
+        csr = store if store.kind == 'csr' else CSRStorage.from_storage(store)
+        reverse = None
+        if direction_optimizing and not deterministic:
+            if csr.reverse is None:
+                csr.reverse = csr.transpose()
+            reverse = csr.reverse
 
-        stack[v] = False
-        return False
+        return level_bfs(csr, v_start, reverse, workers, direction_optimizing, deterministic)
 
     def has_cycle(self) -> bool:
         """
         This method returns True if there is at least once cycle in the graph.
         If the graph is acyclic, the method returns False.
 
-        This method and the helper were inspired by G4G:
+        The back-edge check was inspired by G4G:
         https://www.geeksforgeeks.org/detect-cycle-in-a-graph/
+
+        With enable_topological_order() the answer is kept up to date as edges are added,
+        so this is O(1) except for the first call after removing an edge from a cyclic graph.
+        """
+        if self._topo is not None:
+            return self._current_topo().cyclic
+
+        successors = self._store().successors
+        if self._stats is not None:
+            successors = self._stats.scanning(successors)
+        return has_directed_cycle(self.v_count, successors)
+
+    def _search_inputs(self) -> tuple:
         """
-        visited = [False] * self.v_count 
-        stack = [False] * self.v_count 
-        for node in range(len(self.get_vertices())): 
-            if visited[node] == False: 
-                if self._has_cycle_helper(node,visited,stack) == True: 
-                    return True
+        Returns (successors, visited set) for a traversal. With stats enabled both are
+        wrapped so neighbor scans and visited vertices get counted.
+        """
+        successors, visited = self._store().successors, VisitedBits(self.v_count)
+        if self._stats is not None:
+            return self._stats.scanning(successors), self._stats.visiting(visited)
+        return successors, visited
+
+    def strongly_connected_components(self) -> array:
+        """
+        This method returns an array with one component id per vertex: two vertices share
+        an id exactly when each can reach the other. Ids run from 0 to the number of
+        components - 1, in topological order of the components (an edge between two
+        components always goes from the lower id to the higher one).
+        """
+        return self.condensation()[0]
+
+    def condensation(self) -> tuple:
+        """
+        This method returns (component ids, condensation graph). The condensation graph has
+        one vertex per strongly connected component and an edge between two components when
+        any edge joins them, weighted by the lightest such edge. It is always acyclic.
+
+        The result is computed with an iterative Tarjan search in O(V + E) and kept until the
+        graph changes, so repeated calls are free. Treat both results as read-only.
+        """
+        if self._condensed is not None and self._condensed[0] == self._version:
+            return self._condensed[1:]
+
+        store = self._store()
+        count, component = strongly_connected_components(self.v_count, store.successors)
+
+        lightest = {}
+        for src, dst, weight in store.edges():
+            a, b = component[src], component[dst]
+            if a != b and weight < lightest.get((a, b), INFINITY):
+                lightest[(a, b)] = weight
+
+        dag = DirectedGraph.from_edges([], 'dict', count)
+        for (a, b), weight in sorted(lightest.items()):
+            dag.add_edge(a, b, weight)
+        dag.set_storage('csr')
+
+        self._condensed = (self._version, component, dag)
+        return component, dag
+
+    def reachable(self, u: int, v: int) -> bool:
+        """
+        This method returns True if there is a path from vertex U to vertex V (every vertex
+        reaches itself). If either vertex is not in the graph, the method returns False.
+
+        The first call builds a reachability index on top of condensation(); later calls
+        answer from it without searching the graph. The index is rebuilt lazily, on the first
+        query after the graph changes.
+        """
+        if not (self._valid_vertex(u) and self._valid_vertex(v)):
+            return False
+
+        return self._reachability().reachable(u, v)
+
+    def reachable_many(self, pairs) -> []:
+        """
+        This method answers reachable(u, v) for every (u, v) in PAIRS and returns a list of bools.
+        """
+        index = self._reachability()
+        valid = self._valid_vertex
+        return [valid(u) and valid(v) and index.reachable(u, v) for u, v in pairs]
+
+    def _reachability(self) -> ReachabilityIndex:
+        if self._reach is None or self._reach.version != self._version:
+            component, dag = self.condensation()
+            self._reach = ReachabilityIndex(component, dag, self._version)
+        return self._reach
+
+    def _successors(self, u: int):
+        return self._store().successors(u)
+
+    def _predecessors(self, v: int) -> []:
+        return [u for u, _ in self._store().in_neighbors(v)]
 
-        return False
+    def _current_topo(self) -> DynamicTopologicalOrder:
+        """
+        Returns the online topological order, rebuilding it first if bulk edits or an edge
+        removal from a cyclic graph left it out of date.
+        """
+        if self._topo.stale:
+            self._topo.rebuild(self.v_count)
+        return self._topo
+
+    def enable_topological_order(self) -> None:
+        """
+        This method turns on online cycle detection. A topological order of the vertices is
+        built once and then repaired with the Pearce-Kelly algorithm on each add_edge(),
+        touching only the vertices between the two ends of a backward edge.
+        has_cycle(), topological_sort() and would_create_cycle() then use that order.
+        """
+        self._topo = DynamicTopologicalOrder(self.v_count, self._successors, self._predecessors)
+
+    def disable_topological_order(self) -> None:
+        self._topo = None
+
+    def topological_sort(self) -> []:
+        """
+        This method returns a list of all vertices such that every edge goes from an earlier
+        vertex to a later one. If the graph has a cycle no such order exists and the method
+        returns None.
+        """
+        if self._topo is None:
+            return kahn_order(self.v_count, self._store().successors)
+
+        topo = self._current_topo()
+        if topo.cyclic:
+            return None
+        return list(topo.order)
+
+    def would_create_cycle(self, src: int, dst: int) -> bool:
+        """
+        This method returns True if adding the edge SRC -> DST would close a cycle, that is,
+        if SRC can already be reached from DST. The graph is not changed.
+
+        If either vertex is not in the graph the method returns False.
+        With enable_topological_order() only vertices placed between DST and SRC in the
+        order are searched; otherwise this is a DFS from DST.
+        """
+        if not (self._valid_vertex(src) and self._valid_vertex(dst)):
+            return False
+
+        if self._topo is not None:
+            return self._current_topo().can_reach(dst, src)
+
+        return any(v == src for v, _ in self.iter_dfs(dst, src))
         
 
-    def dijkstra(self, src: int) -> []:
+    def dijkstra(self, src: int, queue='heap') -> []:
         """
         This method implements the Dijkstra algorithm to compute the length of the shortest
         path from a given vertex to all other vertices in the graph. 
@@ -274,10 +880,53 @@ class DirectedGraph:
 
         If a certain vertex is not reachable from SRC, 
         return value should be INFINITY (in Python, use float('int)).
+
+        QUEUE picks the priority queue:
+        'heap'    - heapq with duplicate entries that are skipped when stale (the default)
+        'indexed' - IndexedMinHeap with real decrease-key, so the queue never holds more than V items
+        'buckets' - Dial's algorithm, for small positive integer weights; one bucket per possible weight
+        """
+        if not self._valid_vertex(src):
+            return [float('inf')] * self.v_count
+
+        distances, _ = self._shortest_path_tree(src, queue)
+        if self._path_cache is not None:
+            #hand out a copy so the caller cannot change the cached result
+            return list(distances)
+
+        return distances
+
+    def _shortest_path_tree(self, src: int, queue='heap') -> tuple:
+        """
+        Returns (distances, previous) from SRC, where previous[v] is the vertex before v on a
+        shortest path (-1 if there is none). Uses and fills the path cache when it is enabled.
         """
-        distances = {} #creating a hashmap and populating with infinity as distance to each vertex from src
-        for i in range(len(self.adj_matrix)):
-            distances[i] = float('inf')
+        cache = self._path_cache
+        if cache is not None:
+            entry = cache.get(src, self._version)
+            if entry is not None:
+                return entry
+
+        store = self._store()
+        stats = self._stats
+        if queue == 'heap' and stats is None:
+            distances, previous = self._dijkstra_heap(src)
+        else:
+            #instrumented runs go through the generic loop with counting wrappers,
+            #so the plain heap loop below never pays for them
+            out_edges, pending = store.neighbors, self._make_queue(queue)
+            if stats is not None:
+                out_edges, pending = stats.scanning(out_edges), stats.queueing(pending)
+            distances, previous = dijkstra_with_queue(out_edges, self.v_count, src, pending)
+
+        if cache is not None:
+            cache.put(src, self._version, distances, previous)
+        return distances, previous
+
+    def _dijkstra_heap(self, src: int) -> tuple:
+        store = self._store()
+        distances = [float('inf')] * self.v_count #one slot per vertex, infinity until reached
+        previous = array('q', [-1]) * self.v_count #vertex we came from on the best path so far
 
         distances[src] = 0 #distance from the source to itself is 0
         priority_queue = [(0, src)] #priority queue to evaluate distance
@@ -289,10 +938,9 @@ class DirectedGraph:
             if current_distance > distances[current_vertex]:
                 continue
             #if the current distance to the vertex is greater than the distance held in dictionary
-            for sibling in range(len(self.adj_matrix[current_vertex])): 
-                #check all next vertices from the current vertex
-                weight = self.adj_matrix[current_vertex][sibling]
-                #assigning the weight variable from the confluence of current vertex and it's sibling
+            for sibling, weight in store.neighbors(current_vertex): 
+                #check all next vertices from the current vertex, only real edges are stored
+                #so the work per vertex is its out-degree instead of a full matrix row
                 if weight > 0:
                     distance = current_distance + weight
                     #if weight is greater than 0, update distance to sum of current_distance 
@@ -300,11 +948,124 @@ class DirectedGraph:
                     if distance < distances[sibling]:
                         #if the new distance is less than the distance of the sibling held in the dictionary
                         distances[sibling] = distance
-                        #update lesser distance 
+                        previous[sibling] = current_vertex
+                        #update lesser distance and remember where it came from
                         heapq.heappush(priority_queue, (distance, sibling))
                         #add the tuple to the priority queue
                         
-        return list(distances.values())
+        return distances, previous
+
+    def multi_source_dijkstra(self, sources, max_distance=None) -> tuple:
+        """
+        This method computes, in a single Dijkstra run, the distance from every vertex to the
+        nearest of SOURCES. It returns (distances, nearest): distances is the same kind of list
+        dijkstra() returns, and nearest[v] is the source that reaches v first (-1 if none does).
+        When two sources are equally close, the one Dijkstra reaches v from first wins.
+
+        MAX_DISTANCE, if given, treats vertices further away than that as unreachable, and the
+        search never goes past them. Sources that are not in the graph are ignored.
+        """
+        distances = [INFINITY] * self.v_count
+        nearest = [-1] * self.v_count
+        starts = [s for s in sources if self._valid_vertex(s)]
+
+        _, reached, _, origin = bounded_dijkstra(self._store().neighbors, starts, max_distance)
+        for v, distance in reached.items():
+            distances[v] = distance
+            nearest[v] = origin[v]
+        return distances, nearest
+
+    def k_nearest(self, src: int, k: int, max_distance=None) -> []:
+        """
+        This method returns up to K (vertex, distance) pairs for the vertices closest to SRC,
+        nearest first, not counting SRC itself. Equally distant vertices come in ascending order.
+
+        The search stops as soon as K vertices are settled, and never goes further than
+        MAX_DISTANCE when that is given, so the cost depends on how much of the graph is
+        explored rather than on its size.
+        """
+        if not self._valid_vertex(src) or k <= 0:
+            return []
+
+        settled, distances, _, _ = bounded_dijkstra(self._store().neighbors, [src], max_distance, k + 1)
+        return [(v, distances[v]) for v in settled[1:]]
+
+    def all_pairs_shortest_paths(self, method='auto', workers=None):
+        """
+        This method returns the length of the shortest path between every pair of vertices
+        as a DistanceMatrix, where result[i][j] is the distance from i to j (INFINITY if
+        j is not reachable from i). Distances are stored as floats.
+
+        METHOD picks the algorithm:
+        'dijkstra' - Dijkstra from every vertex, spread over WORKERS processes
+                     (defaults to the number of CPUs) that read the graph from shared memory
+        'floyd'    - Floyd-Warshall, vectorized with numpy when it is installed
+        'auto'     - Floyd-Warshall for small dense graphs when numpy is available,
+                     Dijkstra otherwise
+        """
+        store = self._store()
+        if method == 'auto':
+            n = self.v_count
+            dense = store.edge_count() * 8 >= n * n
+            method = 'floyd' if numpy is not None and n <= 1024 and dense else 'dijkstra'
+
+        if method == 'floyd':
+            return floyd_warshall(store)
+        if method == 'dijkstra':
+            return parallel_dijkstra(store, workers)
+
+        raise ValueError(f'unknown method {method!r}')
+
+    def _make_queue(self, queue: str):
+        """
+        Returns an empty priority queue of the given kind for dijkstra().
+        """
+        if queue == 'heap':
+            return LazyHeap()
+
+        if queue == 'indexed':
+            return IndexedMinHeap(self.v_count)
+
+        if queue == 'buckets':
+            max_weight = 0
+            for _, _, weight in self._store().edges():
+                if not isinstance(weight, int):
+                    raise ValueError('bucket queue needs integer edge weights')
+                max_weight = max(max_weight, weight)
+            return BucketQueue(max_weight)
+
+        raise ValueError(f'unknown queue {queue!r}')
+
+    def shortest_path(self, src: int, dst: int, heuristic=None) -> tuple:
+        """
+        This method returns a tuple (distance, path) for the shortest path from SRC to DST,
+        where path is the list of vertices from SRC to DST, inclusive.
+
+        If either vertex is not in the graph, or DST is not reachable from SRC,
+        the method returns (INFINITY, []).
+
+        Without a heuristic the search runs Dijkstra from both ends at once and stops when
+        the two sides meet, so it only explores the part of the graph between SRC and DST.
+        HEURISTIC(v), if given, switches to A*: it must return a lower bound on the distance
+        from v to DST (for example straight-line distance between map coordinates).
+        """
+        if not (self._valid_vertex(src) and self._valid_vertex(dst)):
+            return INFINITY, []
+
+        if self._path_cache is not None:
+            #a cached tree from SRC answers the query without any search
+            entry = self._path_cache.get(src, self._version)
+            if entry is not None:
+                distances, previous = entry
+                if distances[dst] == INFINITY:
+                    return INFINITY, []
+                return distances[dst], build_path(previous, src, dst)
+
+        store = self._store()
+        if heuristic is not None:
+            return astar(store.neighbors, src, dst, heuristic)
+
+        return bidirectional_dijkstra(store.neighbors, store.in_neighbors, src, dst)
 
 
 
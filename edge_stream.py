@@ -0,0 +1,112 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Reads edge lists from CSV/TSV files in fixed-size batches
+
+import csv
+import os
+from itertools import islice
+
+
+def read_edge_batches(source, parse, batch_size=65536, delimiter=None, skip_header=False, progress=None):
+    """
+    This function reads an edge list and yields it as lists of at most BATCH_SIZE parsed edges,
+    so only one batch is ever held in memory.
+
+    SOURCE is a file path, an open file (binary or text), or any iterable of lines or of
+    already split rows such as tuples. Blank lines and lines starting with '#' are skipped,
+    and SKIP_HEADER drops the first line. DELIMITER defaults to whatever the first line uses:
+    a tab, a comma, or else any whitespace.
+
+    PARSE turns a list of split rows into edges (see parse_weighted() and parse_pairs()).
+    PROGRESS, if given, is called after every batch as progress(edges, position), where
+    position is the number of bytes (characters for text streams) read so far, or None
+    when SOURCE is not made of lines.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from read_edge_batches(f, parse, batch_size, delimiter, skip_header, progress)
+        return
+
+    lines = iter(source)
+    if skip_header:
+        next(lines, None)
+
+    edges = 0
+    position = 0
+    while True:
+        chunk = list(islice(lines, batch_size))
+        if not chunk:
+            return
+
+        if isinstance(chunk[0], (str, bytes)):
+            position += sum(map(len, chunk))
+            # decode the whole batch at once instead of line by line
+            if isinstance(chunk[0], bytes):
+                text = b'\n'.join(chunk).decode('utf-8').splitlines()
+            else:
+                text = [line.rstrip('\r\n') for line in chunk]
+            text = [line for line in text if line.strip() and not line.lstrip().startswith('#')]
+            if delimiter is None and text:
+                delimiter = _detect_delimiter(text[0])
+            rows = _split(text, delimiter)
+        else:
+            position = None
+            rows = chunk
+
+        batch = parse(rows)
+        edges += len(batch)
+        if progress is not None:
+            progress(edges, position)
+        if batch:
+            yield batch
+
+
+def _detect_delimiter(line: str):
+    for delimiter in ('\t', ','):
+        if delimiter in line:
+            return delimiter
+    return ' '
+
+
+def _split(lines, delimiter) -> []:
+    if delimiter == ' ':
+        return [line.split() for line in lines]
+    return list(csv.reader(lines, delimiter=delimiter, skipinitialspace=True))
+
+
+def _number(value):
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def parse_weighted(rows) -> []:
+    """
+    This function parses rows of a directed edge list into (src, dst, weight) tuples with
+    integer vertices. A missing weight column means weight 1; weights stay integers unless
+    they are written as fractions.
+    """
+    batch = []
+    for row in rows:
+        if len(row) < 2:
+            raise ValueError(f'edge row needs at least two columns: {row!r}')
+        weight = _number(row[2]) if len(row) > 2 else 1
+        batch.append((int(row[0]), int(row[1]), weight))
+    return batch
+
+
+def parse_pairs(rows) -> []:
+    """
+    This function parses rows of an undirected edge list into (u, v) name pairs. Any
+    columns after the first two are ignored.
+    """
+    batch = []
+    for row in rows:
+        if len(row) < 2:
+            raise ValueError(f'edge row needs at least two columns: {row!r}')
+        batch.append((row[0], row[1]))
+    return batch
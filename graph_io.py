@@ -0,0 +1,139 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Binary CSR file format for saving and loading graphs
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+# magic, format version, kind, weight typecode, byte order, reserved, vertex count, entry count
+HEADER = struct.Struct('<4sIBBHIQQ')
+MAGIC = b'CSRG'
+FORMAT_VERSION = 1
+KINDS = {'directed': 0, 'undirected': 1}
+BYTE_ORDERS = {'little': 1, 'big': 2}
+
+
+class GraphFile:
+    """
+    The arrays read from a graph file
+    - kind is 'directed' or 'undirected'
+    - offsets, targets and weights are the CSR arrays (weights is None for undirected graphs)
+    - names is the list of vertex names for undirected graphs, in id order
+    - with memory mapping the arrays are memoryviews straight into the mapped file,
+      which stays open for as long as any of them is alive
+    """
+
+    def __init__(self, kind, v_count, offsets, targets, weights=None, names=None):
+        self.kind = kind
+        self.v_count = v_count
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.names = names
+
+
+def write_graph(path, kind: str, offsets, targets, weights=None, names=None) -> None:
+    """
+    This function writes CSR arrays to PATH.
+
+    Layout: a 32 byte header, then offsets (V + 1 int64), targets (one int64 per entry),
+    weights (one int64 or float64 per entry, directed graphs only), and for undirected
+    graphs a string table: V + 1 int64 byte offsets followed by the UTF-8 encoded names.
+    Every section starts on an 8 byte boundary, so all of them can be mapped in place.
+
+    The file is written under a temporary name in the same directory and then renamed over
+    PATH, so PATH always holds either the old graph or the complete new one.
+    """
+    v_count = len(offsets) - 1
+    weight_code = b'\0'
+    if weights is not None:
+        weight_code = b'q' if all(isinstance(w, int) for w in weights) else b'd'
+
+    #write next to PATH and swap it in at the end: a graph loaded from PATH with memory
+    #mapping keeps reading the old file, which truncating it in place would pull out from under it
+    directory, base = os.path.split(os.path.abspath(path))
+    fd, temp = tempfile.mkstemp(prefix=f'.{base}.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, KINDS[kind], weight_code[0],
+                                BYTE_ORDERS[sys.byteorder], 0, v_count, len(targets)))
+            f.write(array('q', offsets).tobytes())
+            f.write(array('q', targets).tobytes())
+            if weights is not None:
+                f.write(array(weight_code.decode(), weights).tobytes())
+            if names is not None:
+                encoded = [str(name).encode('utf-8') for name in names]
+                name_offsets = array('q', [0])
+                for raw in encoded:
+                    name_offsets.append(name_offsets[-1] + len(raw))
+                f.write(name_offsets.tobytes())
+                f.write(b''.join(encoded))
+
+        #mkstemp creates the file private; give it the permissions open() would have
+        os.chmod(temp, 0o666 & ~_umask())
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def _umask() -> int:
+    """
+    Returns the process umask; reading it means setting it, so it is put straight back.
+    """
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def read_graph(path, use_mmap=True) -> GraphFile:
+    """
+    This function reads a file written by write_graph().
+
+    With USE_MMAP the file is memory mapped read-only and the arrays are views into it, so
+    loading takes about as long as reading the header, and processes that load the same
+    file share its pages. Without it the arrays are copied into memory.
+    """
+    with open(path, 'rb') as f:
+        if use_mmap:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            buffer = memoryview(f.read())
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f'{path} is not a graph file')
+    magic, version, kind, weight_code, byte_order, _, v_count, e_count = HEADER.unpack(buffer[:HEADER.size])
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a graph file')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'{path} uses graph file format {version}, expected {FORMAT_VERSION}')
+    if byte_order != BYTE_ORDERS[sys.byteorder]:
+        raise ValueError(f'{path} was written on a machine with a different byte order')
+
+    position = HEADER.size
+
+    def section(count: int, code: str):
+        nonlocal position
+        start = position
+        position += 8 * count
+        view = buffer[start:position].cast(code)
+        if use_mmap:
+            return view
+        return array(code, view)
+
+    offsets = section(v_count + 1, 'q')
+    targets = section(e_count, 'q')
+    kind = 'directed' if kind == KINDS['directed'] else 'undirected'
+    if kind == 'directed':
+        weights = section(e_count, chr(weight_code))
+        return GraphFile(kind, v_count, offsets, targets, weights)
+
+    name_offsets = section(v_count + 1, 'q')
+    blob = buffer[position:]
+    names = [str(blob[name_offsets[i]:name_offsets[i + 1]], 'utf-8') for i in range(v_count)]
+    return GraphFile(kind, v_count, offsets, targets, names=names)
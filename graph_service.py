@@ -0,0 +1,120 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: asyncio front end that serves graph queries from immutable snapshots
+
+import asyncio
+from functools import partial
+
+# methods that change a graph; everything else public is a query
+WRITE_METHODS = {
+    'add_vertex', 'add_vertices', 'add_edge', 'add_edges', 'try_add_edge',
+    'remove_edge', 'remove_edges', 'remove_vertex',
+}
+# state-changing methods that are neither allowed as queries nor batched as writes
+BLOCKED_PREFIXES = ('_', 'enable_', 'disable_', 'set_', 'iter_')
+
+
+class GraphService:
+    """
+    asyncio facade over a DirectedGraph or UndirectedGraph
+    - queries run in an executor against the current snapshot, a graph that is never
+      changed once published, so they do not block the event loop, each other, or writers
+    - writes are queued and applied in batches to a copy-on-write fork of the current
+      snapshot (see fork() on the graph classes), which becomes the next snapshot version
+    - identical queries against the same version share one executor call
+    - the service takes a private copy of the graph it is given, so later changes to
+      that graph are not seen; use write() instead
+    """
+
+    def __init__(self, graph, executor=None):
+        self.snapshot = graph.fork()
+        self.version = 0
+        self.executor = executor
+        self._pending = []
+        self._writer = None
+        self._inflight = {}
+
+    async def query(self, method: str, *args, **kwargs):
+        """
+        This method runs SNAPSHOT.METHOD(*ARGS, **KWARGS) in the executor and returns the result,
+        for example await service.query('dijkstra', 0). Calls with the same arguments made
+        while one is still running for the same snapshot version get the same result object,
+        so callers should not modify what they get back.
+        """
+        if method in WRITE_METHODS or method.startswith(BLOCKED_PREFIXES):
+            raise ValueError(f'{method} is not a query')
+
+        loop = asyncio.get_running_loop()
+        call = partial(getattr(self.snapshot, method), *args, **kwargs)
+        try:
+            key = (self.version, method, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # unhashable arguments (a list of paths, say) cannot be matched, so run alone
+            return await loop.run_in_executor(self.executor, call)
+
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = loop.run_in_executor(self.executor, call)
+            self._inflight[key] = shared
+            shared.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # one caller giving up must not cancel the call for the others
+        return await asyncio.shield(shared)
+
+    async def write(self, method: str, *args) -> int:
+        """
+        This method queues the change METHOD(*ARGS), for example await service.write('add_edge',
+        0, 1, 5), and returns the snapshot version that includes it once that is published.
+
+        Writes that arrive while a batch is being applied go into the next batch together.
+        If any change in a batch raises, none of the batch is published and every write in
+        it gets the exception.
+        """
+        if method not in WRITE_METHODS or not hasattr(self.snapshot, method):
+            raise ValueError(f'{method} is not a write method of {type(self.snapshot).__name__}')
+
+        done = asyncio.get_running_loop().create_future()
+        self._pending.append((method, args, done))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.ensure_future(self._apply_pending())
+        return await done
+
+    async def flush(self) -> int:
+        """
+        This method waits until every queued write is published and returns the current version.
+        """
+        while self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+        return self.version
+
+    async def _apply_pending(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch, self._pending = self._pending, []
+            changes = [(method, args) for method, args, _ in batch]
+            try:
+                snapshot = await loop.run_in_executor(self.executor, apply_batch, self.snapshot, changes)
+            except Exception as exc:
+                for _, _, done in batch:
+                    if not done.done():
+                        done.set_exception(exc)
+                continue
+
+            self.snapshot = snapshot
+            self.version += 1
+            for _, _, done in batch:
+                if not done.done():
+                    done.set_result(self.version)
+
+
+def apply_batch(graph, changes):
+    """
+    This function returns a new graph: GRAPH with every (method, args) in CHANGES applied in
+    order. GRAPH itself is left unchanged.
+    """
+    # the fork copies an adjacency row the first time a change writes to it
+    copy = graph.fork()
+    for method, args in changes:
+        getattr(copy, method)(*args)
+    return copy
@@ -0,0 +1,189 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Opt-in operation counters and timing histograms for the graph classes
+
+import threading
+from functools import wraps
+from time import perf_counter
+
+# upper bounds (in seconds) of the timing histogram buckets; the last bucket has no bound
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+COUNTERS = (
+    'vertices_visited',   # vertices reached by a traversal, or settled by Dijkstra
+    'neighbor_scans',     # neighbor list entries looked at
+    'edges_relaxed',      # edges that lowered a tentative Dijkstra distance
+    'heap_pushes',
+    'heap_pops',
+    'stale_pops',         # popped entries that were already superseded by a lower key
+    'duplicate_edges',    # add_edge() calls for an edge that was already there
+)
+
+
+class GraphStats:
+    """
+    Counters and per-method timings for one graph, created by enable_stats()
+    - the graph classes keep _stats = None until stats are enabled, and only check it
+      once per method call; the counting happens in wrappers around the neighbor
+      function, visited set and priority queue that an enabled graph hands its algorithms
+    - timings are histograms of wall time per public method, installed as instance
+      attributes over the methods, so a graph without stats has no extra call layer
+    - CALLBACK, if given, is called after every timed method with a dict holding the
+      method name, its wall time and the counters that changed during the call
+    - a timed method called from inside another one (add_edges() calling add_edge())
+      is not recorded on its own; its time and counters belong to the outer call
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.timings = {}
+        # per thread: how many timed calls are running, so only the outermost one records
+        self._active = threading.local()
+
+    def count(self, name: str, amount=1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self) -> None:
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.timings = {}
+
+    def snapshot(self) -> dict:
+        """
+        This method returns a copy of everything recorded so far as plain dicts:
+        {'counters': {...}, 'timings': {method: {'calls', 'total', 'max', 'buckets'}}}, where
+        buckets maps each bucket's upper bound ('inf' for the last one) to a call count.
+        """
+        timings = {}
+        for method, (calls, total, longest, buckets) in self.timings.items():
+            bounds = [str(b) for b in BUCKETS] + ['inf']
+            timings[method] = {'calls': calls, 'total': total, 'max': longest,
+                               'buckets': dict(zip(bounds, buckets))}
+        return {'counters': dict(self.counters), 'timings': timings}
+
+    def record(self, method: str, seconds: float) -> None:
+        entry = self.timings.get(method)
+        if entry is None:
+            entry = self.timings[method] = [0, 0.0, 0.0, [0] * (len(BUCKETS) + 1)]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+        i = 0
+        while i < len(BUCKETS) and seconds > BUCKETS[i]:
+            i += 1
+        entry[3][i] += 1
+
+    # -------------------------- timing -------------------------- #
+
+    def timed(self, method: str, call):
+        """
+        This method returns CALL wrapped so every call is recorded under METHOD.
+        """
+        active = self._active
+
+        @wraps(call)
+        def wrapper(*args, **kwargs):
+            if getattr(active, 'depth', 0):
+                return call(*args, **kwargs)
+
+            callback = self.callback
+            before = dict(self.counters) if callback is not None else None
+            active.depth = 1
+            start = perf_counter()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                seconds = perf_counter() - start
+                active.depth = 0
+                self.record(method, seconds)
+                if callback is not None:
+                    changed = {name: value - before.get(name, 0)
+                               for name, value in self.counters.items() if value != before.get(name, 0)}
+                    callback({'method': method, 'seconds': seconds, 'counters': changed})
+        return wrapper
+
+    def attach(self, graph, methods) -> None:
+        for method in methods:
+            setattr(graph, method, self.timed(method, getattr(graph, method)))
+
+    @staticmethod
+    def detach(graph, methods) -> None:
+        for method in methods:
+            graph.__dict__.pop(method, None)
+
+    # -------------------------- counting wrappers -------------------------- #
+
+    def scanning(self, neighbors):
+        """
+        This method wraps a neighbor function so the length of every list it returns is
+        added to neighbor_scans.
+        """
+        counters = self.counters
+
+        def scan(u):
+            row = neighbors(u)
+            counters['neighbor_scans'] += len(row)
+            return row
+        return scan
+
+    def visiting(self, visited) -> 'CountingSet':
+        return CountingSet(visited, self.counters)
+
+    def queueing(self, queue) -> 'CountingQueue':
+        return CountingQueue(queue, self.counters)
+
+
+class CountingSet:
+    """
+    Visited set wrapper that counts every vertex added as visited.
+    """
+    __slots__ = ('visited', 'counters')
+
+    def __init__(self, visited, counters):
+        self.visited = visited
+        self.counters = counters
+
+    def __contains__(self, v) -> bool:
+        return v in self.visited
+
+    def add(self, v) -> None:
+        self.visited.add(v)
+        self.counters['vertices_visited'] += 1
+
+
+class CountingQueue:
+    """
+    Priority queue wrapper for one Dijkstra run
+    - every push after the first (the source) is a relaxed edge, since Dijkstra only
+      pushes when a distance goes down
+    - latest[v] is the last key pushed for v; a popped entry with any other key has been
+      superseded and is counted as stale, the rest are settled vertices
+    """
+
+    def __init__(self, queue, counters):
+        self.queue = queue
+        self.counters = counters
+        self.latest = {}
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def is_empty(self) -> bool:
+        return self.queue.is_empty()
+
+    def push(self, v: int, key) -> None:
+        if self.latest:
+            self.counters['edges_relaxed'] += 1
+        self.latest[v] = key
+        self.counters['heap_pushes'] += 1
+        self.queue.push(v, key)
+
+    def pop(self) -> tuple:
+        key, v = self.queue.pop()
+        self.counters['heap_pops'] += 1
+        if key != self.latest[v]:
+            self.counters['stale_pops'] += 1
+        else:
+            self.counters['vertices_visited'] += 1
+        return key, v
@@ -0,0 +1,573 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Storage backends for the directed and undirected graphs
+
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DenseStorage:
+    """
+    Adjacency matrix storage, the original layout of DirectedGraph
+    - rows is the same list of lists exposed as DirectedGraph.adj_matrix
+    - a weight of 0 means there is no edge
+    - memory is O(V^2) and every neighbor scan reads a full row
+    """
+    kind = 'dense'
+
+    def __init__(self, rows=None):
+        self.rows = rows if rows is not None else []
+
+    def vertex_count(self) -> int:
+        return len(self.rows)
+
+    def edge_count(self) -> int:
+        return sum(len(row) - row.count(0) for row in self.rows)
+
+    def add_vertex(self) -> int:
+        for row in self.rows:
+            row.append(0)
+        self.rows.append([0] * (len(self.rows) + 1))
+        return len(self.rows)
+
+    def add_vertices(self, count: int) -> int:
+        """
+        Grows every row once by COUNT columns instead of appending one 0 at a time.
+        """
+        zeros = [0] * count
+        for row in self.rows:
+            row.extend(zeros)
+        size = len(self.rows) + count
+        self.rows.extend([0] * size for _ in range(count))
+        return size
+
+    def weight(self, src: int, dst: int):
+        return self.rows[src][dst]
+
+    def set_weight(self, src: int, dst: int, weight) -> None:
+        self.rows[src][dst] = weight
+
+    def neighbors(self, src: int) -> []:
+        """
+        This method returns (dst, weight) tuples for every out-edge of src,
+        in ascending order of dst.
+        """
+        return [(dst, w) for dst, w in enumerate(self.rows[src]) if w != 0]
+
+    def successors(self, src: int) -> []:
+        return [dst for dst, w in enumerate(self.rows[src]) if w != 0]
+
+    def in_neighbors(self, dst: int) -> []:
+        """
+        This method returns (src, weight) tuples for every in-edge of dst, in ascending
+        order of src. The dense matrix has to scan a full column for this.
+        """
+        return [(src, row[dst]) for src, row in enumerate(self.rows) if row[dst] != 0]
+
+    def row(self, src: int) -> []:
+        return self.rows[src]
+
+    def edges(self):
+        for src, row in enumerate(self.rows):
+            for dst, w in enumerate(row):
+                if w != 0:
+                    yield src, dst, w
+
+
+class AdjacencyDictStorage:
+    """
+    Mutable sparse storage, one {dst: weight} dict per vertex
+    - memory is O(V + E)
+    - neighbors are sorted on read; edges are usually inserted in ascending
+      order, which timsort handles in linear time
+    - after fork(), shared_out[v] / shared_inc[v] is 1 while row v is still shared with
+      the other storage; set_weight() copies a shared row before changing it
+    """
+    kind = 'dict'
+
+    def __init__(self):
+        self.out = []
+        self.inc = []
+        self.num_edges = 0
+        self.shared_out = None
+        self.shared_inc = None
+
+    def vertex_count(self) -> int:
+        return len(self.out)
+
+    def edge_count(self) -> int:
+        return self.num_edges
+
+    def add_vertex(self) -> int:
+        return self.add_vertices(1)
+
+    def add_vertices(self, count: int) -> int:
+        self.out.extend({} for _ in range(count))
+        self.inc.extend({} for _ in range(count))
+        if self.shared_out is not None:
+            self.shared_out.extend(bytes(count))
+            self.shared_inc.extend(bytes(count))
+        return len(self.out)
+
+    def weight(self, src: int, dst: int):
+        return self.out[src].get(dst, 0)
+
+    def set_weight(self, src: int, dst: int, weight) -> None:
+        row = self.out[src]
+        if weight == 0:
+            if dst in row:
+                self._unshare(src, dst)
+                del self.out[src][dst]
+                del self.inc[dst][src]
+                self.num_edges -= 1
+            return
+        if row.get(dst) == weight:
+            return
+        if dst not in row:
+            self.num_edges += 1
+        self._unshare(src, dst)
+        self.out[src][dst] = weight
+        self.inc[dst][src] = weight
+
+    def _unshare(self, src: int, dst: int) -> None:
+        """
+        Gives out[SRC] and inc[DST] their own dicts if they are still shared with a fork.
+        """
+        if self.shared_out is None:
+            return
+        if self.shared_out[src]:
+            self.out[src] = dict(self.out[src])
+            self.shared_out[src] = 0
+        if self.shared_inc[dst]:
+            self.inc[dst] = dict(self.inc[dst])
+            self.shared_inc[dst] = 0
+
+    def fork(self) -> 'AdjacencyDictStorage':
+        """
+        This method returns a copy-on-write copy that shares every row dict with this storage.
+        Both sides mark all rows as shared, and whichever changes a shared row first copies it,
+        so a fork costs O(V) pointers up front and then one row per changed edge end,
+        instead of O(V + E).
+        """
+        n = len(self.out)
+        copy = AdjacencyDictStorage()
+        copy.out = list(self.out)
+        copy.inc = list(self.inc)
+        copy.num_edges = self.num_edges
+        copy.shared_out = bytearray(b'\x01') * n
+        copy.shared_inc = bytearray(b'\x01') * n
+        self.shared_out = bytearray(b'\x01') * n
+        self.shared_inc = bytearray(b'\x01') * n
+        return copy
+
+    def neighbors(self, src: int) -> []:
+        return sorted(self.out[src].items())
+
+    def successors(self, src: int) -> []:
+        return sorted(self.out[src])
+
+    def in_neighbors(self, dst: int) -> []:
+        return sorted(self.inc[dst].items())
+
+    def row(self, src: int) -> []:
+        result = [0] * len(self.out)
+        for dst, w in self.out[src].items():
+            result[dst] = w
+        return result
+
+    def edges(self):
+        for src, row in enumerate(self.out):
+            for dst, w in sorted(row.items()):
+                yield src, dst, w
+
+
+class CSRStorage:
+    """
+    Frozen compressed sparse row storage
+    - offsets[u] .. offsets[u + 1] is the slice of targets/weights for vertex u
+    - targets are sorted within each row, so single edge lookups are a binary search
+    - the arrays are never modified; DirectedGraph converts back to dict storage
+      before the first write
+    """
+    kind = 'csr'
+
+    def __init__(self, offsets, targets, weights):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.reverse = None
+
+    @classmethod
+    def from_storage(cls, storage) -> 'CSRStorage':
+        """
+        This method packs any other storage into CSR arrays in a single pass over its edges.
+        """
+        n = storage.vertex_count()
+        offsets = array('q', [0]) * (n + 1)
+        targets = array('q')
+        weights = []
+        for src in range(n):
+            for dst, w in storage.neighbors(src):
+                targets.append(dst)
+                weights.append(w)
+            offsets[src + 1] = len(targets)
+        return cls(offsets, targets, _weight_array(weights))
+
+    def vertex_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def add_vertex(self) -> int:
+        raise TypeError('CSR storage is read-only')
+
+    def add_vertices(self, count: int) -> int:
+        raise TypeError('CSR storage is read-only')
+
+    def _find(self, src: int, dst: int) -> int:
+        lo, hi = self.offsets[src], self.offsets[src + 1]
+        i = bisect_left(self.targets, dst, lo, hi)
+        if i < hi and self.targets[i] == dst:
+            return i
+        return -1
+
+    def weight(self, src: int, dst: int):
+        i = self._find(src, dst)
+        return self.weights[i] if i >= 0 else 0
+
+    def set_weight(self, src: int, dst: int, weight) -> None:
+        raise TypeError('CSR storage is read-only')
+
+    def neighbors(self, src: int) -> []:
+        lo, hi = self.offsets[src], self.offsets[src + 1]
+        return list(zip(self.targets[lo:hi], self.weights[lo:hi]))
+
+    def successors(self, src: int):
+        return self.targets[self.offsets[src]:self.offsets[src + 1]]
+
+    def in_neighbors(self, dst: int) -> []:
+        """
+        The transposed arrays are built the first time in-edges are needed and kept,
+        since the storage never changes.
+        """
+        if self.reverse is None:
+            self.reverse = self.transpose()
+        return self.reverse.neighbors(dst)
+
+    def transpose(self) -> 'CSRStorage':
+        """
+        This method returns the CSR arrays of the graph with every edge reversed,
+        using a counting sort on the targets so it runs in O(V + E).
+        """
+        n = self.vertex_count()
+        offsets = array('q', [0]) * (n + 1)
+        for dst in self.targets:
+            offsets[dst + 1] += 1
+        for v in range(n):
+            offsets[v + 1] += offsets[v]
+
+        fill = array('q', offsets[:n])
+        targets = array('q', [0]) * len(self.targets)
+        weights = _weight_array(self.weights)
+        for src in range(n):
+            for i in range(self.offsets[src], self.offsets[src + 1]):
+                dst = self.targets[i]
+                targets[fill[dst]] = src
+                weights[fill[dst]] = self.weights[i]
+                fill[dst] += 1
+        return CSRStorage(offsets, targets, weights)
+
+    def row(self, src: int) -> []:
+        result = [0] * self.vertex_count()
+        for dst, w in self.neighbors(src):
+            result[dst] = w
+        return result
+
+    def edges(self):
+        for src in range(self.vertex_count()):
+            for dst, w in self.neighbors(src):
+                yield src, dst, w
+
+
+class NumpyStorage:
+    """
+    Adjacency matrix in a numpy ndarray, for bulk work on dense graphs
+    - the array is allocated with spare capacity that doubles when it runs out,
+      so adding vertices one at a time is amortized O(V) instead of a full copy
+    - matrix() is the V x V view of the live part of the array
+    - weights read back as plain Python numbers, so results print like the dense matrix
+    - dtype is only a starting point: a weight it cannot hold exactly widens the whole
+      array to int64 or float64 first, so weights are never truncated or wrapped
+    """
+    kind = 'numpy'
+
+    def __init__(self, dtype='int32'):
+        if numpy is None:
+            raise ImportError("storage 'numpy' requires numpy")
+        self.dtype = numpy.dtype(dtype)
+        self.data = numpy.zeros((0, 0), dtype=self.dtype)
+        self.size = 0
+
+    def _fits(self, weight) -> bool:
+        """
+        Quick check for one Python number, so add_edge() does not build an array per call.
+        """
+        if type(weight) is int and self.dtype.kind in 'iu':
+            info = numpy.iinfo(self.dtype)
+            return info.min <= weight <= info.max
+        if type(weight) is float and self.dtype == numpy.float64:
+            return True
+        return holding_dtype(self.dtype, [weight]) == self.dtype
+
+    def widen(self, weights) -> None:
+        """
+        This method switches the array to a dtype that holds every value in WEIGHTS exactly,
+        if the current one does not.
+        """
+        dtype = holding_dtype(self.dtype, weights)
+        if dtype != self.dtype:
+            self.data = self.data.astype(dtype)
+            self.dtype = dtype
+
+    def matrix(self):
+        return self.data[:self.size, :self.size]
+
+    def vertex_count(self) -> int:
+        return self.size
+
+    def edge_count(self) -> int:
+        return int(numpy.count_nonzero(self.matrix()))
+
+    def add_vertex(self) -> int:
+        return self.add_vertices(1)
+
+    def add_vertices(self, count: int) -> int:
+        size = self.size + count
+        if size > len(self.data):
+            capacity = max(size, 2 * len(self.data))
+            data = numpy.zeros((capacity, capacity), dtype=self.dtype)
+            data[:self.size, :self.size] = self.matrix()
+            self.data = data
+        self.size = size
+        return size
+
+    def weight(self, src: int, dst: int):
+        # int() keeps a bool vertex from being read as a numpy mask
+        return self.data[int(src), int(dst)].item()
+
+    def set_weight(self, src: int, dst: int, weight) -> None:
+        if not self._fits(weight):
+            self.widen([weight])
+        self.data[int(src), int(dst)] = weight
+
+    def set_weights(self, srcs, dsts, weights) -> None:
+        """
+        This method writes many weights at once; SRCS, DSTS and WEIGHTS are equal-length arrays.
+        """
+        self.widen(weights)
+        self.data[srcs, dsts] = weights
+
+    def has_edges(self, srcs, dsts):
+        """
+        This method returns a boolean array telling which (SRCS[i], DSTS[i]) pairs are edges.
+        """
+        return self.data[srcs, dsts] != 0
+
+    def neighbors(self, src: int) -> []:
+        row = self.data[src, :self.size]
+        dsts = numpy.flatnonzero(row)
+        return list(zip(dsts.tolist(), row[dsts].tolist()))
+
+    def successors(self, src: int) -> []:
+        return numpy.flatnonzero(self.data[src, :self.size]).tolist()
+
+    def in_neighbors(self, dst: int) -> []:
+        column = self.data[:self.size, dst]
+        srcs = numpy.flatnonzero(column)
+        return list(zip(srcs.tolist(), column[srcs].tolist()))
+
+    def row(self, src: int) -> []:
+        return self.data[src, :self.size].tolist()
+
+    def edges(self):
+        matrix = self.matrix()
+        srcs, dsts = numpy.nonzero(matrix)
+        return zip(srcs.tolist(), dsts.tolist(), matrix[srcs, dsts].tolist())
+
+
+def holding_dtype(dtype, weights):
+    """
+    This function returns DTYPE if it can store every value in WEIGHTS exactly, otherwise
+    the narrowest of int64 and float64 that can: int64 for integers out of DTYPE's range,
+    float64 for fractions or anything int64 cannot hold.
+    """
+    dtype = numpy.dtype(dtype)
+    values = numpy.asarray(weights)
+    if values.size == 0:
+        return dtype
+    if values.dtype.kind not in 'iuf':
+        # Python ints too big for int64 end up as objects
+        return numpy.dtype(numpy.float64)
+
+    finite = values.dtype.kind != 'f' or bool(numpy.isfinite(values).all())
+    integral = finite and (values.dtype.kind in 'iu' or bool((values == numpy.round(values)).all()))
+    if dtype.kind in 'iu':
+        if integral:
+            for candidate in (dtype, numpy.dtype(numpy.int64)):
+                info = numpy.iinfo(candidate)
+                if info.min <= values.min() and values.max() <= info.max:
+                    return candidate
+        return numpy.dtype(numpy.float64)
+
+    if dtype == numpy.float64 or bool((values.astype(dtype) == values).all()):
+        return dtype
+    return numpy.dtype(numpy.float64)
+
+
+class MatrixView:
+    """
+    Read-only stand-in for adj_matrix when the graph is not stored densely.
+    Indexing a row builds it on demand, so printing a sparse graph still works.
+    Rows are tuples: writing into one would only change a throwaway copy, so code that
+    edits adj_matrix directly gets a TypeError instead of silently losing the edit.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    def __len__(self) -> int:
+        return self.storage.vertex_count()
+
+    def __getitem__(self, src: int) -> []:
+        if src < 0:
+            src += len(self)
+        if not 0 <= src < len(self):
+            raise IndexError('vertex index out of range')
+        return tuple(self.storage.row(src))
+
+    def __setitem__(self, src: int, row) -> None:
+        raise TypeError('adj_matrix is read-only unless the storage is dense; use add_edge()')
+
+    def __iter__(self):
+        for src in range(len(self)):
+            yield tuple(self.storage.row(src))
+
+
+STORAGE_KINDS = {
+    DenseStorage.kind: DenseStorage,
+    AdjacencyDictStorage.kind: AdjacencyDictStorage,
+    CSRStorage.kind: CSRStorage,
+    NumpyStorage.kind: NumpyStorage,
+}
+
+
+def _weight_array(weights):
+    """
+    Weights stay integers when every weight is an integer, so distances print
+    the same way they do with the dense matrix.
+    """
+    if all(isinstance(w, int) for w in weights):
+        return array('q', weights)
+    return array('d', weights)
+
+
+def convert_storage(storage, kind: str, dtype=None):
+    """
+    This function copies the edges of STORAGE into a new storage of the given kind.
+    DTYPE is only used by numpy storage, and is widened if the weights need it.
+    """
+    if kind not in STORAGE_KINDS:
+        raise ValueError(f'unknown storage kind {kind!r}')
+    if kind == CSRStorage.kind:
+        return CSRStorage.from_storage(storage)
+
+    if kind == NumpyStorage.kind:
+        # the dtype is picked from the weights up front, so no weight is narrowed on the way in
+        edges = list(storage.edges())
+        result = NumpyStorage(holding_dtype(dtype or 'int32', [w for _, _, w in edges]))
+        result.add_vertices(storage.vertex_count())
+        if edges:
+            srcs, dsts, weights = zip(*edges)
+            result.set_weights(list(srcs), list(dsts), list(weights))
+        return result
+
+    result = STORAGE_KINDS[kind]()
+    result.add_vertices(storage.vertex_count())
+    for src, dst, w in storage.edges():
+        result.set_weight(src, dst, w)
+    return result
+
+
+class NeighborSet:
+    """
+    Neighbors of one vertex in the undirected graph
+    - an insertion-ordered dict underneath, so add, discard and 'in' are O(1)
+    - iterates and prints like the list it replaced
+    - sorted() keeps the sorted neighbor list until the next change, so traversals
+      do not re-sort a vertex's neighbors every time they visit it
+    """
+    __slots__ = ('items', 'ordered')
+
+    def __init__(self, items=()):
+        self.items = dict.fromkeys(items)
+        self.ordered = None
+
+    def __contains__(self, v) -> bool:
+        return v in self.items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return repr(list(self.items))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NeighborSet):
+            return self.items.keys() == other.items.keys()
+        return list(self.items) == other
+
+    def add(self, v) -> bool:
+        """
+        This method adds V and returns True, or returns False if V was already there.
+        """
+        if v in self.items:
+            return False
+        self.items[v] = None
+        self.ordered = None
+        return True
+
+    def discard(self, v) -> bool:
+        """
+        This method removes V and returns True, or returns False if V was not there.
+        """
+        if v not in self.items:
+            return False
+        del self.items[v]
+        self.ordered = None
+        return True
+
+    # list-style names, for code written against the old list of neighbors
+    append = add
+
+    def remove(self, v) -> None:
+        if not self.discard(v):
+            raise ValueError(f'{v!r} is not a neighbor')
+
+    def sorted(self) -> []:
+        """
+        This method returns the neighbors in ascending order. The list is shared with
+        later calls, so callers must not modify it.
+        """
+        if self.ordered is None:
+            self.ordered = sorted(self.items)
+        return self.ordered
@@ -0,0 +1,198 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Iterative traversal engine shared by the directed and undirected graphs
+
+from array import array
+from collections import deque
+
+
+class VisitedBits:
+    """
+    Visited set for integer vertices 0 .. size - 1, one byte per vertex.
+    Supports the same 'in' / add() calls as a regular set.
+    """
+
+    def __init__(self, size: int):
+        self.bits = bytearray(size)
+
+    def __contains__(self, v) -> bool:
+        return self.bits[v] == 1
+
+    def add(self, v) -> None:
+        self.bits[v] = 1
+
+
+def iter_dfs(v_start, successors, visited, v_end=None, predicate=None, max_depth=None):
+    """
+    This generator yields (vertex, depth) pairs in depth-first (preorder) order, starting at
+    V_START with depth 0.
+
+    SUCCESSORS(u) returns the neighbors of u in the order they should be explored.
+    VISITED is a set-like object (a set, or VisitedBits for integer vertices).
+
+    The search can be cut short three ways:
+    - it stops right after V_END is yielded
+    - vertices for which PREDICATE(v) is false are skipped and not explored further
+    - vertices at MAX_DEPTH are yielded but their neighbors are not explored
+
+    An explicit stack of neighbor iterators replaces recursion, so long paths do not
+    hit the recursion limit and each vertex's neighbor list is only requested once.
+    """
+    visited.add(v_start)
+    yield v_start, 0
+    if v_start == v_end or max_depth == 0:
+        return
+
+    stack = [iter(successors(v_start))]
+    while stack:
+        for v in stack[-1]:
+            if v in visited:
+                continue
+            if predicate is not None and not predicate(v):
+                continue
+            visited.add(v)
+            depth = len(stack)
+            yield v, depth
+            if v == v_end:
+                return
+            if depth != max_depth:
+                stack.append(iter(successors(v)))
+                break
+        else:
+            stack.pop()
+
+
+def dfs_order(v_start, successors, visited, v_end=None) -> []:
+    """
+    This function returns vertices in depth-first order, stopping right after V_END is visited.
+    """
+    return [v for v, _ in iter_dfs(v_start, successors, visited, v_end)]
+
+
+def iter_bfs(v_start, successors, visited, v_end=None, predicate=None, max_depth=None):
+    """
+    This generator yields (vertex, depth) pairs in breadth-first order, starting at V_START
+    with depth 0. The arguments work the same way as in iter_dfs().
+
+    Vertices are marked when they are discovered, so each one enters the queue once and
+    membership checks are O(1) instead of scanning the queue. A vertex is yielded as soon
+    as it is discovered, so stopping at V_END does not pay for the rest of its level.
+    """
+    visited.add(v_start)
+    yield v_start, 0
+    if v_start == v_end or max_depth == 0:
+        return
+
+    to_visit = deque()
+    to_visit.append((v_start, 0))
+    while to_visit:
+        u, depth = to_visit.popleft()
+        for v in successors(u):
+            if v in visited:
+                continue
+            if predicate is not None and not predicate(v):
+                continue
+            visited.add(v)
+            yield v, depth + 1
+            if v == v_end:
+                return
+            if depth + 1 != max_depth:
+                to_visit.append((v, depth + 1))
+
+
+def bfs_order(v_start, successors, visited, v_end=None) -> []:
+    """
+    This function returns vertices in breadth-first order, stopping right after V_END is visited.
+    """
+    return [v for v, _ in iter_bfs(v_start, successors, visited, v_end)]
+
+
+def has_directed_cycle(v_count: int, successors) -> bool:
+    """
+    This function returns True if the directed graph on vertices 0 .. V_COUNT - 1 has a cycle.
+
+    Every vertex is white (0), on the current DFS path (1) or finished (2). Reaching a vertex
+    that is still on the path means we found a back edge, which closes a cycle.
+    """
+    state = bytearray(v_count)
+
+    for root in range(v_count):
+        if state[root] != 0:
+            continue
+        state[root] = 1
+        stack = [(root, iter(successors(root)))]
+        while stack:
+            u, neighbors = stack[-1]
+            for v in neighbors:
+                if state[v] == 1:
+                    return True
+                if state[v] == 0:
+                    state[v] = 1
+                    stack.append((v, iter(successors(v))))
+                    break
+            else:
+                state[u] = 2
+                stack.pop()
+
+    return False
+
+
+def strongly_connected_components(v_count: int, successors) -> tuple:
+    """
+    This function finds the strongly connected components of the directed graph on vertices
+    0 .. V_COUNT - 1 with Tarjan's algorithm, run iteratively, in O(V + E).
+
+    It returns (count, component), where component[v] is the id of the component holding v.
+    Ids are numbered in topological order of the components: every edge between two different
+    components goes from a lower id to a higher one.
+    """
+    index = array('q', [-1]) * v_count
+    low = array('q', [0]) * v_count
+    component = array('q', [-1]) * v_count
+    on_stack = bytearray(v_count)
+    stack = []
+    counter = 0
+    count = 0
+
+    for root in range(v_count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(successors(root)))]
+
+        while work:
+            u, neighbors = work[-1]
+            for v in neighbors:
+                if index[v] == -1:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = 1
+                    work.append((v, iter(successors(v))))
+                    break
+                if on_stack[v] and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[u] < low[parent]:
+                        low[parent] = low[u]
+                if low[u] == index[u]:
+                    # u is the root of a component: everything above it on the stack belongs to it
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = count
+                        if w == u:
+                            break
+                    count += 1
+
+    # Tarjan finishes components in reverse topological order, so flip the ids
+    for v in range(v_count):
+        component[v] = count - 1 - component[v]
+    return count, component
@@ -0,0 +1,105 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Integer-id snapshot of the undirected graph for fast traversals
+
+from array import array
+from bisect import bisect_left
+
+from graph_traversal import VisitedBits, iter_bfs, iter_dfs
+
+
+class InternedGraph:
+    """
+    Read-only copy of an undirected graph with every vertex name replaced by an integer id
+    - names[i] is the name of vertex i and ids[name] is its id
+    - ids are handed out in sorted name order, so comparing ids is the same as comparing
+      names; traversals get the lexicographic order for free
+    - the neighbors of vertex i are targets[offsets[i]:offsets[i + 1]], already sorted
+    - names are only looked up on the way in and out of each method
+    """
+
+    def __init__(self, names, offsets, targets, version=0):
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.version = version
+
+    @classmethod
+    def from_adjacency(cls, adj_list, version=0) -> 'InternedGraph':
+        """
+        This method packs a {name: neighbors} dict, such as UndirectedGraph.adj_list.
+        """
+        names = sorted(adj_list)
+        ids = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('q')
+        for name in names:
+            neighbors = adj_list[name]
+            ordered = neighbors.sorted() if hasattr(neighbors, 'sorted') else sorted(neighbors)
+            targets.extend(ids[v] for v in ordered)
+            offsets.append(len(targets))
+        return cls(names, offsets, targets, version)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def successors(self, i: int):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def is_path(self, path) -> bool:
+        """
+        This method returns True if every step of the name sequence PATH is an edge. Rows are
+        sorted, so each step is a binary search.
+        """
+        ids, offsets, targets = self.ids, self.offsets, self.targets
+        if path[0] not in ids:
+            return False
+        cur = ids[path[0]]
+        for name in path[1:]:
+            v = ids.get(name)
+            if v is None:
+                return False
+            lo, hi = offsets[cur], offsets[cur + 1]
+            i = bisect_left(targets, v, lo, hi)
+            if i == hi or targets[i] != v:
+                return False
+            cur = v
+        return True
+
+    def iter_dfs(self, v_start, v_end=None, predicate=None, max_depth=None, stats=None):
+        """
+        Same as UndirectedGraph.iter_dfs(), run on integer ids. STATS, a GraphStats,
+        counts the neighbor scans and visited vertices when given.
+        """
+        yield from self._iterate(iter_dfs, v_start, v_end, predicate, max_depth, stats)
+
+    def iter_bfs(self, v_start, v_end=None, predicate=None, max_depth=None, stats=None):
+        """
+        Same as UndirectedGraph.iter_bfs(), run on integer ids.
+        """
+        yield from self._iterate(iter_bfs, v_start, v_end, predicate, max_depth, stats)
+
+    def dfs(self, v_start, v_end=None, stats=None) -> []:
+        return [v for v, _ in self.iter_dfs(v_start, v_end, stats=stats)]
+
+    def bfs(self, v_start, v_end=None, stats=None) -> []:
+        return [v for v, _ in self.iter_bfs(v_start, v_end, stats=stats)]
+
+    def _iterate(self, search, v_start, v_end, predicate, max_depth, stats=None):
+        ids, names = self.ids, self.names
+        if v_start not in ids:
+            return
+
+        end = ids.get(v_end)
+        if predicate is not None:
+            name_predicate = predicate
+            predicate = lambda i: name_predicate(names[i])
+
+        successors, visited = self.successors, VisitedBits(len(names))
+        if stats is not None:
+            successors, visited = stats.scanning(successors), stats.visiting(visited)
+
+        for i, depth in search(ids[v_start], successors, visited, end, predicate, max_depth):
+            yield names[i], depth
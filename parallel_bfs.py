@@ -0,0 +1,190 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Level-synchronous, direction-optimizing BFS over CSR arrays on a process pool
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing.shared_memory import SharedMemory
+
+from shared_csr import SharedCSR, attach
+
+# switch to bottom-up once the frontier's edges exceed 1/ALPHA of the edges left to check,
+# and back to top-down once the frontier holds fewer than 1/BETA of all vertices
+ALPHA = 14
+BETA = 24
+
+
+def top_down_step(offsets, targets, levels, frontier) -> array:
+    """
+    This function expands FRONTIER one level and returns the newly reached vertices as a
+    flat array of (vertex, parent) pairs, in the order a queue-based BFS would find them.
+    A vertex is only reported once, by the first frontier vertex that reaches it.
+    """
+    pairs = array('q')
+    seen = set()
+    for u in frontier:
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if levels[v] == -1 and v not in seen:
+                seen.add(v)
+                pairs.append(v)
+                pairs.append(u)
+    return pairs
+
+
+def bottom_up_step(offsets, sources, levels, depth: int, lo: int, hi: int) -> array:
+    """
+    This function checks every unreached vertex in LO .. HI - 1 for an in-neighbor at DEPTH
+    and returns the ones it finds as (vertex, parent) pairs. Each vertex stops at its first
+    such in-neighbor, which is what makes this cheaper than top-down on a huge frontier.
+    """
+    pairs = array('q')
+    for v in range(lo, hi):
+        if levels[v] == -1:
+            for u in sources[offsets[v]:offsets[v + 1]]:
+                if levels[u] == depth:
+                    pairs.append(v)
+                    pairs.append(u)
+                    break
+    return pairs
+
+
+def level_bfs(graph, src: int, reverse=None, workers=1, direction_optimizing=True,
+              deterministic=False, chunk_size=4096) -> tuple:
+    """
+    This function runs a breadth-first search one level at a time from SRC and returns
+    (levels, parents, order) as array('q'): levels[v] is the number of edges from SRC to v,
+    parents[v] the vertex v was reached from (-1 for SRC and for unreached vertices, which
+    also get level -1), and order the reached vertices level by level.
+
+    GRAPH is a CSRStorage with sorted rows. REVERSE is the same graph with every edge turned
+    around, used by bottom-up steps; leave it None for an undirected graph.
+
+    With WORKERS > 1 the CSR arrays and the level array go into shared memory once, and each
+    level's frontier (or, bottom-up, the vertex range) is split into chunks of CHUNK_SIZE
+    that a process pool expands in parallel. Levels smaller than one chunk run in this
+    process. Chunks are merged in order, so the result does not depend on WORKERS.
+
+    DIRECTION_OPTIMIZING switches to bottom-up steps while the frontier is large. Levels are
+    the same either way but order and parents within a level can differ. DETERMINISTIC keeps
+    every step top-down, so order is exactly what bfs() lists and each parent is the vertex
+    bfs() found it from.
+    """
+    n = graph.vertex_count()
+    if reverse is None:
+        reverse = graph
+    if deterministic:
+        direction_optimizing = False
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or n <= chunk_size:
+        return _search(graph, reverse, src, array('q', [-1]) * n, None, workers,
+                       direction_optimizing, chunk_size)
+
+    levels_shm = SharedMemory(create=True, size=max(8 * n, 8))
+    try:
+        with ExitStack() as stack:
+            forward = stack.enter_context(SharedCSR(graph))
+            backward = forward
+            if direction_optimizing and reverse is not graph:
+                backward = stack.enter_context(SharedCSR(reverse))
+            pool = stack.enter_context(ProcessPoolExecutor(
+                workers, initializer=_init_worker,
+                initargs=(forward.handle(), backward.handle(), levels_shm.name, n)))
+
+            with levels_shm.buf[:8 * n] as raw, raw.cast('q') as levels:
+                levels[:] = array('q', [-1]) * n
+                return _search(graph, reverse, src, levels, pool, workers,
+                               direction_optimizing, chunk_size)
+    finally:
+        levels_shm.close()
+        levels_shm.unlink()
+
+
+def _search(graph, reverse, src, levels, pool, workers, direction_optimizing, chunk_size) -> tuple:
+    n = len(levels)
+    offsets, in_offsets = graph.offsets, reverse.offsets
+    parents = array('q', [-1]) * n
+
+    levels[src] = 0
+    frontier = array('q', [src])
+    order = array('q', [src])
+    # in-edges of vertices not reached yet: the work a bottom-up step would have to do
+    unexplored = len(reverse.targets) - (in_offsets[src + 1] - in_offsets[src])
+    bottom_up = False
+    depth = 0
+
+    while frontier:
+        if direction_optimizing:
+            frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+            if not bottom_up and frontier_edges * ALPHA > unexplored:
+                bottom_up = True
+            elif bottom_up and len(frontier) * BETA < n:
+                bottom_up = False
+
+        if bottom_up:
+            parts = _bottom_up(reverse, levels, depth, pool, workers, chunk_size)
+        else:
+            parts = _top_down(graph, levels, frontier, pool, chunk_size)
+
+        next_frontier = array('q')
+        for pairs in parts:
+            for i in range(0, len(pairs), 2):
+                v = pairs[i]
+                if levels[v] == -1:
+                    levels[v] = depth + 1
+                    parents[v] = pairs[i + 1]
+                    next_frontier.append(v)
+                    unexplored -= in_offsets[v + 1] - in_offsets[v]
+
+        order.extend(next_frontier)
+        frontier = next_frontier
+        depth += 1
+
+    return array('q', levels), parents, order
+
+
+def _top_down(graph, levels, frontier, pool, chunk_size) -> []:
+    if pool is None or len(frontier) <= chunk_size:
+        return [top_down_step(graph.offsets, graph.targets, levels, frontier)]
+    chunks = [frontier[i:i + chunk_size] for i in range(0, len(frontier), chunk_size)]
+    return pool.map(_worker_top_down, chunks)
+
+
+def _bottom_up(reverse, levels, depth, pool, workers, chunk_size) -> []:
+    n = len(levels)
+    if pool is None or n <= chunk_size:
+        return [bottom_up_step(reverse.offsets, reverse.targets, levels, depth, 0, n)]
+    # a few ranges per worker, so a range full of reached vertices does not leave one idle
+    step = max(chunk_size, -(-n // (4 * workers)))
+    starts = range(0, n, step)
+    return pool.map(_worker_bottom_up, starts, [min(lo + step, n) for lo in starts],
+                    [depth] * len(starts))
+
+
+# shared blocks attached by a pool worker, set once by _init_worker()
+_worker = None
+
+
+def _init_worker(forward_handle, backward_handle, levels_name: str, n: int) -> None:
+    global _worker
+    forward_shm, forward = attach(forward_handle)
+    backward_shm, backward = forward_shm, forward
+    if backward_handle != forward_handle:
+        backward_shm, backward = attach(backward_handle)
+    levels_shm = SharedMemory(name=levels_name)
+    _worker = (forward_shm, forward, backward_shm, backward, levels_shm,
+               levels_shm.buf[:8 * n].cast('q'))
+
+
+def _worker_top_down(frontier) -> array:
+    _, forward, _, _, _, levels = _worker
+    return top_down_step(forward.offsets, forward.targets, levels, frontier)
+
+
+def _worker_bottom_up(lo: int, hi: int, depth: int) -> array:
+    _, _, _, backward, _, levels = _worker
+    return bottom_up_step(backward.offsets, backward.targets, levels, depth, lo, hi)
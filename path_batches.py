@@ -0,0 +1,128 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Batch path validation for the directed and undirected graphs
+
+from concurrent.futures import ProcessPoolExecutor
+from numbers import Integral
+
+from shared_csr import attach
+
+
+def flatten_paths(paths, offsets=None) -> tuple:
+    """
+    This function returns a batch of paths as (flat, offsets): path i is
+    flat[offsets[i]:offsets[i + 1]]. If OFFSETS is given, PATHS is already the flat
+    vertex sequence and is returned as is; otherwise PATHS is a list of paths.
+    """
+    if offsets is not None:
+        return paths, offsets
+
+    flat = []
+    offsets = [0]
+    for path in paths:
+        flat.extend(path)
+        offsets.append(len(flat))
+    return flat, offsets
+
+
+def validate_flat(flat, offsets, has_vertex, has_edge, single_ok) -> bytearray:
+    """
+    This function checks every path of a flattened batch and returns one byte per path,
+    1 if it is valid and 0 if not.
+
+    An empty path is valid, a one-vertex path is valid when SINGLE_OK(v) says so, and a
+    longer path is valid when HAS_VERTEX(first vertex) holds and HAS_EDGE(u, v) holds for
+    every step. HAS_EDGE must return False (not raise) for vertices that do not exist.
+    """
+    result = bytearray(len(offsets) - 1)
+    for i in range(len(result)):
+        lo, hi = offsets[i], offsets[i + 1]
+        if hi - lo == 0:
+            result[i] = 1
+            continue
+        if hi - lo == 1:
+            result[i] = single_ok(flat[lo])
+            continue
+
+        prev = flat[lo]
+        if not has_vertex(prev):
+            continue
+        for j in range(lo + 1, hi):
+            cur = flat[j]
+            if not has_edge(prev, cur):
+                break
+            prev = cur
+        else:
+            result[i] = 1
+    return result
+
+
+def storage_checks(storage) -> tuple:
+    """
+    This function returns (has_vertex, has_edge, single_ok) for any directed graph storage,
+    matching DirectedGraph.is_valid_path(): a one-vertex path is always valid, and any other
+    vertex must be an integer in range, so 1.0 is rejected the same way. Each step is a hash
+    lookup for dict storage, a binary search for CSR and a direct read for a matrix.
+    """
+    n = storage.vertex_count()
+
+    def has_vertex(v) -> bool:
+        return isinstance(v, Integral) and 0 <= v < n
+
+    def has_edge(u, v) -> bool:
+        return has_vertex(v) and storage.weight(u, v) != 0
+
+    return has_vertex, has_edge, lambda v: True
+
+
+def adjacency_checks(adjacency) -> tuple:
+    """
+    This function returns (has_vertex, has_edge, single_ok) for an undirected graph given as
+    {vertex: neighbors}, matching UndirectedGraph.is_valid_path().
+    """
+    def has_edge(u, v) -> bool:
+        return v in adjacency[u]
+
+    return adjacency.__contains__, has_edge, adjacency.__contains__
+
+
+# checks used by a pool worker, set once by _init_worker()
+_worker = None
+
+
+def _init_worker(kind: str, payload) -> None:
+    global _worker
+    if kind == 'csr':
+        shm, storage = attach(payload)
+        _worker = (shm, storage_checks(storage))
+    else:
+        adjacency = {v: set(neighbors) for v, neighbors in payload.items()}
+        _worker = (None, adjacency_checks(adjacency))
+
+
+def _validate_chunk(flat, offsets) -> bytearray:
+    return validate_flat(flat, offsets, *_worker[1])
+
+
+def validate_parallel(flat, offsets, workers: int, kind: str, payload, chunk_paths=100000) -> bytearray:
+    """
+    This function splits a flattened batch into chunks of CHUNK_PATHS paths and validates
+    them on a pool of WORKERS processes. KIND is 'csr' with a SharedCSR handle as PAYLOAD,
+    or 'adjacency' with a {vertex: list of neighbors} dict, which is sent once per worker.
+    """
+    count = len(offsets) - 1
+    if count == 0:
+        return bytearray()
+
+    chunks = []
+    for a in range(0, count, chunk_paths):
+        b = min(a + chunk_paths, count)
+        base = offsets[a]
+        chunks.append((flat[base:offsets[b]], [o - base for o in offsets[a:b + 1]]))
+
+    result = bytearray()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(kind, payload)) as pool:
+        for part in pool.map(_validate_chunk, *zip(*chunks)):
+            result += part
+    return result
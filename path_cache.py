@@ -0,0 +1,137 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: LRU cache of single-source shortest path results
+
+import heapq
+from collections import OrderedDict
+
+INFINITY = float('inf')
+# bytes per distance: an 8 byte list slot plus a 24 byte float (or small int) object
+DISTANCE_BYTES = 32
+
+
+def entry_size(distances, previous) -> int:
+    """
+    This function estimates the memory held by one cached result. sys.getsizeof() on the list
+    would only count its pointers, not the numbers they point to.
+    """
+    return DISTANCE_BYTES * len(distances) + previous.itemsize * len(previous)
+
+
+class ShortestPathCache:
+    """
+    Remembers dijkstra() results per source vertex
+    - entries maps src -> (distances, previous), oldest use first
+    - at most max_entries results are kept, and if max_bytes is set the
+      least recently used results are dropped until the estimate fits
+    - version is the graph version the entries are valid for; a mismatch
+      means the graph changed behind the cache's back and everything is dropped
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.bytes_used = 0
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, src: int, version: int):
+        """
+        This method returns (distances, previous) for SRC, or None if it is not cached
+        for this graph version.
+        """
+        if version != self.version:
+            self.clear(version)
+        entry = self.entries.get(src)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(src)
+        self.hits += 1
+        return entry
+
+    def put(self, src: int, version: int, distances, previous) -> None:
+        if version != self.version:
+            self.clear(version)
+        if src in self.entries:
+            self._drop(src)
+
+        size = entry_size(distances, previous)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self.entries[src] = (distances, previous)
+        self.sizes[src] = size
+        self.bytes_used += size
+        while len(self.entries) > self.max_entries or \
+                (self.max_bytes is not None and self.bytes_used > self.max_bytes):
+            self._drop(next(iter(self.entries)))
+
+    def _drop(self, src: int) -> None:
+        del self.entries[src]
+        self.bytes_used -= self.sizes.pop(src)
+
+    def clear(self, version=None) -> None:
+        self.entries.clear()
+        self.sizes.clear()
+        self.bytes_used = 0
+        if version is not None:
+            self.version = version
+
+    def grow(self, v_count: int, version: int) -> None:
+        """
+        New vertices start out isolated, so every cached result stays correct once it has
+        an unreachable slot for each of them.
+        """
+        if version - 1 != self.version:
+            self.clear(version)
+            return
+        for src, (distances, previous) in self.entries.items():
+            extra = v_count - len(distances)
+            distances.extend([INFINITY] * extra)
+            previous.extend([-1] * extra)
+            size = entry_size(distances, previous)
+            self.bytes_used += size - self.sizes[src]
+            self.sizes[src] = size
+        self.version = version
+        while self.max_bytes is not None and self.bytes_used > self.max_bytes and self.entries:
+            self._drop(next(iter(self.entries)))
+
+    def repair_decrease(self, src: int, dst: int, weight, out_edges, version: int) -> None:
+        """
+        This method updates every cached result after the edge SRC -> DST was added or its
+        weight went down to WEIGHT, instead of throwing the results away.
+
+        Distances can only get shorter, so only vertices whose distance improves through the
+        new edge need to be revisited: a small Dijkstra run is started from DST and stops
+        as soon as nothing else improves.
+        """
+        if version - 1 != self.version:
+            self.clear(version)
+            return
+
+        for distances, previous in self.entries.values():
+            distance = distances[src] + weight
+            if distance >= distances[dst]:
+                continue
+            distances[dst] = distance
+            previous[dst] = src
+            priority_queue = [(distance, dst)]
+            while priority_queue:
+                current_distance, u = heapq.heappop(priority_queue)
+                if current_distance > distances[u]:
+                    continue
+                for v, w in out_edges(u):
+                    if w > 0 and current_distance + w < distances[v]:
+                        distances[v] = current_distance + w
+                        previous[v] = u
+                        heapq.heappush(priority_queue, (distances[v], v))
+
+        self.version = version
@@ -0,0 +1,154 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Priority queues with decrease-key for Dijkstra's algorithm
+
+import heapq
+from array import array
+
+
+class IndexedMinHeap:
+    """
+    Binary min heap of the integers 0 .. capacity - 1, each with a priority
+    - every vertex is in the heap at most once, so the heap never holds more than V items
+    - pos[v] is the index of v in the heap array (-1 when v is not in the heap),
+      which is what makes decrease-key O(log V)
+    - vertices and priorities live in flat lists, so no tuple is built per push
+    """
+
+    def __init__(self, capacity: int):
+        self.heap = []
+        self.keys = [0] * capacity
+        self.pos = array('q', [-1]) * capacity
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def is_empty(self) -> bool:
+        return len(self.heap) == 0
+
+    def __contains__(self, v) -> bool:
+        return self.pos[v] != -1
+
+    def push(self, v: int, key) -> None:
+        """
+        This method adds V with priority KEY, or lowers the priority of V if it is already
+        in the heap. A KEY that is not lower than the current priority is ignored.
+        """
+        i = self.pos[v]
+        if i == -1:
+            self.heap.append(v)
+            i = len(self.heap) - 1
+            self.pos[v] = i
+        elif key >= self.keys[v]:
+            return
+        self.keys[v] = key
+        self._sift_up(i)
+
+    def pop(self) -> tuple:
+        """
+        This method removes the vertex with the smallest priority and returns (key, vertex).
+        """
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if heap:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return self.keys[top], top
+
+    def _sift_up(self, i: int) -> None:
+        heap, keys, pos = self.heap, self.keys, self.pos
+        v = heap[i]
+        key = keys[v]
+        while i > 0:
+            parent = (i - 1) >> 1
+            p = heap[parent]
+            if keys[p] <= key:
+                break
+            heap[i] = p
+            pos[p] = i
+            i = parent
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, keys, pos = self.heap, self.keys, self.pos
+        size = len(heap)
+        v = heap[i]
+        key = keys[v]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            c = heap[child]
+            if key <= keys[c]:
+                break
+            heap[i] = c
+            pos[c] = i
+            i = child
+        heap[i] = v
+        pos[v] = i
+
+
+class LazyHeap:
+    """
+    heapq with the same push / pop interface as the other queues
+    - lowering a priority pushes a second (key, vertex) tuple instead of moving the first;
+      Dijkstra skips the old one when it comes up, same as DirectedGraph.dijkstra() does
+    """
+
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def is_empty(self) -> bool:
+        return len(self.heap) == 0
+
+    def push(self, v: int, key) -> None:
+        heapq.heappush(self.heap, (key, v))
+
+    def pop(self) -> tuple:
+        return heapq.heappop(self.heap)
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue for small non-negative integer priorities
+    - bucket k holds the vertices with priority k, modulo the number of buckets
+    - with at most max_weight + 1 buckets, every queued priority lies within one lap
+      of the cursor, so pop() only moves forward
+    - lowering a priority just files the vertex in a new bucket; the old entry
+      is skipped when it comes up, the same way Dijkstra skips stale heap tuples
+    """
+
+    def __init__(self, max_weight: int):
+        self.buckets = [[] for _ in range(max_weight + 1)]
+        self.size = 0
+        self.cursor = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def push(self, v: int, key: int) -> None:
+        self.buckets[key % len(self.buckets)].append((key, v))
+        self.size += 1
+
+    def pop(self) -> tuple:
+        """
+        This method removes a vertex with the smallest priority and returns (key, vertex).
+        """
+        count = len(self.buckets)
+        while not self.buckets[self.cursor % count]:
+            self.cursor += 1
+        self.size -= 1
+        return self.buckets[self.cursor % count].pop()
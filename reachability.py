@@ -0,0 +1,95 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Precomputed reachability index for the directed graph
+
+
+class ReachabilityIndex:
+    """
+    Answers "can u reach v" for a directed graph without searching it
+    - vertices are first collapsed into strongly connected components, whose ids are in
+      topological order, so a component can only reach components with a higher id
+    - up to max_bitset components, each component stores the set of components it reaches
+      as one Python int used as a bitset, and every query is a shift and a mask
+    - bigger graphs get interval labels from a DFS of the component DAG instead: a
+      query whose target sits inside the source's DFS subtree is answered at once,
+      other queries fall back to a DFS that never leaves the id range between the two
+    - version is the graph version the index was built for
+    """
+
+    def __init__(self, component, dag, version, max_bitset=20000):
+        self.component = component
+        self.dag = dag
+        self.version = version
+        self.count = dag.v_count
+        self.bits = None
+        self.first = None
+        self.last = None
+        if self.count <= max_bitset:
+            self._label_bitsets()
+        else:
+            self._label_intervals()
+
+    def _label_bitsets(self) -> None:
+        store = self.dag._store()
+        bits = [0] * self.count
+        # walk the components backwards so every successor is finished first
+        for c in range(self.count - 1, -1, -1):
+            reach = 1 << c
+            for d in store.successors(c):
+                reach |= bits[d]
+            bits[c] = reach
+        self.bits = bits
+
+    def _label_intervals(self) -> None:
+        """
+        Gives every component the range [first, last] of DFS discovery numbers in its subtree.
+        """
+        store = self.dag._store()
+        first = [-1] * self.count
+        last = [0] * self.count
+        counter = 0
+        for root in range(self.count):
+            if first[root] != -1:
+                continue
+            first[root] = counter
+            counter += 1
+            stack = [(root, iter(store.successors(root)))]
+            while stack:
+                c, successors = stack[-1]
+                for d in successors:
+                    if first[d] == -1:
+                        first[d] = counter
+                        counter += 1
+                        stack.append((d, iter(store.successors(d))))
+                        break
+                else:
+                    last[c] = counter - 1
+                    stack.pop()
+        self.first = first
+        self.last = last
+
+    def reachable(self, u: int, v: int) -> bool:
+        a, b = self.component[u], self.component[v]
+        if a == b:
+            return True
+        if a > b:
+            return False
+        if self.bits is not None:
+            return (self.bits[a] >> b) & 1 == 1
+        if self.first[a] <= self.first[b] <= self.last[a]:
+            return True
+        return self._search(a, b)
+
+    def _search(self, a: int, b: int) -> bool:
+        store = self.dag._store()
+        seen = {a}
+        stack = [a]
+        while stack:
+            for d in store.successors(stack.pop()):
+                if d == b:
+                    return True
+                if d < b and d not in seen:
+                    seen.add(d)
+                    stack.append(d)
+        return False
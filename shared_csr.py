@@ -0,0 +1,76 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: CSR arrays in shared memory, so worker processes can read a graph without copying it
+
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from graph_storage import CSRStorage
+
+
+class SharedCSR:
+    """
+    One shared memory block holding the offsets, targets and weights arrays of a graph
+    - handle() is a small picklable tuple that workers pass to attach()
+    - the creating process owns the block and must call close() (or use 'with')
+    """
+
+    def __init__(self, storage):
+        csr = storage if storage.kind == 'csr' else CSRStorage.from_storage(storage)
+        self.v_count = csr.vertex_count()
+        self.e_count = csr.edge_count()
+        self.weight_code = 'q' if all(isinstance(w, int) for w in csr.weights) else 'd'
+
+        size = 8 * (self.v_count + 1 + 2 * self.e_count)
+        self.shm = SharedMemory(create=True, size=max(size, 8))
+
+        offsets, targets, weights = _views(self.shm.buf, self.v_count, self.e_count, self.weight_code)
+        offsets[:] = _packed(csr.offsets, 'q')
+        targets[:] = _packed(csr.targets, 'q')
+        weights[:] = _packed(csr.weights, self.weight_code)
+        for view in (offsets, targets, weights):
+            view.release()
+
+    def handle(self) -> tuple:
+        return self.shm.name, self.v_count, self.e_count, self.weight_code
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(handle):
+    """
+    This function maps the block named in HANDLE into the current process and returns
+    (shm, storage), where storage is a read-only CSRStorage over the shared arrays.
+    Keep shm alive for as long as storage is used.
+    """
+    name, v_count, e_count, weight_code = handle
+    shm = SharedMemory(name=name)
+    return shm, CSRStorage(*_views(shm.buf, v_count, e_count, weight_code))
+
+
+def _views(buf, v_count: int, e_count: int, weight_code: str) -> tuple:
+    """
+    Splits the raw block into typed views of the three CSR arrays.
+    """
+    a = 8 * (v_count + 1)
+    b = a + 8 * e_count
+    c = b + 8 * e_count
+    return buf[:a].cast('q'), buf[a:b].cast('q'), buf[b:c].cast(weight_code)
+
+
+def _packed(values, code: str):
+    """
+    Returns VALUES as a buffer of the given type, copying only when needed.
+    """
+    if isinstance(values, array) and values.typecode == code:
+        return values
+    return array(code, values)
@@ -0,0 +1,190 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Point-to-point shortest path searches for the directed graph
+
+import heapq
+from array import array
+
+INFINITY = float('inf')
+
+
+def build_path(previous, src, dst) -> []:
+    """
+    This function walks the predecessor links back from DST to SRC and returns the path
+    in travel order. PREVIOUS maps each reached vertex to the vertex it was reached from.
+    """
+    path = [dst]
+    while path[-1] != src:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
+
+
+def bidirectional_dijkstra(out_edges, in_edges, src, dst):
+    """
+    This function returns (distance, path) for the shortest path from SRC to DST, or
+    (INFINITY, []) if DST cannot be reached.
+
+    OUT_EDGES(u) and IN_EDGES(v) return (vertex, weight) tuples for the edges leaving u
+    and entering v. One search grows forward from SRC and another backward from DST,
+    always advancing the side with the smaller frontier distance. Once the two frontier
+    minimums add up to at least the best meeting distance found so far, no shorter path
+    can exist and the search stops, usually long before either side covers the graph.
+    """
+    if src == dst:
+        return 0, [src]
+
+    dist = ({src: 0}, {dst: 0})
+    previous = ({}, {})
+    settled = (set(), set())
+    queues = ([(0, src)], [(0, dst)])
+    edges = (out_edges, in_edges)
+
+    best = INFINITY
+    meeting = None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        # advance whichever side has the closer frontier
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        other = 1 - side
+        current_distance, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        for v, weight in edges[side](u):
+            if weight <= 0:
+                continue
+            distance = current_distance + weight
+            if distance < dist[side].get(v, INFINITY):
+                dist[side][v] = distance
+                previous[side][v] = u
+                heapq.heappush(queues[side], (distance, v))
+            # v has been reached from both ends, so the two searches join there
+            if v in dist[other] and dist[side][v] + dist[other][v] < best:
+                best = dist[side][v] + dist[other][v]
+                meeting = v
+
+    if meeting is None:
+        return INFINITY, []
+
+    path = build_path(previous[0], src, meeting)
+    v = meeting
+    while v != dst:
+        v = previous[1][v]
+        path.append(v)
+    return best, path
+
+
+def astar(out_edges, src, dst, heuristic):
+    """
+    This function returns (distance, path) for the shortest path from SRC to DST using
+    A* search, or (INFINITY, []) if DST cannot be reached.
+
+    HEURISTIC(v) estimates the remaining distance from v to DST. It must never
+    overestimate it, otherwise the path found may not be the shortest. Vertices are
+    expanded in order of distance so far plus the estimate, so a good heuristic keeps
+    the search pointed at DST.
+    """
+    dist = {src: 0}
+    previous = {}
+    priority_queue = [(heuristic(src), 0, src)]
+
+    while priority_queue:
+        _, current_distance, u = heapq.heappop(priority_queue)
+        if current_distance > dist[u]:
+            continue
+        if u == dst:
+            return current_distance, build_path(previous, src, dst)
+
+        for v, weight in out_edges(u):
+            if weight <= 0:
+                continue
+            distance = current_distance + weight
+            if distance < dist.get(v, INFINITY):
+                dist[v] = distance
+                previous[v] = u
+                heapq.heappush(priority_queue, (distance + heuristic(v), distance, v))
+
+    return INFINITY, []
+
+
+def dijkstra_with_queue(out_edges, v_count: int, src: int, queue):
+    """
+    This function runs Dijkstra's algorithm from SRC using any queue that has push(v, key),
+    pop() -> (key, v) and is_empty(), such as IndexedMinHeap or BucketQueue.
+
+    It returns (distances, previous), where previous[v] is the vertex before v on a shortest
+    path from SRC (-1 for SRC itself and for unreachable vertices).
+    """
+    distances = [INFINITY] * v_count
+    previous = array('q', [-1]) * v_count
+
+    distances[src] = 0
+    queue.push(src, 0)
+
+    while not queue.is_empty():
+        current_distance, u = queue.pop()
+        if current_distance > distances[u]:
+            continue
+        for v, weight in out_edges(u):
+            if weight > 0:
+                distance = current_distance + weight
+                if distance < distances[v]:
+                    distances[v] = distance
+                    previous[v] = u
+                    queue.push(v, distance)
+
+    return distances, previous
+
+
+def bounded_dijkstra(out_edges, sources, max_distance=None, limit=None) -> tuple:
+    """
+    This function runs one Dijkstra search seeded with every vertex in SOURCES at distance 0,
+    so each vertex ends up with its distance from the nearest source.
+
+    MAX_DISTANCE, if given, drops every path longer than that, and LIMIT stops the search
+    once that many vertices are settled. Everything is kept in dicts holding only the
+    vertices the search touched, so the work depends on the explored region, not the graph.
+
+    It returns (settled, distances, previous, origin): settled lists the settled vertices in
+    order of distance, and the dicts map each reached vertex to its distance, the vertex it
+    was reached from (-1 for sources) and the source whose path won. When LIMIT cuts the
+    search short, only the settled vertices are sure to have final values.
+    """
+    distances = {}
+    previous = {}
+    origin = {}
+    heap = []
+    for s in sources:
+        if s not in distances:
+            distances[s] = 0
+            previous[s] = -1
+            origin[s] = s
+            heap.append((0, s))
+    heapq.heapify(heap)
+
+    settled = []
+    while heap:
+        current_distance, u = heapq.heappop(heap)
+        if current_distance > distances[u]:
+            continue
+        settled.append(u)
+        if len(settled) == limit:
+            break
+        for v, weight in out_edges(u):
+            if weight > 0:
+                distance = current_distance + weight
+                if max_distance is not None and distance > max_distance:
+                    continue
+                if distance < distances.get(v, INFINITY):
+                    distances[v] = distance
+                    previous[v] = u
+                    origin[v] = origin[u]
+                    heapq.heappush(heap, (distance, v))
+
+    return settled, distances, previous, origin
@@ -0,0 +1,44 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Shared fixtures for the randomized cross-check tests
+
+import random
+
+import pytest
+
+
+@pytest.fixture(params=range(20))
+def rng(request) -> random.Random:
+    """
+    A seeded random generator; every test that takes it runs once per seed.
+    """
+    return random.Random(request.param)
+
+
+@pytest.fixture
+def random_edges():
+    """
+    Returns make(rng, n, m, max_weight=5): M random (src, dst, weight) edges on N vertices,
+    without loops. Small weights make ties and equal-length paths common, which is where
+    stopping rules and repairs go wrong.
+    """
+    def make(rng, n: int, m: int, max_weight=5) -> []:
+        edges = []
+        while n > 1 and len(edges) < m:
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                edges.append((u, v, rng.randint(1, max_weight)))
+        return edges
+    return make
+
+
+@pytest.fixture
+def reachable_sets():
+    """
+    Returns reach(graph): reach(graph)[u] is every vertex u can get to, found with one
+    plain DFS per vertex.
+    """
+    def reach(graph) -> []:
+        return [set(graph.dfs(u)) for u in range(graph.v_count)]
+    return reach
@@ -0,0 +1,38 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: All-pairs distances checked against one dijkstra() per vertex
+
+import random
+
+import pytest
+
+from all_pairs import parallel_dijkstra
+from d_graph import DirectedGraph
+
+
+@pytest.mark.parametrize('method', ('dijkstra', 'floyd', 'auto'))
+def test_every_method_matches_dijkstra(rng, random_edges, method):
+    n = rng.randint(1, 20)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, n * n // 2)), 'dict', n)
+    expected = [[float(d) for d in graph.dijkstra(src)] for src in range(n)]
+
+    result = graph.all_pairs_shortest_paths(method, workers=1)
+    assert len(result) == n
+    assert result.tolist() == expected
+    assert [list(row) for row in result] == expected
+
+
+def test_process_pool_matches_one_process(random_edges):
+    # one seed only: every run starts a process pool
+    rng = random.Random(9)
+    n = 90
+    graph = DirectedGraph.from_edges(random_edges(rng, n, 4 * n, 9), 'dict', n)
+    single = parallel_dijkstra(graph._store(), workers=1).tolist()
+    # small chunks so several workers each write part of the shared result
+    assert parallel_dijkstra(graph._store(), workers=2, chunk_size=16).tolist() == single
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        DirectedGraph([(0, 1, 1)]).all_pairs_shortest_paths('bellman-ford')
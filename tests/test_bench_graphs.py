@@ -0,0 +1,83 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: The benchmark harness run at toy sizes
+
+import json
+
+import pytest
+
+import bench_graphs
+from bench_graphs import GENERATORS, main, regressions, run_benchmarks, scaling_exponent
+
+
+@pytest.mark.parametrize('family', sorted(GENERATORS))
+def test_generators_are_seeded_and_loop_free(family):
+    edges = GENERATORS[family](50, 7)
+    assert edges == GENERATORS[family](50, 7)
+    assert edges and all(u != v and 0 <= u < 50 and 0 <= v < 50 and 1 <= w <= 20 for u, v, w in edges)
+
+
+def test_deep_chain_and_power_law_shapes():
+    assert [(u, v) for u, v, _ in GENERATORS['deep_chain'](5, 0)] == [(0, 1), (1, 2), (2, 3), (3, 4)]
+    #edges go from old to new vertices, so vertex 0 reaches everything
+    graph = bench_graphs.directed_graph(GENERATORS['power_law'](40, 1), 'dict')
+    assert sorted(graph.dfs(0)) == list(range(40))
+
+
+def test_scaling_exponent():
+    assert scaling_exponent([(10, 1.0), (100, 10.0), (1000, 100.0)]) == pytest.approx(1)
+    assert scaling_exponent([(10, 1.0), (100, 100.0)]) == pytest.approx(2)
+    assert scaling_exponent([(10, 1.0)]) is None
+    assert scaling_exponent([(10, 1.0), (10, 2.0)]) is None
+    assert scaling_exponent([(10, 0.0), (100, 1.0)]) is None
+
+
+@pytest.mark.parametrize('storage', ['dict', 'csr', 'numpy'])
+def test_run_benchmarks_report(storage):
+    report = run_benchmarks([20, 40], ['grid', 'deep_chain'], sorted(bench_graphs.CASES),
+                            storage=storage, repeat=1, memory=False)
+    results = report['results']
+    cases = sum(len(methods) for methods in bench_graphs.CASES.values())
+    assert len(results) == 2 * 2 * cases
+    assert all(r['ops'] > 0 and r['seconds'] >= 0 and r['peak_bytes'] is None for r in results)
+    assert len(report['scaling']) == 2 * cases
+    assert report['meta']['storage'] == storage and report['meta']['sizes'] == [20, 40]
+
+    #searches count the vertices they reached: all of the chain from vertex 0
+    dfs = [r for r in results if (r['family'], r['graph'], r['method'], r['n']) == ('deep_chain', 'directed', 'dfs', 40)]
+    assert dfs[0]['ops'] == 40
+    json.dumps(report)
+
+
+def test_methods_filter_and_memory():
+    report = run_benchmarks([30], ['random_sparse'], ['undirected'], methods=['bfs'], repeat=1)
+    (row,) = report['results']
+    assert row['method'] == 'bfs' and row['peak_bytes'] > 0
+
+
+def test_regressions():
+    def report(seconds):
+        return {'results': [{'family': 'grid', 'graph': 'directed', 'method': 'dfs', 'n': n, 'seconds': s}
+                            for n, s in seconds.items()]}
+    baseline = report({10: 1.0, 20: 1.0})
+    assert regressions(report({10: 1.4, 20: 1.6, 30: 9.0}), baseline, 1.5) == [('grid', 'directed', 'dfs', 20, 1.0, 1.6)]
+    assert regressions(report({10: 0.5}), baseline, 1.5) == []
+
+
+def test_main_writes_and_compares(tmp_path, capsys):
+    output = tmp_path / 'bench.json'
+    args = ['--sizes', '16', '--families', 'grid', '--methods', 'dfs', '--repeat', '1', '--no-memory']
+    assert main(args + ['--output', str(output)]) == 0
+    baseline = json.loads(output.read_text())
+    assert {r['graph'] for r in baseline['results']} == {'directed', 'undirected'}
+
+    assert main(args + ['--compare', str(output), '--tolerance', '1e9']) == 0
+    assert json.loads(capsys.readouterr().out)['meta']['seed'] == 261
+
+    #a baseline that took no time at all makes everything a regression
+    for r in baseline['results']:
+        r['seconds'] = 0
+    output.write_text(json.dumps(baseline))
+    assert main(args + ['--output', str(tmp_path / 'new.json'), '--compare', str(output)]) == 1
+    assert 'REGRESSION grid' in capsys.readouterr().err
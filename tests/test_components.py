@@ -0,0 +1,47 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Tarjan's component ids and the condensation checked against brute-force reachability
+
+from d_graph import DirectedGraph
+
+
+def test_components_and_renumbering(rng, random_edges, reachable_sets):
+    n = rng.randint(1, 20)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 2 * n)), 'dict', n)
+    reach = reachable_sets(graph)
+    component, dag = graph.condensation()
+
+    # same id exactly when the two vertices reach each other
+    for u in range(n):
+        for v in range(n):
+            assert (component[u] == component[v]) == (v in reach[u] and u in reach[v])
+
+    # ids are 0 .. count - 1 and every edge between components goes to a higher id
+    assert sorted(set(component)) == list(range(dag.v_count))
+    assert list(graph.strongly_connected_components()) == list(component)
+    for src, dst, _ in graph.get_edges():
+        assert component[src] <= component[dst]
+    for a, b, _ in dag.get_edges():
+        assert a < b
+    assert not dag.has_cycle()
+
+
+def test_condensation_keeps_the_lightest_joining_edge(rng, random_edges):
+    n = rng.randint(2, 15)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, 2 * n, 9), 'dict', n)
+    component, dag = graph.condensation()
+    lightest = {}
+    for src, dst, weight in graph.get_edges():
+        a, b = component[src], component[dst]
+        if a != b:
+            lightest[(a, b)] = min(weight, lightest.get((a, b), weight))
+    assert dag.get_edges() == sorted((a, b, w) for (a, b), w in lightest.items())
+
+
+def test_condensation_is_rebuilt_after_a_change():
+    graph = DirectedGraph([(0, 1, 1), (1, 2, 1)])
+    assert graph.condensation()[1].v_count == 3
+    graph.add_edge(2, 0)
+    component, dag = graph.condensation()
+    assert dag.v_count == 1 and list(component) == [0, 0, 0]
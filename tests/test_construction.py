@@ -0,0 +1,60 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Bulk vertex growth and from_edges() checked against one-at-a-time construction
+
+import pytest
+
+from d_graph import DirectedGraph
+
+KINDS = ('dense', 'dict', 'csr')
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_from_edges_matches_the_constructor(rng, random_edges, kind):
+    n = rng.randint(1, 15)
+    edges = random_edges(rng, n, rng.randint(0, 3 * n))
+    expected = DirectedGraph(edges)
+
+    graph = DirectedGraph.from_edges(edges, kind)
+    assert graph.get_storage() == kind
+    assert graph.get_edges() == expected.get_edges()
+    if edges:
+        # the constructor always makes at least one vertex, even from no edges
+        assert graph.v_count == expected.v_count
+
+    # a generator is read once and the graph grows as edges arrive
+    streamed = DirectedGraph.from_edges((edge for edge in edges), kind)
+    assert streamed.get_storage() == kind
+    assert streamed.get_edges() == expected.get_edges()
+
+
+def test_from_edges_reserves_vertices():
+    graph = DirectedGraph.from_edges([(0, 1, 2)], 'csr', v_count=5)
+    assert graph.get_storage() == 'csr'
+    assert graph.v_count == 5
+    assert graph.dijkstra(0) == [0, 2, float('inf'), float('inf'), float('inf')]
+
+
+def test_from_edge_file_keeps_the_requested_storage(tmp_path):
+    path = tmp_path / 'edges.csv'
+    path.write_text('0,1,4\n1,2,5\n')
+    graph = DirectedGraph.from_edge_file(str(path), storage='csr')
+    assert graph.get_storage() == 'csr'
+    assert graph.get_edges() == [(0, 1, 4), (1, 2, 5)]
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_add_vertices_matches_add_vertex(rng, kind):
+    one = DirectedGraph.from_edges([], kind)
+    bulk = DirectedGraph.from_edges([], kind)
+    for _ in range(5):
+        count = rng.randint(0, 6)
+        for _ in range(count):
+            one.add_vertex()
+        assert bulk.add_vertices(count) == one.v_count
+        u, v = rng.randrange(one.v_count + 1), rng.randrange(one.v_count + 1)
+        one.add_edge(u, v, 3)
+        bulk.add_edge(u, v, 3)
+    assert str(bulk) == str(one)
+    assert bulk.get_edges() == one.get_edges()
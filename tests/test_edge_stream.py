@@ -0,0 +1,78 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Streaming edge lists from CSV/TSV files into both graph classes
+
+import io
+
+import pytest
+
+from d_graph import DirectedGraph
+from edge_stream import parse_pairs, parse_weighted, read_edge_batches
+from ud_graph import UndirectedGraph
+
+
+def edge_text(edges, delimiter) -> str:
+    return ''.join(delimiter.join(map(str, edge)) + '\n' for edge in edges)
+
+
+@pytest.mark.parametrize('delimiter', [',', '\t', ' '])
+@pytest.mark.parametrize('batch_size', [1, 7, 1000])
+def test_directed_file_matches_the_constructor(tmp_path, rng, random_edges, delimiter, batch_size):
+    edges = random_edges(rng, 15, 50)
+    path = tmp_path / 'edges.txt'
+    path.write_text('src,dst,weight\n'.replace(',', delimiter) + edge_text(edges, delimiter))
+
+    graph = DirectedGraph.from_edge_file(path, batch_size=batch_size, skip_header=True)
+    expected = DirectedGraph(edges)
+    assert sorted(graph.get_edges()) == sorted(expected.get_edges())
+    #the file may not mention the highest vertices the constructor would count
+    assert graph.v_count == max(max(u, v) for u, v, _ in edges) + 1
+
+
+@pytest.mark.parametrize('storage', ['dense', 'dict', 'csr', 'numpy'])
+def test_directed_storage_is_kept(storage):
+    lines = ['# comment', '0,1,2', '', '1,2', '2,0,1.5']
+    graph = DirectedGraph.from_edge_file(lines, storage=storage, batch_size=2)
+    assert graph.get_storage() == storage
+    assert sorted(graph.get_edges()) == [(0, 1, 2), (1, 2, 1), (2, 0, 1.5)]
+
+
+def test_undirected_file_drops_duplicates(tmp_path, rng):
+    names = ['a', 'b', 'c', 'd', 'e', 'ü']
+    pairs = [(rng.choice(names), rng.choice(names)) for _ in range(40)]
+    path = tmp_path / 'pairs.tsv'
+    path.write_text(edge_text(pairs, '\t'), encoding='utf-8')
+
+    graph = UndirectedGraph.from_edge_file(path, batch_size=5)
+    expected = UndirectedGraph(pairs)
+    assert graph.edge_count() == expected.edge_count()
+    assert sorted(map(sorted, graph.get_edges())) == sorted(map(sorted, expected.get_edges()))
+
+
+def test_add_edges_accepts_mixed_name_types():
+    graph = UndirectedGraph()
+    graph.add_edges([(1, 'a'), ('a', 1), (2, 1), (None, 'a'), (1, 1)])
+    assert graph.edge_count() == 3
+    assert graph.is_valid_path([2, 1, 'a', None])
+
+
+def test_progress_counts_edges_and_bytes():
+    data = b'0,1\n1,2\n2,3\n3,4\n4,5\n'
+    calls = []
+    batches = list(read_edge_batches(io.BytesIO(data), parse_weighted, 2,
+                                     progress=lambda *args: calls.append(args)))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert calls == [(2, 8), (4, 16), (5, 20)]
+
+
+def test_rows_and_explicit_delimiter():
+    rows = [('x', 'y', 'ignored'), ('y', 'z')]
+    assert list(read_edge_batches(rows, parse_pairs)) == [[('x', 'y'), ('y', 'z')]]
+    lines = ['a;b', 'b;c']
+    assert list(read_edge_batches(lines, parse_pairs, delimiter=';')) == [[('a', 'b'), ('b', 'c')]]
+
+
+def test_short_rows_are_rejected():
+    with pytest.raises(ValueError):
+        list(read_edge_batches(['0,1', '2'], parse_weighted))
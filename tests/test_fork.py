@@ -0,0 +1,108 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Copy-on-write forks and GraphService snapshots checked for isolation
+
+import asyncio
+
+import pytest
+
+from d_graph import DirectedGraph
+from graph_service import GraphService
+from ud_graph import UndirectedGraph
+
+
+def directed_edits(rng, graph, n, count):
+    for _ in range(count):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if rng.random() < 0.6:
+            graph.add_edge(u, v, rng.randint(1, 5))
+        else:
+            graph.remove_edge(u, v)
+
+
+def in_edges_match(graph):
+    store = graph._store()
+    expected = {(src, dst): w for src, dst, w in graph.get_edges()}
+    found = {(src, dst): w for dst in range(graph.v_count) for src, w in store.in_neighbors(dst)}
+    assert found == expected
+
+
+def test_directed_fork_isolation(rng, random_edges):
+    n = 8
+    parent = DirectedGraph.from_edges(random_edges(rng, n, 14), 'dict', n)
+    before = parent.get_edges()
+
+    child = parent.fork()
+    directed_edits(rng, child, n, 12)
+    child.add_vertex()
+    child.add_edge(n, rng.randrange(n), 3)
+    assert parent.get_edges() == before
+    in_edges_match(parent)
+
+    after = child.get_edges()
+    grandchild = child.fork()
+    directed_edits(rng, parent, n, 12)
+    directed_edits(rng, grandchild, n, 12)
+    assert child.get_edges() == after
+    for graph in (parent, child, grandchild):
+        in_edges_match(graph)
+
+
+def test_undirected_fork_isolation(rng):
+    names = 'ABCDEFG'
+    parent = UndirectedGraph([(rng.choice(names), rng.choice(names)) for _ in range(10)])
+    before = sorted(map(sorted, parent.get_edges()))
+
+    child = parent.fork()
+    for _ in range(10):
+        u, v = rng.choice(names), rng.choice(names)
+        change = rng.choice((child.add_edge, child.remove_edge, lambda u, v: child.remove_vertex(u)))
+        change(u, v)
+    assert sorted(map(sorted, parent.get_edges())) == before
+
+    after = sorted(map(sorted, child.get_edges()))
+    parent.remove_vertex('A')
+    parent.add_edge('B', 'Z')
+    assert sorted(map(sorted, child.get_edges())) == after
+    for graph in (parent, child):
+        assert graph.edge_count() == len(graph.get_edges())
+
+
+def test_service_snapshots_do_not_change():
+    async def run():
+        graph = DirectedGraph.from_edges([(0, 1, 4), (1, 2, 4)], 'dict', 4)
+        service = GraphService(graph)
+        first = service.snapshot
+        versions = await asyncio.gather(service.write('add_edge', 0, 2, 1),
+                                        service.write('add_edge', 2, 3, 1),
+                                        service.query('dijkstra', 0))
+        assert first.get_edges() == [(0, 1, 4), (1, 2, 4)]
+        assert graph.get_edges() == [(0, 1, 4), (1, 2, 4)]
+        assert await service.query('dijkstra', 0) == [0, 4, 1, 2]
+        assert versions[0] <= versions[1] == await service.flush()
+
+        second = service.snapshot
+        await service.write('remove_edge', 0, 2)
+        assert second.get_edges() == [(0, 1, 4), (0, 2, 1), (1, 2, 4), (2, 3, 1)]
+    asyncio.run(run())
+
+
+def test_service_rejects_bad_calls_and_failed_batches():
+    async def run():
+        service = GraphService(UndirectedGraph([('A', 'B')]))
+        with pytest.raises(ValueError):
+            await service.query('add_edge', 'A', 'C')
+        with pytest.raises(ValueError):
+            await service.write('dfs', 'A')
+
+        #a change that raises sinks the whole batch it was queued with
+        results = await asyncio.gather(service.write('add_edge', 'B', 'C'),
+                                       service.write('add_edges', [('C',)]),
+                                       return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert service.version == 0 and await service.query('dfs', 'A') == ['A', 'B']
+
+        assert await service.write('add_edge', 'B', 'C') == 1
+        assert await service.query('dfs', 'A') == ['A', 'B', 'C']
+    asyncio.run(run())
@@ -0,0 +1,107 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Saving and loading graphs in the binary CSR format of graph_io
+
+import os
+import random
+
+import pytest
+
+from d_graph import DirectedGraph
+from graph_io import read_graph
+from ud_graph import UndirectedGraph
+
+NAMES = ['v%d' % i for i in range(15)] + ['ünï', 'ǅ']
+
+
+def undirected_edges(rng, m=40) -> []:
+    return [(rng.choice(NAMES), rng.choice(NAMES)) for _ in range(m)]
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+@pytest.mark.parametrize('kind', ['dense', 'dict', 'csr', 'numpy'])
+def test_directed_round_trip(tmp_path, rng, random_edges, kind, mmap):
+    graph = DirectedGraph(random_edges(rng, 12, 40))
+    graph.set_storage(kind)
+    graph.save(tmp_path / 'g.bin')
+    loaded = DirectedGraph.load(tmp_path / 'g.bin', mmap=mmap)
+    assert loaded.get_storage() == 'csr'
+    assert str(loaded) == str(graph) and sorted(loaded.get_edges()) == sorted(graph.get_edges())
+    assert loaded.dijkstra(0) == graph.dijkstra(0) and loaded.dfs(3) == graph.dfs(3)
+
+    #the first change thaws the read-only CSR arrays
+    loaded.add_edge(1, 2, 7)
+    graph.add_edge(1, 2, 7)
+    assert str(loaded) == str(graph)
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_undirected_round_trip(tmp_path, rng, mmap):
+    graph = UndirectedGraph(undirected_edges(rng))
+    graph.add_vertex('lonely')
+    graph.save(tmp_path / 'u.bin')
+    loaded = UndirectedGraph.load(tmp_path / 'u.bin', mmap=mmap)
+
+    #adj_list is only built once something needs it
+    assert 'adj_list' not in loaded.__dict__
+    assert sorted(loaded.get_vertices()) == sorted(graph.get_vertices())
+    assert loaded.edge_count() == graph.edge_count()
+    for v in graph.get_vertices():
+        assert loaded.dfs(v) == graph.dfs(v) and loaded.bfs(v) == graph.bfs(v)
+    assert loaded.count_connected_components() == graph.count_connected_components()
+    assert 'adj_list' not in loaded.__dict__
+
+    loaded.add_edge('lonely', 'new')
+    assert 'adj_list' in loaded.__dict__ and loaded.dfs('lonely') == ['lonely', 'new']
+    assert sorted(map(sorted, loaded.get_edges())) == sorted(map(sorted, graph.get_edges() + [['lonely', 'new']]))
+
+
+def test_save_over_the_file_a_graph_was_loaded_from(tmp_path, random_edges):
+    rng = random.Random(3)
+    path = tmp_path / 'g.bin'
+    DirectedGraph(random_edges(rng, 20, 60)).save(path)
+    loaded = DirectedGraph.load(path)
+    expected = str(loaded)
+    loaded.save(path)
+    assert str(loaded) == expected and str(DirectedGraph.load(path)) == expected
+
+    #a still-mapped graph keeps reading the old file after the new one replaces it
+    loaded = DirectedGraph.load(path)
+    other = DirectedGraph([(0, 1, 1)])
+    other.save(path)
+    assert str(loaded) == expected and str(DirectedGraph.load(path)) == str(other)
+
+    upath = tmp_path / 'u.bin'
+    UndirectedGraph(undirected_edges(rng)).save(upath)
+    uloaded = UndirectedGraph.load(upath)
+    edges = sorted(map(sorted, uloaded.get_edges()))
+    uloaded.save(upath)
+    assert sorted(map(sorted, UndirectedGraph.load(upath).get_edges())) == edges
+    assert sorted(os.listdir(tmp_path)) == ['g.bin', 'u.bin']
+
+
+def test_float_weights_are_kept(tmp_path):
+    graph = DirectedGraph([(0, 1, 1.5), (1, 2, 2)])
+    graph.save(tmp_path / 'g.bin')
+    assert DirectedGraph.load(tmp_path / 'g.bin').get_edges() == [(0, 1, 1.5), (1, 2, 2.0)]
+
+
+def test_bad_files_are_rejected(tmp_path):
+    DirectedGraph([(0, 1, 1)]).save(tmp_path / 'd.bin')
+    UndirectedGraph([('A', 'B')]).save(tmp_path / 'u.bin')
+    (tmp_path / 'junk.bin').write_bytes(b'not a graph file at all, honestly')
+    with pytest.raises(ValueError):
+        UndirectedGraph.load(tmp_path / 'd.bin')
+    with pytest.raises(ValueError):
+        DirectedGraph.load(tmp_path / 'u.bin')
+    with pytest.raises(ValueError):
+        read_graph(tmp_path / 'junk.bin')
+    assert DirectedGraph.load(tmp_path / 'd.bin').get_edges() == [(0, 1, 1)]
+
+
+def test_empty_graphs(tmp_path):
+    DirectedGraph().save(tmp_path / 'd.bin')
+    UndirectedGraph().save(tmp_path / 'u.bin')
+    assert DirectedGraph.load(tmp_path / 'd.bin').v_count == 0
+    assert UndirectedGraph.load(tmp_path / 'u.bin').get_vertices() == []
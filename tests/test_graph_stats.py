@@ -0,0 +1,103 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Operation counters and timing histograms from enable_stats()
+
+import threading
+
+from d_graph import DirectedGraph
+from graph_stats import BUCKETS, GraphStats
+from ud_graph import UndirectedGraph
+
+
+def test_directed_counters():
+    graph = DirectedGraph([(0, 1, 4), (0, 2, 1), (2, 1, 1), (1, 3, 1)])
+    stats = graph.enable_stats()
+    assert graph.enable_stats() is stats
+
+    graph.dijkstra(0)
+    counters = graph.get_stats()['counters']
+    #1 is pushed at 4, then lowered to 2 through vertex 2, leaving one stale entry
+    assert counters['vertices_visited'] == 4 and counters['stale_pops'] == 1
+    assert counters['heap_pushes'] == counters['heap_pops'] == 5 and counters['edges_relaxed'] == 4
+
+    stats.reset()
+    assert graph.dfs(0) == [0, 1, 3, 2]
+    counters = graph.get_stats()['counters']
+    assert counters['vertices_visited'] == 4 and counters['neighbor_scans'] == 4
+
+    graph.add_edge(0, 1, 4)
+    assert graph.get_stats()['counters']['duplicate_edges'] == 1
+
+
+def test_undirected_counters():
+    graph = UndirectedGraph([('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')])
+    graph.enable_stats()
+    assert graph.bfs('A') == ['A', 'B', 'C', 'D']
+    counters = graph.get_stats()['counters']
+    assert counters['vertices_visited'] == 4 and counters['neighbor_scans'] == 8
+    graph.add_edge('B', 'A')
+    assert graph.get_stats()['counters']['duplicate_edges'] == 1
+
+
+def test_timings_and_histogram():
+    graph = DirectedGraph([(0, 1, 1), (1, 2, 1)])
+    graph.enable_stats()
+    for _ in range(3):
+        graph.bfs(0)
+    graph.shortest_path(0, 2)
+    graph.k_nearest(0, 1)
+    graph.multi_source_dijkstra([0])
+    timings = graph.get_stats()['timings']
+    assert timings['bfs']['calls'] == 3 and sum(timings['bfs']['buckets'].values()) == 3
+    assert list(timings['bfs']['buckets']) == [str(b) for b in BUCKETS] + ['inf']
+    assert timings['bfs']['max'] <= timings['bfs']['total']
+    for method in ('shortest_path', 'k_nearest', 'multi_source_dijkstra'):
+        assert timings[method]['calls'] == 1
+
+
+def test_nested_calls_are_recorded_once():
+    for graph, batch in ((DirectedGraph([(0, 1, 1), (1, 2, 1)]), [(0, 2, 1), (2, 0, 1), (0, 1, 1)]),
+                         (UndirectedGraph([('A', 'B')]), [('A', 'C'), ('C', 'D'), ('A', 'B')])):
+        calls = []
+        graph.enable_stats(calls.append)
+        graph.add_edges(batch)
+        assert [call['method'] for call in calls] == ['add_edges']
+        assert calls[0]['counters'] == {'duplicate_edges': 1}
+        assert set(graph.get_stats()['timings']) == {'add_edges'}
+
+    graph = DirectedGraph([(0, 1, 1)])
+    calls = []
+    graph.enable_stats(calls.append)
+    graph.try_add_edge(1, 0)
+    graph.add_edge(1, 0)
+    assert [call['method'] for call in calls] == ['try_add_edge', 'add_edge']
+
+
+def test_each_thread_records_its_own_calls():
+    stats = GraphStats()
+    inside, release = threading.Event(), threading.Event()
+
+    def outer():
+        inside.set()
+        release.wait()
+    slow, fast = stats.timed('outer', outer), stats.timed('fast', lambda: None)
+    thread = threading.Thread(target=slow)
+    thread.start()
+    inside.wait()
+    fast()
+    release.set()
+    thread.join()
+    assert set(stats.snapshot()['timings']) == {'outer', 'fast'}
+
+
+def test_disable_stats_removes_the_wrappers():
+    graph = DirectedGraph([(0, 1, 1)])
+    graph.enable_stats()
+    assert 'dfs' in vars(graph)
+    graph.disable_stats()
+    assert graph.get_stats() is None and 'dfs' not in vars(graph)
+    assert graph.dfs(0) == [0, 1]
+    #enabling again starts from zero
+    graph.enable_stats()
+    assert graph.get_stats()['timings'] == {}
@@ -0,0 +1,75 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Interned UndirectedGraph traversals checked against the plain adj_list ones
+
+import interning
+from interning import InternedGraph
+from ud_graph import UndirectedGraph
+
+
+def random_graph(rng, n=12, m=25) -> UndirectedGraph:
+    names = ['v%d' % i for i in range(n)]
+    return UndirectedGraph([(rng.choice(names), rng.choice(names)) for _ in range(m)])
+
+
+def count_rebuilds(monkeypatch) -> []:
+    """
+    Makes every InternedGraph.from_adjacency() call append to the returned list.
+    """
+    calls, build = [], InternedGraph.from_adjacency.__func__
+    def counted(cls, *args):
+        calls.append(args)
+        return build(cls, *args)
+    monkeypatch.setattr(interning.InternedGraph, 'from_adjacency', classmethod(counted))
+    return calls
+
+
+def test_interned_traversals_match_adj_list(rng):
+    graph = random_graph(rng)
+    plain = graph.fork()
+    compact = graph.interned()
+    assert compact.names == sorted(graph.adj_list)
+    for u in graph.get_vertices():
+        v = rng.choice(graph.get_vertices())
+        assert graph.dfs(u) == plain.dfs(u) and graph.bfs(u) == plain.bfs(u)
+        assert graph.dfs(u, v) == plain.dfs(u, v) and graph.bfs(u, v) == plain.bfs(u, v)
+        assert list(graph.iter_dfs(u, max_depth=2)) == list(plain.iter_dfs(u, max_depth=2))
+        assert list(graph.iter_bfs(u, v)) == list(plain.iter_bfs(u, v))
+    assert plain._interned is None and graph._current_interned() is compact
+
+
+def test_an_edit_does_not_rebuild_the_interned_copy(monkeypatch):
+    graph = UndirectedGraph([('A', 'B'), ('B', 'C'), ('C', 'D')])
+    graph.interned()
+    calls = count_rebuilds(monkeypatch)
+
+    graph.add_edge('D', 'E')
+    assert graph.dfs('A', 'A') == ['A']
+    assert graph.dfs('A') == ['A', 'B', 'C', 'D', 'E'] and graph.bfs('E') == ['E', 'D', 'C', 'B', 'A']
+    assert calls == [] and graph._current_interned() is None
+
+    #only an explicit interned() call rebuilds it
+    assert graph.interned().names == ['A', 'B', 'C', 'D', 'E'] and len(calls) == 1
+    assert graph._current_interned() is graph._interned
+
+
+def test_parallel_bfs_does_not_turn_interning_on():
+    graph = UndirectedGraph([('A', 'B'), ('B', 'C'), ('A', 'D')])
+    levels, parents, order = graph.parallel_bfs('A', workers=1, deterministic=True)
+    assert order == graph.bfs('A') and list(levels) == [0, 1, 2, 1]
+    assert graph._interned is None
+
+    #a current copy is reused instead of building another
+    compact = graph.interned()
+    assert graph.parallel_bfs('C', workers=1, deterministic=True)[2] == ['C', 'B', 'A', 'D']
+    assert graph._interned is compact
+
+
+def test_is_path_matches_is_valid_path(rng):
+    graph = random_graph(rng)
+    compact = graph.interned()
+    names = graph.get_vertices() + ['missing']
+    for _ in range(30):
+        path = [rng.choice(names) for _ in range(rng.randrange(1, 4))]
+        assert compact.is_path(path) == graph.is_valid_path(path)
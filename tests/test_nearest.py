@@ -0,0 +1,51 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: multi_source_dijkstra() and k_nearest() checked against plain dijkstra()
+
+from d_graph import DirectedGraph
+
+INFINITY = float('inf')
+
+
+def bounded(distances, max_distance) -> []:
+    if max_distance is None:
+        return distances
+    return [d if d <= max_distance else INFINITY for d in distances]
+
+
+def test_multi_source_matches_dijkstra(rng, random_edges):
+    n = rng.randint(2, 25)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 3 * n)), 'dict', n)
+    sources = rng.sample(range(n), rng.randint(1, min(4, n)))
+    from_source = {s: graph.dijkstra(s) for s in sources}
+
+    for max_distance in (None, 0, 3, 7):
+        distances, nearest = graph.multi_source_dijkstra(sources + [-1, n], max_distance)
+        expected = bounded([min(from_source[s][v] for s in sources) for v in range(n)], max_distance)
+        assert distances == expected
+        for v in range(n):
+            if distances[v] == INFINITY:
+                assert nearest[v] == -1
+            else:
+                assert nearest[v] in sources and from_source[nearest[v]][v] == distances[v]
+
+
+def test_k_nearest_matches_dijkstra(rng, random_edges):
+    n = rng.randint(2, 25)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 3 * n)), 'dict', n)
+
+    for src in range(n):
+        distances = graph.dijkstra(src)
+        for max_distance in (None, 4):
+            ranked = sorted((d, v) for v, d in enumerate(bounded(distances, max_distance))
+                            if v != src and d != INFINITY)
+            for k in (0, 1, 3, n):
+                assert graph.k_nearest(src, k, max_distance) == [(v, d) for d, v in ranked[:k]]
+
+
+def test_unknown_sources():
+    graph = DirectedGraph([(0, 1, 3)])
+    assert graph.k_nearest(5, 2) == [] and graph.k_nearest(-1, 2) == []
+    assert graph.multi_source_dijkstra([]) == ([INFINITY, INFINITY], [-1, -1])
+    assert graph.multi_source_dijkstra([9, 1]) == ([INFINITY, 0], [-1, 1])
@@ -0,0 +1,76 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: numpy matrix storage and its batch operations checked against dict storage
+
+import pytest
+
+from d_graph import DirectedGraph
+
+numpy = pytest.importorskip('numpy')
+
+
+def pair(edges, n) -> tuple:
+    plain = DirectedGraph.from_edges(edges, 'dict', n)
+    packed = DirectedGraph.from_edges(edges, 'numpy', n)
+    return plain, packed
+
+
+def test_batches_match_one_edge_at_a_time(rng, random_edges):
+    n = rng.randint(2, 12)
+    plain, packed = pair(random_edges(rng, n, n), n)
+
+    for _ in range(5):
+        rows = [(rng.randint(-1, n), rng.randint(-1, n), rng.randint(-1, 9)) for _ in range(8)]
+        plain.add_edges(rows)
+        packed.add_edges(numpy.array(rows))
+        pairs = [(rng.randint(-1, n), rng.randint(-1, n)) for _ in range(4)]
+        plain.remove_edges(pairs)
+        packed.remove_edges(numpy.array(pairs))
+
+        assert packed.get_edges() == plain.get_edges()
+        assert packed.dijkstra(0) == plain.dijkstra(0)
+        assert str(packed) == str(plain)
+
+
+def test_fractional_vertex_ids_are_ignored_like_add_edge():
+    plain, packed = pair([(1, 2, 3)], 4)
+    rows = [(0.6, 2, 7), (1, 2.5, 7), (float('nan'), 1, 1), (float('inf'), 1, 1), (3, 0, 2)]
+    for graph in (plain, packed):
+        graph.add_edges(rows)
+        graph.remove_edges([(1.9, 2)])
+    assert packed.get_edges() == plain.get_edges() == [(1, 2, 3), (3, 0, 2)]
+
+    # a numeric array with fractional weights holds its ids as floats, so whole ones count
+    packed.add_edges(numpy.array([[2.0, 0.0, 1.5]]))
+    packed.remove_edges(numpy.array([[1.0, 2.0]]))
+    assert packed.get_edges() == [(2, 0, 1.5), (3, 0, 2)]
+
+
+def test_dtype_is_picked_from_the_weights():
+    graph = DirectedGraph([(0, 1, 2), (1, 2, 3)])
+    graph.set_storage('numpy')
+    assert graph._store().dtype == numpy.int32
+
+    graph = DirectedGraph([(0, 1, 0.5), (1, 2, 1)])
+    graph.set_storage('numpy')
+    assert graph._store().dtype == numpy.float64
+    assert graph.get_edges() == [(0, 1, 0.5), (1, 2, 1)]
+    assert graph.dfs(0) == [0, 1, 2]
+
+
+@pytest.mark.parametrize('weight, dtype', ((3 * 10 ** 9, numpy.int64), (1.5, numpy.float64),
+                                           (2 ** 70, numpy.float64)))
+def test_weights_that_do_not_fit_widen_the_array(weight, dtype):
+    for add in (lambda g: g.add_edge(1, 2, weight), lambda g: g.add_edges([(1, 2, weight)])):
+        graph = DirectedGraph.from_edges([(0, 1, 1)], 'numpy', 3)
+        add(graph)
+        assert graph._store().dtype == dtype
+        assert graph._store().weight(1, 2) == weight
+        assert graph._store().weight(0, 1) == 1
+
+
+def test_mixed_rows_fall_back_to_add_edge():
+    graph = DirectedGraph.from_edges([], 'numpy', 3)
+    graph.add_edges([(0, 'x', 1), (0, 1, 2), (None, 1, 1)])
+    assert graph.get_edges() == [(0, 1, 2)]
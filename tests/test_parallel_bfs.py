@@ -0,0 +1,75 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Chunked, multi-process BFS levels checked against the plain bfs()
+
+import random
+
+import pytest
+
+from d_graph import DirectedGraph
+from graph_storage import CSRStorage
+from parallel_bfs import level_bfs
+from ud_graph import UndirectedGraph
+
+
+def plain_levels(graph, src) -> []:
+    levels = [-1] * graph.v_count
+    levels[src] = 0
+    for v, depth in graph.iter_bfs(src):
+        levels[v] = depth
+    return levels
+
+
+def check(graph, src, levels, parents, order):
+    store = graph._store()
+    assert list(levels) == plain_levels(graph, src)
+    assert sorted(order) == sorted(v for v in range(graph.v_count) if levels[v] != -1)
+    assert [levels[v] for v in order] == sorted(levels[v] for v in order)
+    for v in order:
+        if v != src:
+            assert levels[parents[v]] == levels[v] - 1
+            assert store.weight(parents[v], v) != 0
+
+
+# a worker pool per seed is slow, so this one runs on a few seeds only
+@pytest.mark.parametrize('seed', range(4))
+def test_chunks_merge_like_a_single_process(seed, random_edges):
+    rng, n = random.Random(seed), 300
+    graph = DirectedGraph.from_edges(random_edges(rng, n, 4 * n), 'dict', n)
+    csr = CSRStorage.from_storage(graph._store())
+    reverse = csr.transpose()
+
+    # tiny chunks push every level through the pool and the merge
+    for direction_optimizing in (False, True):
+        result = level_bfs(csr, 0, reverse, 2, direction_optimizing, chunk_size=16)
+        check(graph, 0, *result)
+
+    levels, parents, order = level_bfs(csr, 0, reverse, 2, deterministic=True, chunk_size=16)
+    assert list(order) == graph.bfs(0)
+    assert (levels, parents, order) == level_bfs(csr, 0, reverse, 1, deterministic=True)
+
+
+def test_direction_switching_in_process(rng, random_edges):
+    n = rng.randint(1, 60)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 6 * n)), 'dict', n)
+    src = rng.randrange(n)
+    check(graph, src, *graph.parallel_bfs(src, workers=1))
+    assert list(graph.parallel_bfs(src, workers=1, deterministic=True)[2]) == graph.bfs(src)
+
+
+def test_undirected_levels_match_bfs(rng):
+    names = ['v%d' % i for i in range(30)]
+    graph = UndirectedGraph([(rng.choice(names), rng.choice(names)) for _ in range(40)])
+    src = rng.choice(graph.get_vertices())
+    levels, parents, order = graph.parallel_bfs(src, workers=1, deterministic=True)
+    assert order == graph.bfs(src)
+
+    ids = {name: i for i, name in enumerate(sorted(graph.adj_list))}
+    depth = dict(graph.iter_bfs(src))
+    for name, i in ids.items():
+        assert levels[i] == depth.get(name, -1)
+        if name in depth and name != src:
+            parent = sorted(graph.adj_list)[parents[i]]
+            assert depth[parent] == depth[name] - 1 and name in graph.adj_list[parent]
+    assert graph.parallel_bfs('missing', workers=1)[2] == []
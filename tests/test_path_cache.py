@@ -0,0 +1,73 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Shortest-path cache checked against an uncached graph
+
+from array import array
+
+from d_graph import DirectedGraph
+from path_cache import ShortestPathCache, entry_size
+
+
+def test_cached_results_follow_every_change(rng, random_edges):
+    n = 15
+    edges = random_edges(rng, n, 2 * n, max_weight=9)
+    cached = DirectedGraph.from_edges(edges, 'dict', n)
+    cached.enable_path_cache()
+    fresh = DirectedGraph.from_edges(edges, 'dict', n)
+    sources = range(0, n, 3)
+
+    for _ in range(25):
+        for src in sources:
+            cached.dijkstra(src)
+
+        # new edges and lower weights are repaired in place, anything else drops the cache
+        u, v = rng.randrange(n), rng.randrange(n)
+        weight = rng.randint(0, 9)
+        old_weight = cached._store().weight(u, v)
+        for graph in (cached, fresh):
+            if weight:
+                graph.add_edge(u, v, weight)
+            else:
+                graph.remove_edge(u, v)
+        if u != v and 0 < weight and (old_weight == 0 or weight < old_weight):
+            assert len(cached._path_cache) == len(sources)
+
+        if rng.random() < 0.1:
+            cached.add_vertex()
+            fresh.add_vertex()
+            n += 1
+
+        for src in sources:
+            assert cached.dijkstra(src) == fresh.dijkstra(src)
+            assert cached.shortest_path(src, v)[0] == fresh.dijkstra(src)[v]
+
+
+def test_least_recently_used_results_go_first():
+    cache = ShortestPathCache(max_entries=2)
+    for src in (0, 1):
+        cache.put(src, 0, [0.0], array('q', [-1]))
+    assert cache.get(0, 0) is not None
+    cache.put(2, 0, [0.0], array('q', [-1]))
+    assert cache.get(1, 0) is None
+    assert cache.get(0, 0) is not None and cache.get(2, 0) is not None
+
+
+def test_byte_budget_counts_the_distances():
+    distances, previous = [1.5] * 100, array('q', [0]) * 100
+    size = entry_size(distances, previous)
+    assert size >= 100 * (8 + previous.itemsize)
+
+    cache = ShortestPathCache(max_bytes=2 * size)
+    for src in range(3):
+        cache.put(src, 0, list(distances), array('q', previous))
+    assert len(cache) == 2 and cache.bytes_used <= 2 * size
+    # a result bigger than the whole budget is not kept at all
+    cache.put(9, 0, distances * 3, array('q', previous) * 3)
+    assert cache.get(9, 0) is None
+
+
+def test_a_version_mismatch_drops_everything():
+    cache = ShortestPathCache()
+    cache.put(0, 3, [0], array('q', [-1]))
+    assert cache.get(0, 4) is None and len(cache) == 0
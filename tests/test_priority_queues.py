@@ -0,0 +1,64 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Dijkstra's priority queues checked against heapq and against each other
+
+import heapq
+
+import pytest
+
+from d_graph import DirectedGraph
+from priority_queues import BucketQueue, IndexedMinHeap, LazyHeap
+
+
+def test_indexed_heap_keeps_the_lowest_key_per_vertex(rng):
+    n = 30
+    heap = IndexedMinHeap(n)
+    best = {}
+    for _ in range(200):
+        if best and rng.random() < 0.3:
+            key, v = heap.pop()
+            assert key == min(best.values()) and best.pop(v) == key
+        else:
+            v, key = rng.randrange(n), rng.randint(0, 50)
+            heap.push(v, key)
+            best[v] = min(key, best.get(v, key))
+        assert len(heap) == len(best) <= n
+        assert all(v in heap for v in best)
+
+
+@pytest.mark.parametrize('queue_class', (LazyHeap, lambda: BucketQueue(7)))
+def test_queues_pop_in_dijkstra_order(rng, queue_class):
+    # pushes are never below the last pop and at most max_weight above it, like in Dijkstra
+    queue, reference = queue_class(), []
+    last = 0
+    for _ in range(300):
+        if reference and rng.random() < 0.4:
+            key, _ = queue.pop()
+            assert key == heapq.heappop(reference)[0]
+            assert key >= last
+            last = key
+        else:
+            key = last + rng.randint(0, 7)
+            v = rng.randrange(100)
+            queue.push(v, key)
+            heapq.heappush(reference, (key, v))
+        assert len(queue) == len(reference)
+        assert queue.is_empty() == (not reference)
+
+
+def test_every_queue_gives_the_same_distances(rng, random_edges):
+    n = rng.randint(1, 25)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 3 * n), 9), 'dict', n)
+    for src in range(n):
+        expected = graph.dijkstra(src)
+        assert graph.dijkstra(src, 'indexed') == expected
+        assert graph.dijkstra(src, 'buckets') == expected
+
+
+def test_queue_errors():
+    graph = DirectedGraph([(0, 1, 1.5)])
+    with pytest.raises(ValueError):
+        graph.dijkstra(0, 'buckets')
+    with pytest.raises(ValueError):
+        graph.dijkstra(0, 'fibonacci')
@@ -0,0 +1,40 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Reachability index checked against one DFS per vertex
+
+import pytest
+
+from d_graph import DirectedGraph
+from reachability import ReachabilityIndex
+
+
+def test_reachable_follows_every_change(rng, random_edges, reachable_sets):
+    n = rng.randint(2, 15)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, n), 'dict', n)
+    for _ in range(10):
+        reach = reachable_sets(graph)
+        pairs = [(rng.randint(-1, n), rng.randint(-1, n)) for _ in range(30)]
+        expected = [0 <= u < n and 0 <= v < n and v in reach[u] for u, v in pairs]
+        assert [graph.reachable(u, v) for u, v in pairs] == expected
+        assert graph.reachable_many(pairs) == expected
+
+        u, v = rng.randrange(n), rng.randrange(n)
+        if rng.random() < 0.7:
+            graph.add_edge(u, v)
+        else:
+            graph.remove_edge(u, v)
+
+
+@pytest.mark.parametrize('max_bitset', (0, 10 ** 6))
+def test_interval_labels_answer_like_bitsets(rng, random_edges, reachable_sets, max_bitset):
+    n = rng.randint(2, 25)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, 2 * n), 'dict', n)
+    component, dag = graph.condensation()
+    # max_bitset 0 forces interval labels with the bounded DFS fallback
+    index = ReachabilityIndex(component, dag, 0, max_bitset)
+    assert (index.bits is None) == (max_bitset == 0)
+    reach = reachable_sets(graph)
+    for u in range(n):
+        for v in range(n):
+            assert index.reachable(u, v) == (v in reach[u])
@@ -0,0 +1,54 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Point-to-point searches checked against plain dijkstra()
+
+from d_graph import DirectedGraph
+
+INFINITY = float('inf')
+
+
+def path_weight(graph, path) -> int:
+    store = graph._store()
+    return sum(store.weight(u, v) for u, v in zip(path, path[1:]))
+
+
+def check_answer(graph, src, dst, answer, distances):
+    distance, path = answer
+    assert distance == distances[dst]
+    if distance == INFINITY:
+        assert path == []
+    else:
+        assert path[0] == src and path[-1] == dst
+        assert path_weight(graph, path) == distance
+
+
+def test_bidirectional_matches_dijkstra(rng, random_edges):
+    n = rng.randint(2, 25)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 3 * n)), 'dict', n)
+
+    for src in range(n):
+        distances = graph.dijkstra(src)
+        for dst in range(n):
+            check_answer(graph, src, dst, graph.shortest_path(src, dst), distances)
+
+
+def test_astar_matches_dijkstra(rng, random_edges):
+    n = rng.randint(2, 20)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 3 * n)), 'dict', n)
+
+    for dst in range(n):
+        # exact distances to DST are the tightest admissible heuristic, zero the loosest
+        reverse = DirectedGraph.from_edges([(v, u, w) for u, v, w in graph.get_edges()], 'dict', n)
+        to_dst = reverse.dijkstra(dst)
+        for heuristic in (lambda v: 0, lambda v: to_dst[v] if to_dst[v] != INFINITY else 0):
+            for src in range(n):
+                check_answer(graph, src, dst, graph.shortest_path(src, dst, heuristic),
+                             graph.dijkstra(src))
+
+
+def test_unknown_vertices():
+    graph = DirectedGraph([(0, 1, 3)])
+    assert graph.shortest_path(0, 7) == (INFINITY, [])
+    assert graph.shortest_path(-1, 1) == (INFINITY, [])
+    assert graph.shortest_path(1, 1) == (0, [1])
@@ -0,0 +1,74 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Storage backends of DirectedGraph checked against the dense matrix
+
+import pytest
+
+from d_graph import DirectedGraph
+
+KINDS = ('dense', 'dict', 'csr')
+
+
+def answers(graph) -> tuple:
+    n = graph.v_count
+    return (str(graph), graph.get_edges(), [graph.dfs(v) for v in range(n)],
+            [graph.bfs(v) for v in range(n)], [graph.dijkstra(v) for v in range(n)],
+            graph.has_cycle())
+
+
+@pytest.mark.parametrize('kind', KINDS[1:])
+def test_backends_answer_like_the_dense_matrix(rng, random_edges, kind):
+    n = rng.randint(1, 12)
+    edges = random_edges(rng, n, rng.randint(0, 3 * n))
+    dense = DirectedGraph(edges)
+    other = DirectedGraph(edges)
+    other.set_storage(kind)
+    assert other.get_storage() == kind
+    assert answers(other) == answers(dense)
+
+    for _ in range(10):
+        u, v, w = rng.randrange(dense.v_count + 1), rng.randrange(dense.v_count + 1), rng.randint(0, 3)
+        for graph in (dense, other):
+            if w:
+                graph.add_edge(u, v, w)
+            else:
+                graph.remove_edge(u, v)
+    assert answers(other) == answers(dense)
+
+
+def test_conversions_round_trip(rng, random_edges):
+    edges = random_edges(rng, 10, 25)
+    graph = DirectedGraph(edges)
+    expected = answers(graph)
+    for kind in KINDS[1:] + KINDS:
+        graph.set_storage(kind)
+        assert graph.get_storage() == kind
+        assert answers(graph) == expected
+
+
+def test_csr_thaws_to_dict_on_the_first_change():
+    graph = DirectedGraph([(0, 1, 3), (1, 2, 4)])
+    graph.set_storage('csr')
+    graph.add_edge(2, 0, 5)
+    assert graph.get_storage() == 'dict'
+    assert graph.get_edges() == [(0, 1, 3), (1, 2, 4), (2, 0, 5)]
+
+
+def test_dense_adj_matrix_is_the_live_matrix():
+    graph = DirectedGraph([(0, 1, 3)])
+    graph.adj_matrix[1][0] = 7
+    assert graph.get_edges() == [(0, 1, 3), (1, 0, 7)]
+
+
+@pytest.mark.parametrize('kind', KINDS[1:])
+def test_sparse_adj_matrix_rejects_writes(kind):
+    graph = DirectedGraph([(0, 1, 3), (1, 2, 4)])
+    graph.set_storage(kind)
+    assert list(graph.adj_matrix[0]) == [0, 3, 0]
+    assert [list(row) for row in graph.adj_matrix] == [[0, 3, 0], [0, 0, 4], [0, 0, 0]]
+    with pytest.raises(TypeError):
+        graph.adj_matrix[0][2] = 9
+    with pytest.raises(TypeError):
+        graph.adj_matrix[0] = [0, 0, 9]
+    assert graph.get_edges() == [(0, 1, 3), (1, 2, 4)]
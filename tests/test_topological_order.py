@@ -0,0 +1,77 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Pearce-Kelly online order checked against full recomputation
+
+import topological_order
+from d_graph import DirectedGraph
+from topological_order import kahn_order
+
+
+def assert_valid_order(graph, order):
+    position = {v: i for i, v in enumerate(order)}
+    assert sorted(order) == list(range(graph.v_count))
+    for src, dst, _ in graph.get_edges():
+        assert position[src] < position[dst]
+
+
+def test_order_matches_recomputation(rng):
+    n = 12
+    online = DirectedGraph.from_edges([], 'dict', n)
+    online.enable_topological_order()
+    plain = DirectedGraph.from_edges([], 'dict', n)
+
+    for _ in range(60):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if rng.random() < 0.8:
+            online.add_edge(u, v, 1)
+            plain.add_edge(u, v, 1)
+        else:
+            online.remove_edge(u, v)
+            plain.remove_edge(u, v)
+
+        assert online.has_cycle() == plain.has_cycle()
+        order = online.topological_sort()
+        if order is None:
+            assert kahn_order(n, plain._store().successors) is None
+        else:
+            assert_valid_order(online, order)
+
+        a, b = rng.randrange(n), rng.randrange(n)
+        assert online.would_create_cycle(a, b) == plain.would_create_cycle(a, b)
+
+
+def test_try_add_edge_refuses_cycles_without_rebuilding(rng, reachable_sets, monkeypatch):
+    n = 10
+    graph = DirectedGraph.from_edges([], 'dict', n)
+    graph.enable_topological_order()
+    rebuilds = []
+    monkeypatch.setattr(topological_order, 'kahn_order',
+                        lambda *args: rebuilds.append(args) or kahn_order(*args))
+
+    for _ in range(50):
+        u, v = rng.randrange(n), rng.randrange(n)
+        before = graph.get_edges()
+        closes = u != v and graph._store().weight(u, v) == 0 and u in reachable_sets(graph)[v]
+
+        added = graph.try_add_edge(u, v, 2)
+
+        assert added == (u != v and not closes)
+        if not added:
+            assert graph.get_edges() == before
+        assert not graph.has_cycle()
+        assert_valid_order(graph, graph.topological_sort())
+    assert rebuilds == []
+
+
+def test_bulk_edits_and_new_vertices_keep_the_order_valid():
+    graph = DirectedGraph.from_edges([], 'dict', 6)
+    graph.enable_topological_order()
+    graph.add_edges([(0, 1, 1), (1, 2, 1)])
+    graph.add_vertices(3)
+    graph.add_edge(8, 0)
+    assert_valid_order(graph, graph.topological_sort())
+    graph.add_edge(2, 8)
+    assert graph.has_cycle() and graph.topological_sort() is None
+    graph.remove_edge(2, 8)
+    assert not graph.has_cycle()
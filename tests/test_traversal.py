@@ -0,0 +1,169 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Iterative traversal engine checked against textbook recursive and queue versions
+
+import sys
+from collections import deque
+
+import pytest
+
+from d_graph import DirectedGraph
+from graph_traversal import VisitedBits, iter_bfs, iter_dfs
+from ud_graph import UndirectedGraph
+
+
+def recursive_dfs(successors, v_start, v_end=None) -> []:
+    order = []
+
+    def visit(u) -> bool:
+        order.append(u)
+        if u == v_end:
+            return True
+        return any(visit(v) for v in successors(u) if v not in order)
+    visit(v_start)
+    return order
+
+
+def queue_bfs(successors, v_start, v_end=None) -> []:
+    order = [v_start]
+    queue = deque([v_start])
+    while queue and v_end not in order:
+        for v in successors(queue.popleft()):
+            if v not in order:
+                order.append(v)
+                queue.append(v)
+                if v == v_end:
+                    break
+    return order
+
+
+def directed(rng, random_edges) -> DirectedGraph:
+    n = rng.randint(2, 15)
+    return DirectedGraph.from_edges(random_edges(rng, n, rng.randint(0, 3 * n)), 'dict', n)
+
+
+def undirected(rng) -> UndirectedGraph:
+    names = [chr(ord('A') + i) for i in range(rng.randint(2, 12))]
+    return UndirectedGraph([(rng.choice(names), rng.choice(names)) for _ in range(2 * len(names))])
+
+
+def test_directed_orders_match_the_recursive_versions(rng, random_edges):
+    graph = directed(rng, random_edges)
+    successors = graph._store().successors
+    for src in range(graph.v_count):
+        end = rng.choice([None, rng.randrange(graph.v_count)])
+        assert graph.dfs(src, end) == recursive_dfs(successors, src, end)
+        assert graph.bfs(src, end) == queue_bfs(successors, src, end)
+
+
+def test_undirected_orders_match_the_recursive_versions(rng):
+    graph = undirected(rng)
+    successors = lambda u: sorted(graph.adj_list[u])
+    for src in graph.get_vertices():
+        end = rng.choice([None, 'nope'] + graph.get_vertices())
+        assert graph.dfs(src, end) == recursive_dfs(successors, src, end)
+        assert graph.bfs(src, end) == queue_bfs(successors, src, end)
+
+
+def test_missing_start_gives_nothing():
+    assert DirectedGraph([(0, 1, 1)]).dfs(5) == []
+    assert UndirectedGraph(['AB']).bfs('Z') == []
+
+
+@pytest.mark.parametrize('cycle', (False, True))
+def test_long_paths_do_not_recurse(cycle):
+    n = sys.getrecursionlimit() * 5
+    edges = [(v, v + 1, 1) for v in range(n - 1)] + ([(n - 1, 0, 1)] if cycle else [])
+    graph = DirectedGraph.from_edges(edges, 'dict', n)
+    assert graph.dfs(0) == list(range(n))
+    assert graph.bfs(0) == list(range(n))
+    assert graph.has_cycle() == cycle
+
+    chain = UndirectedGraph([(f'v{v:06}', f'v{v + 1:06}') for v in range(n - 1)])
+    assert len(chain.dfs('v000000')) == n
+    assert not chain.has_cycle()
+
+
+def test_visited_bits_behaves_like_a_set(rng):
+    bits, reference = VisitedBits(50), set()
+    for _ in range(100):
+        v = rng.randrange(50)
+        assert (v in bits) == (v in reference)
+        bits.add(v)
+        reference.add(v)
+    assert all((v in bits) == (v in reference) for v in range(50))
+
+
+@pytest.mark.parametrize('search', (iter_dfs, iter_bfs))
+def test_each_vertex_is_expanded_once(rng, random_edges, search):
+    graph = directed(rng, random_edges)
+    store = graph._store()
+    expanded = []
+
+    def successors(u):
+        expanded.append(u)
+        return store.successors(u)
+
+    reached = [v for v, _ in search(0, successors, VisitedBits(graph.v_count))]
+    assert len(reached) == len(set(reached))
+    assert sorted(expanded) == sorted(reached)
+
+
+def test_bfs_depth_is_the_hop_distance(rng, random_edges):
+    graph = directed(rng, random_edges)
+    hops = {0: 0}
+    queue = deque([0])
+    while queue:
+        u = queue.popleft()
+        for v in graph._store().successors(u):
+            if v not in hops:
+                hops[v] = hops[u] + 1
+                queue.append(v)
+    assert dict(graph.iter_bfs(0)) == hops
+
+
+def test_iterators_list_the_same_vertices_as_the_searches(rng, random_edges):
+    graph = directed(rng, random_edges)
+    other = undirected(rng)
+    for g, start in ((graph, 0), (other, other.get_vertices()[0])):
+        assert [v for v, _ in g.iter_dfs(start)] == g.dfs(start)
+        assert [v for v, _ in g.iter_bfs(start)] == g.bfs(start)
+
+
+@pytest.mark.parametrize('method', ('iter_dfs', 'iter_bfs'))
+def test_iterators_are_lazy(method):
+    n = 10000
+    graph = DirectedGraph.from_edges([(v, v + 1, 1) for v in range(n - 1)], 'dict', n)
+    store = graph._store()
+    calls = []
+    original = store.successors
+    store.successors = lambda u: calls.append(u) or original(u)
+
+    found = getattr(graph, method)(0)
+    assert [next(found) for _ in range(3)] == [(0, 0), (1, 1), (2, 2)]
+    assert len(calls) <= 3
+
+
+@pytest.mark.parametrize('method', ('iter_dfs', 'iter_bfs'))
+def test_cutoffs(rng, random_edges, method):
+    graph = directed(rng, random_edges)
+    full = list(getattr(graph, method)(0))
+    end = rng.randrange(graph.v_count)
+    order = [v for v, _ in full]
+
+    # V_END stops right after it is reached
+    stopped = [v for v, _ in getattr(graph, method)(0, end)]
+    assert stopped == (order[:order.index(end) + 1] if end in order else order)
+
+    # MAX_DEPTH keeps every vertex within that many edges and expands none beyond it
+    limited = list(getattr(graph, method)(0, max_depth=1))
+    assert all(depth <= 1 for _, depth in limited)
+    assert {v for v, _ in limited} == {0} | set(graph._store().successors(0))
+
+    # vertices failing PREDICATE are neither yielded nor explored through
+    banned = set(rng.sample(range(1, graph.v_count), rng.randint(0, graph.v_count - 1)))
+    kept = [v for v, _ in getattr(graph, method)(0, predicate=lambda v: v not in banned)]
+    pruned = DirectedGraph.from_edges([(u, v, w) for u, v, w in graph.get_edges()
+                                       if u not in banned and v not in banned], 'dict', graph.v_count)
+    assert kept == [v for v, _ in getattr(pruned, method)(0)]
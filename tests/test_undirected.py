@@ -0,0 +1,104 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: UndirectedGraph edge operations checked against a plain set of edges
+
+from graph_storage import NeighborSet
+from ud_graph import UndirectedGraph
+
+NAMES = [chr(ord('A') + i) for i in range(8)]
+
+
+def random_changes(rng, graph, model, steps=60):
+    """
+    Applies random changes to GRAPH and to MODEL, a (vertices, edges) pair of sets with each
+    edge as a frozenset, checking after every step that the two agree.
+    """
+    vertices, edges = model
+    for _ in range(steps):
+        u, v = rng.choice(NAMES), rng.choice(NAMES)
+        r = rng.random()
+        if r < 0.5:
+            graph.add_edge(u, v)
+            if u != v:
+                vertices.update((u, v))
+                edges.add(frozenset((u, v)))
+        elif r < 0.8:
+            graph.remove_edge(u, v)
+            edges.discard(frozenset((u, v)))
+        elif r < 0.9:
+            graph.add_vertex(u)
+            vertices.add(u)
+        else:
+            graph.remove_vertex(u)
+            vertices.discard(u)
+            edges -= {e for e in edges if u in e}
+        yield
+
+
+def test_edge_operations_match_a_set_of_edges(rng):
+    graph, model = UndirectedGraph(), (set(), set())
+    for _ in random_changes(rng, graph, model):
+        vertices, edges = model
+        assert set(graph.get_vertices()) == vertices
+        for u in vertices:
+            assert set(graph.adj_list[u]) == {w for e in edges if u in e for w in e - {u}}
+        u, v = rng.choice(NAMES), rng.choice(NAMES)
+        assert graph.is_valid_path([u, v]) == (frozenset((u, v)) in edges)
+
+
+def test_neighbor_set_behaves_like_the_old_list():
+    neighbors = NeighborSet('CAB')
+    assert neighbors == ['C', 'A', 'B'] and repr(neighbors) == "['C', 'A', 'B']"
+    assert neighbors.add('D') and not neighbors.add('A')
+    assert neighbors.discard('C') and not neighbors.discard('Z')
+    assert list(neighbors) == ['A', 'B', 'D'] and len(neighbors) == 3
+    assert neighbors.sorted() == ['A', 'B', 'D']
+    neighbors.add('0')
+    assert neighbors.sorted() == ['0', 'A', 'B', 'D']
+
+
+def test_printing_is_unchanged():
+    graph = UndirectedGraph(['AB', 'AC', 'BC'])
+    assert str(graph) == "GRAPH: {A: ['B', 'C'], B: ['A', 'C'], C: ['A', 'B']}"
+
+
+def test_edges_are_listed_once_and_counted_in_constant_time(rng):
+    graph, model = UndirectedGraph(), (set(), set())
+    for _ in random_changes(rng, graph, model):
+        edges = model[1]
+        listed = graph.get_edges()
+        assert len(listed) == len(edges) == graph.edge_count()
+        assert {frozenset(e) for e in listed} == edges
+        assert list(graph.iter_edges()) == listed
+
+
+def components(vertices, edges) -> []:
+    """
+    Connected components of the model by repeated flood fill.
+    """
+    left, found = set(vertices), []
+    while left:
+        part, frontier = set(), [left.pop()]
+        while frontier:
+            u = frontier.pop()
+            part.add(u)
+            for e in edges:
+                if u in e:
+                    frontier.extend(w for w in e if w not in part and w in left)
+                    left -= e
+        found.append(part)
+    return found
+
+
+def test_components_follow_every_change(rng):
+    graph, model = UndirectedGraph(), (set(), set())
+    for _ in random_changes(rng, graph, model):
+        vertices, edges = model
+        parts = components(vertices, edges)
+        assert graph.count_connected_components() == len(parts)
+        assert graph.has_cycle() == (len(edges) > len(vertices) - len(parts))
+        u, v = rng.choice(NAMES), rng.choice(NAMES)
+        connected = any(u in part and v in part for part in parts)
+        assert graph.same_component(u, v) == graph.reachable(u, v) == connected
+        assert graph.reachable_many([(u, v), (v, u)]) == [connected, connected]
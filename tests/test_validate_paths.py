@@ -0,0 +1,60 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Batch validate_paths() checked against is_valid_path() one path at a time
+
+import random
+
+import pytest
+
+from d_graph import DirectedGraph
+from ud_graph import UndirectedGraph
+
+
+def flat(paths) -> tuple:
+    values, offsets = [], [0]
+    for path in paths:
+        values.extend(path)
+        offsets.append(len(values))
+    return values, offsets
+
+
+def directed_paths(rng, n) -> []:
+    odd = [-1, n, 1.5, 2.0, None, 'a', True]
+    return [[rng.choice(odd) if rng.random() < 0.05 else rng.randrange(n)
+             for _ in range(rng.randint(0, 4))] for _ in range(40)]
+
+
+@pytest.mark.parametrize('kind', ('dense', 'dict', 'csr', 'numpy'))
+def test_directed_batches_match_is_valid_path(rng, random_edges, kind):
+    if kind == 'numpy':
+        pytest.importorskip('numpy')
+    n = rng.randint(2, 10)
+    graph = DirectedGraph.from_edges(random_edges(rng, n, 3 * n), kind, n)
+    paths = directed_paths(rng, n)
+    expected = bytearray(graph.is_valid_path(path) for path in paths)
+
+    assert graph.validate_paths(paths) == expected
+    assert graph.validate_paths(*flat(paths)) == expected
+
+
+def test_undirected_batches_match_is_valid_path(rng):
+    names = 'ABCDEFG'
+    graph = UndirectedGraph([(rng.choice(names), rng.choice(names)) for _ in range(10)])
+    paths = [[rng.choice(names + 'Z') for _ in range(rng.randint(0, 4))] for _ in range(40)]
+    expected = bytearray(graph.is_valid_path(path) for path in paths)
+
+    assert graph.validate_paths(paths) == expected
+    assert graph.validate_paths(*flat(paths)) == expected
+
+
+def test_worker_processes_give_the_same_answers(random_edges):
+    # one seed only: every run starts a process pool
+    rng = random.Random(4)
+    graph = DirectedGraph.from_edges(random_edges(rng, 30, 90), 'dict', 30)
+    paths = directed_paths(rng, 30) * 50
+    assert graph.validate_paths(paths, workers=2) == graph.validate_paths(paths)
+
+    other = UndirectedGraph([(f'v{u}', f'v{v}') for u, v, _ in graph.get_edges()])
+    named = [[f'v{v}' for v in path if isinstance(v, int)] for path in paths]
+    assert other.validate_paths(named, workers=2) == other.validate_paths(named)
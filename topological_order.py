@@ -0,0 +1,172 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Topological order of a directed graph, maintained as edges are added (Pearce-Kelly)
+
+from array import array
+from collections import deque
+
+
+def kahn_order(v_count: int, successors):
+    """
+    This function returns the vertices 0 .. V_COUNT - 1 in topological order using Kahn's
+    algorithm, or None if the graph has a cycle. Ties are broken by smallest vertex first.
+    """
+    in_degree = array('q', [0]) * v_count
+    for u in range(v_count):
+        for v in successors(u):
+            in_degree[v] += 1
+
+    ready = deque(v for v in range(v_count) if in_degree[v] == 0)
+    order = []
+    while ready:
+        u = ready.popleft()
+        order.append(u)
+        for v in successors(u):
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                ready.append(v)
+
+    if len(order) < v_count:
+        return None
+    return order
+
+
+class DynamicTopologicalOrder:
+    """
+    Topological order kept valid while edges are added, using the Pearce-Kelly algorithm
+    - order[i] is the vertex at position i, index[v] is the position of vertex v
+    - an edge u -> v that already points forward (index[u] < index[v]) costs O(1)
+    - a backward edge only reorders the vertices between v and u that are affected by it
+    - cyclic is True once the graph has a cycle; there is no valid order then, and after
+      an edge removal stale is set so the next query checks the whole graph again
+    """
+
+    def __init__(self, v_count: int, successors, predecessors):
+        self.successors = successors
+        self.predecessors = predecessors
+        self.order = []
+        self.index = array('q')
+        self.cyclic = False
+        self.stale = False
+        self.rebuild(v_count)
+
+    def rebuild(self, v_count: int) -> None:
+        """
+        This method recomputes the order from scratch in O(V + E).
+        """
+        order = kahn_order(v_count, self.successors)
+        self.stale = False
+        self.cyclic = order is None
+        if order is None:
+            order = list(range(v_count))
+        self.order = order
+        self.index = array('q', [0]) * v_count
+        for position, v in enumerate(order):
+            self.index[v] = position
+
+    def add_vertices(self, v_count: int) -> None:
+        """
+        New vertices have no edges, so they can go at the end of the order.
+        """
+        for v in range(len(self.order), v_count):
+            self.order.append(v)
+            self.index.append(v)
+
+    def is_valid(self) -> bool:
+        return not (self.cyclic or self.stale)
+
+    def add_edge(self, u: int, v: int) -> None:
+        """
+        This method updates the order after the edge U -> V was added to the graph.
+        """
+        if not self.is_valid():
+            return
+        lower, upper = self.index[v], self.index[u]
+        if lower < upper and not self._reorder(u, v, lower, upper):
+            self.cyclic = True
+
+    def try_add_edge(self, u: int, v: int) -> bool:
+        """
+        This method is called on a valid order before the edge U -> V is added to the graph.
+        It moves the vertices so the edge will point forward and returns True, or returns
+        False and changes nothing if the edge would close a cycle. Either way it costs the
+        same single search add_edge() would do, and add_edge() is O(1) afterwards.
+        """
+        lower, upper = self.index[v], self.index[u]
+        return lower > upper or self._reorder(u, v, lower, upper)
+
+    def remove_edge(self) -> None:
+        """
+        Removing an edge never breaks a valid order, but it may break the last cycle.
+        """
+        if self.cyclic:
+            self.stale = True
+
+    def can_reach(self, src: int, dst: int) -> bool:
+        """
+        This method returns True if DST can be reached from SRC. While the order is valid only
+        vertices positioned between SRC and DST need to be searched.
+        """
+        if src == dst:
+            return True
+        index = self.index
+        limit = index[dst]
+        if self.is_valid() and index[src] > limit:
+            return False
+
+        seen = {src}
+        stack = [src]
+        while stack:
+            for w in self.successors(stack.pop()):
+                if w == dst:
+                    return True
+                if w not in seen and (not self.is_valid() or index[w] < limit):
+                    seen.add(w)
+                    stack.append(w)
+        return False
+
+    def _reorder(self, u: int, v: int, lower: int, upper: int) -> bool:
+        """
+        Moves the affected vertices for the edge U -> V and returns True, or returns False
+        with nothing moved if U is reachable from V, that is, the edge closes a cycle.
+        Neither search follows U -> V itself, so this works before or after it is added.
+        """
+        index = self.index
+
+        # vertices reachable from v that sit at or before u
+        forward = []
+        seen = {v}
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            forward.append(x)
+            for y in self.successors(x):
+                if y == u:
+                    return False
+                if y not in seen and index[y] < upper:
+                    seen.add(y)
+                    stack.append(y)
+
+        # vertices that reach u and sit after v
+        backward = []
+        seen = {u}
+        stack = [u]
+        while stack:
+            x = stack.pop()
+            backward.append(x)
+            for y in self.predecessors(x):
+                if y not in seen and index[y] > lower:
+                    seen.add(y)
+                    stack.append(y)
+
+        # hand the same set of positions back out: everything that reaches u first,
+        # then everything reachable from v, each group keeping its relative order
+        backward.sort(key=index.__getitem__)
+        forward.sort(key=index.__getitem__)
+        moved = backward + forward
+        positions = sorted(index[x] for x in moved)
+        for position, x in zip(positions, moved):
+            index[x] = position
+            self.order[position] = x
+        return True
@@ -3,8 +3,17 @@
 # Assignment: Undirected Graphs
 # Description: Assignment 6
 
-import heapq 
-from collections import deque
+from array import array
+
+from edge_stream import parse_pairs, read_edge_batches
+from graph_io import read_graph, write_graph
+from graph_stats import GraphStats
+from graph_storage import CSRStorage, NeighborSet
+from path_batches import adjacency_checks, flatten_paths, validate_flat, validate_parallel
+from graph_traversal import bfs_order, dfs_order, iter_bfs, iter_dfs
+from interning import InternedGraph
+from parallel_bfs import level_bfs
+from union_find import UnionFind
 
 class UndirectedGraph:
     """
@@ -13,8 +22,26 @@ class UndirectedGraph:
     - loops not allowed
     - no edge weights
     - vertex names are strings
+    - each vertex maps to a NeighborSet: O(1) edge checks, prints like a list
     """
 
+    # number of edges, kept up to date by add_edge / remove_edge / remove_vertex
+    _edge_count = 0
+    # UnionFind of the connected components; None when it has to be rebuilt
+    _components = None
+    # bumped on every change to the vertices or edges
+    _version = 0
+    # InternedGraph from the last interned() call or load(); traversals use it only while current
+    _interned = None
+    # names whose NeighborSet is shared with a fork (see fork()); None when nothing is shared
+    _shared = None
+    # GraphStats when enabled with enable_stats()
+    _stats = None
+    # methods whose wall time is recorded while stats are enabled
+    _timed_methods = ('add_vertex', 'add_edge', 'add_edges', 'remove_edge', 'remove_vertex',
+                      'get_edges', 'is_valid_path', 'validate_paths', 'dfs', 'bfs',
+                      'count_connected_components', 'reachable', 'has_cycle')
+
     def __init__(self, start_edges=None):
         """
         Store graph info as adjacency list
@@ -48,9 +75,18 @@ class UndirectedGraph:
         If vertex with the same name is already present in the graph, the method
         does nothing (no exception needs to be raised).
         """
-        self.adj_list[v]= []
+        if v in self.adj_list:
+            return
+
+        self.adj_list[v] = NeighborSet()
+        self._version += 1
+        if self._components is not None:
+            self._components.add(v)
 
     def key_exists(self, key) -> bool:
+        snapshot = self._mapped()
+        if snapshot is not None:
+            return key in snapshot.ids
         return key in self.adj_list.keys()  
     
     def add_edge(self, u: str, v: str) -> None:
@@ -74,23 +110,45 @@ class UndirectedGraph:
         if not self.key_exists(v):
             self.add_vertex(v)
 
-        exists = False
-        for i in self.adj_list[u]:
-            if i == v:
-                exists = True
-        
-        if exists == False:
-            self.adj_list[u].append(v)
-        
-        exists = False
-        for i in self.adj_list[v]:
-            if i == u:
-                exists = True
-
-        if exists == False:
-            self.adj_list[v].append(u)
-        
-    
+        #add() returns False when the edge is already there
+        if self._own(u).add(v):
+            self._own(v).add(u)
+            self._edge_count += 1
+            self._version += 1
+            if self._components is not None:
+                self._components.union(u, v)
+        elif self._stats is not None:
+            self._stats.count('duplicate_edges')
+
+    def add_edges(self, pairs) -> None:
+        """
+        This method adds every (u, v) pair in PAIRS, same as calling add_edge() for each.
+        Loops and pairs repeated within the batch, in either direction, are dropped before
+        the adjacency lists are touched.
+        """
+        #frozenset keys match either direction without comparing names, which may be of mixed types
+        fresh = {}
+        for u, v in pairs:
+            if u != v:
+                fresh.setdefault(frozenset((u, v)), (u, v))
+
+        for u, v in fresh.values():
+            self.add_edge(u, v)
+
+    @classmethod
+    def from_edge_file(cls, source, batch_size=65536, delimiter=None, skip_header=False,
+                       progress=None) -> 'UndirectedGraph':
+        """
+        This method builds a graph from a CSV/TSV edge list of vertex name pairs, reading and
+        parsing BATCH_SIZE edges at a time (see edge_stream.read_edge_batches() for SOURCE,
+        DELIMITER, SKIP_HEADER and PROGRESS). Each batch goes in through add_edges(), so
+        duplicates are dropped as the file streams in and memory stays at one batch plus
+        the graph itself.
+        """
+        graph = cls()
+        for batch in read_edge_batches(source, parse_pairs, batch_size, delimiter, skip_header, progress):
+            graph.add_edges(batch)
+        return graph
 
     def remove_edge(self, v: str, u: str) -> None:
         """
@@ -107,14 +165,13 @@ class UndirectedGraph:
         if not self.key_exists(v):
             return
 
-        exists = False
-        for i in self.adj_list[u]:
-            if i == v:
-                exists = True
-
-        if exists:
-            self.adj_list[u].remove(v)
-            self.adj_list[v].remove(u)
+        #discard() returns False when there was no edge to remove
+        if self._own(u).discard(v):
+            self._own(v).discard(u)
+            self._edge_count -= 1
+            self._version += 1
+            #a removal may split a component, which union-find cannot undo
+            self._components = None
 
     def remove_vertex(self, v: str) -> None:
         """
@@ -124,9 +181,12 @@ class UndirectedGraph:
         """
         if self.key_exists(v):
             for i in self.adj_list[v]:
-                self.adj_list[i].remove(v)
+                self._own(i).discard(v)
             
+            self._edge_count -= len(self.adj_list[v])
             self.adj_list.pop(v)
+            self._components = None
+            self._version += 1
         
 
     def get_vertices(self) -> []:
@@ -134,6 +194,9 @@ class UndirectedGraph:
         This method returns a list of vertices of the graph. 
         Order of the vertices in the list does not matter.
         """
+        snapshot = self._mapped()
+        if snapshot is not None:
+            return list(snapshot.names)
         return list(self.adj_list.keys())
 
     def get_edges(self) -> []:
@@ -142,18 +205,35 @@ class UndirectedGraph:
         of two incident vertex names. Order of the edges in the list or order of the vertices
         incident to each edge does not matter.
         """
-        edge_list = [] #list(self.adj_list.items())
-        for v in self.adj_list:
-            for av in self.adj_list[v]:
-                tupe = (v, av)
-                tupe_flip = (av, v)
-                if tupe_flip not in edge_list:
-                    edge_list.append(tupe)
-                
-        return edge_list
+        return list(self.iter_edges())
 
-       
+    def iter_edges(self):
+        """
+        This method is a generator version of get_edges(). Each edge is yielded exactly once,
+        as (u, v) where u is the endpoint that comes first in the vertex order, so the whole
+        pass is O(V + E).
+        """
+        snapshot = self._mapped()
+        if snapshot is not None:
+            names = snapshot.names
+            for i, u in enumerate(names):
+                for j in snapshot.successors(i):
+                    if j > i:
+                        yield u, names[j]
+            return
 
+        done = set()
+        for u, neighbors in self.adj_list.items():
+            done.add(u)
+            for v in neighbors:
+                if v not in done:
+                    yield u, v
+
+    def edge_count(self) -> int:
+        """
+        This method returns the number of edges in the graph in O(1).
+        """
+        return self._edge_count
 
     def is_valid_path(self, path: []) -> bool:
         """
@@ -169,7 +249,13 @@ class UndirectedGraph:
         if len(path) == 1:
             return self.key_exists(path[0])
 
+        snapshot = self._mapped()
+        if snapshot is not None:
+            return snapshot.is_path(path)
+
         cur = path[0]
+        if not self.key_exists(cur):
+            return False
         for v in path[1:]:
             if v in self.adj_list[cur]:
                 cur = v
@@ -178,17 +264,22 @@ class UndirectedGraph:
 
         return True
 
-    def _dfs_helper(self, u, discovered, v_end=None) -> []:
-        g = self.adj_list
-        for v in sorted(g[u]):
-        
-            if v not in discovered:
-                if v_end in discovered:
-                    break
-                discovered.append(v)
-                self._dfs_helper(v, discovered, v_end)
-        return discovered
-        
+    def validate_paths(self, paths, offsets=None, workers=1) -> bytearray:
+        """
+        This method runs is_valid_path() on a whole batch of paths and returns a bytearray with
+        one entry per path: 1 if the path is valid, 0 if not.
+
+        PATHS is either a list of paths, or (when OFFSETS is given) one flat sequence of
+        vertex names where path i is paths[offsets[i]:offsets[i + 1]].
+        Every step is an O(1) neighbor set lookup. WORKERS > 1 splits the batch into chunks
+        checked by that many processes, each given a copy of the adjacency lists once.
+        """
+        flat, offsets = flatten_paths(paths, offsets)
+        if workers > 1:
+            adjacency = {v: list(neighbors) for v, neighbors in self.adj_list.items()}
+            return validate_parallel(flat, offsets, workers, 'adjacency', adjacency)
+
+        return validate_flat(flat, offsets, *adjacency_checks(self.adj_list))
 
     def dfs(self, v_start, v_end=None) -> []:
         """
@@ -207,42 +298,245 @@ class UndirectedGraph:
         implementation should pick the vertices in ascending lexicographical order (so, for example,
         vertex 'APPLE' is explored before vertex 'BANANA').
         """
-        discovered = [v_start]
-
-        if v_start not in self.adj_list:
+        if not self.key_exists(v_start):
             return []
 
-        return self._dfs_helper(v_start, discovered, v_end)
+        compact = self._current_interned()
+        if compact is not None:
+            return compact.dfs(v_start, v_end, self._stats)
 
+        return dfs_order(v_start, *self._search_inputs(), v_end)
 
-    def _bfs_helper(self, u, discovered, v_end=None) -> []:
-        g = self.adj_list
-        level = [u]
-        
-        while len(level) > 0:
-            next_level = []
-            for u in level:
-                for v in sorted(g[u]):
-                    if v not in discovered:
-                        if v_end in discovered:
-                            break
-                        discovered.append(v)
-                        next_level.append(v)
-                level = next_level
-        
-        return discovered
+    def iter_dfs(self, v_start, v_end=None, predicate=None, max_depth=None):
+        """
+        This method is a generator version of dfs(). It yields (vertex, depth) tuples in the
+        same order dfs() lists the vertices, where depth is the depth in the search tree.
+        Vertices are produced lazily, so a caller can stop as soon as it has what it needs.
+
+        V_END stops the search once that vertex is reached, same as dfs().
+        PREDICATE(v), if given, is called on each newly reached vertex; vertices for which it
+        returns False are skipped and not explored further.
+        MAX_DEPTH, if given, keeps the search from going further than that many edges from V_START.
+
+        Nothing is yielded if the starting vertex is not in the graph.
+        """
+        if not self.key_exists(v_start):
+            return
+
+        compact = self._current_interned()
+        if compact is not None:
+            yield from compact.iter_dfs(v_start, v_end, predicate, max_depth, self._stats)
+            return
+
+        yield from iter_dfs(v_start, *self._search_inputs(), v_end, predicate, max_depth)
 
     def bfs(self, v_start, v_end=None) -> []:
         """
         This method works the same as the DFS above, except it implements a breadth-first search.
         """
-        g = self.adj_list
-        level = [v_start]
-
-        if v_start not in g:
+        if not self.key_exists(v_start):
             return []
         
-        return self._bfs_helper(v_start, level, v_end)
+        compact = self._current_interned()
+        if compact is not None:
+            return compact.bfs(v_start, v_end, self._stats)
+
+        return bfs_order(v_start, *self._search_inputs(), v_end)
+
+    def iter_bfs(self, v_start, v_end=None, predicate=None, max_depth=None):
+        """
+        This method is a generator version of bfs(). It yields (vertex, depth) tuples in the
+        same order bfs() lists the vertices, where depth is the number of edges from V_START.
+        V_END, PREDICATE and MAX_DEPTH work the same way as in iter_dfs().
+
+        Nothing is yielded if the starting vertex is not in the graph.
+        """
+        if not self.key_exists(v_start):
+            return
+
+        compact = self._current_interned()
+        if compact is not None:
+            yield from compact.iter_bfs(v_start, v_end, predicate, max_depth, self._stats)
+            return
+
+        yield from iter_bfs(v_start, *self._search_inputs(), v_end, predicate, max_depth)
+
+    def parallel_bfs(self, v_start, workers=None, direction_optimizing=True, deterministic=False) -> tuple:
+        """
+        This method runs a level-synchronous breadth-first search from V_START on an interned
+        copy of the graph (see interned()) and returns (levels, parents, order). levels and
+        parents are arrays indexed by interned id, with -1 for unreached vertices and parents
+        given as ids too; order lists the reached vertex names level by level.
+
+        The current interned copy is used if there is one; otherwise a temporary one is built
+        for this call and dropped afterwards, so interning is not turned on as a side effect.
+
+        WORKERS, DIRECTION_OPTIMIZING and DETERMINISTIC work as in DirectedGraph.parallel_bfs();
+        with DETERMINISTIC, order is the same list bfs() returns.
+        """
+        compact = self._snapshot()
+        n = len(compact)
+        if v_start not in compact.ids:
+            return array('q', [-1]) * n, array('q', [-1]) * n, []
+
+        #every edge is stored both ways, so the graph is its own reverse for bottom-up steps
+        graph = CSRStorage(compact.offsets, compact.targets, array('q', [1]) * len(compact.targets))
+        levels, parents, order = level_bfs(graph, compact.ids[v_start], None, workers,
+                                           direction_optimizing, deterministic)
+        return levels, parents, [compact.names[i] for i in order]
+
+    def _search_inputs(self) -> tuple:
+        """
+        Returns (successors, visited set) for a traversal over adj_list, visiting neighbors in
+        sorted order. With stats enabled both are wrapped so the work gets counted.
+        """
+        g = self.adj_list
+        successors, visited = (lambda u: g[u].sorted()), set()
+        if self._stats is not None:
+            return self._stats.scanning(successors), self._stats.visiting(visited)
+        return successors, visited
+
+    def enable_stats(self, callback=None) -> GraphStats:
+        """
+        This method turns on instrumentation and returns the GraphStats that collects it:
+        counters for vertices visited, neighbor scans and duplicate edges, plus a wall-time
+        histogram per public method. CALLBACK works as in DirectedGraph.enable_stats().
+        """
+        if self._stats is None:
+            self._stats = GraphStats(callback)
+            self._stats.attach(self, self._timed_methods)
+        elif callback is not None:
+            self._stats.callback = callback
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """
+        This method turns instrumentation off and drops what was recorded.
+        """
+        if self._stats is not None:
+            self._stats.detach(self, self._timed_methods)
+            self._stats = None
+
+    def get_stats(self) -> dict:
+        """
+        This method returns a snapshot of the recorded counters and timings, or None when
+        stats are not enabled.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
+
+    def interned(self) -> InternedGraph:
+        """
+        This method returns an InternedGraph: a read-only copy of the graph where every vertex
+        name is mapped once to an integer id (in sorted name order) and the neighbor lists are
+        integer arrays.
+
+        While the copy is current, dfs(), bfs(), iter_dfs() and iter_bfs() run on integer ids
+        with a bytearray visited set and only convert back to names for the result, with the
+        same lexicographic visiting order. After a change they go back to adj_list, so an edit
+        never makes the next traversal pay for a rebuild; calling interned() again rebuilds the
+        copy in O((V + E) log V) and switches them back to it.
+
+        adj_list stays the graph's mutable source of truth, so the copy is extra memory on
+        top of it; the saving is CPU, not memory.
+        """
+        if self._interned is None or self._interned.version != self._version:
+            self._interned = InternedGraph.from_adjacency(self.adj_list, self._version)
+        return self._interned
+
+    def fork(self) -> 'UndirectedGraph':
+        """
+        This method returns an independent copy of the graph in O(V): the copy starts out
+        sharing every NeighborSet with this graph, and whichever of the two changes a shared
+        set first gets its own copy of it (see _own()), so neither sees the other's changes.
+        """
+        copy = type(self)()
+        copy.adj_list = dict(self.adj_list)
+        copy._shared = set(self.adj_list)
+        self._shared = set(self.adj_list)
+        copy._edge_count = self._edge_count
+        copy._version = self._version
+        #the interned snapshot is read-only, so the copy can use it until either graph changes
+        copy._interned = self._interned
+        return copy
+
+    def _own(self, v) -> NeighborSet:
+        """
+        Returns the NeighborSet of V, copied first if it is still shared with a fork,
+        so it can be changed.
+        """
+        neighbors = self.adj_list[v]
+        if self._shared is not None and v in self._shared:
+            self._shared.discard(v)
+            neighbors = self.adj_list[v] = NeighborSet(neighbors)
+        return neighbors
+
+    def save(self, path) -> None:
+        """
+        This method writes the graph to PATH in the binary CSR format of graph_io: the
+        interned integer adjacency plus a string table with the vertex names.
+        """
+        compact = self._snapshot()
+        write_graph(path, 'undirected', compact.offsets, compact.targets, names=compact.names)
+
+    @classmethod
+    def load(cls, path, mmap=True) -> 'UndirectedGraph':
+        """
+        This method reads a graph written by save(). Vertices come back in sorted name order.
+
+        The integer adjacency becomes the graph's InternedGraph (over the mapped file with
+        MMAP), and adj_list is not built until something needs it. Until then traversals,
+        parallel_bfs(), get_vertices(), get_edges(), is_valid_path(), the component queries and
+        save() all run on the snapshot; the first change or any other use of adj_list builds it
+        in O(V + E). graph_io.read_graph() gives just the mapped arrays.
+        """
+        data = read_graph(path, mmap)
+        if data.kind != 'undirected':
+            raise ValueError(f'{path} holds a directed graph')
+
+        #skip __init__ so adj_list stays unset; __getattr__ builds it on first use
+        graph = cls.__new__(cls)
+        graph._edge_count = len(data.targets) // 2
+        graph._interned = InternedGraph(data.names, data.offsets, data.targets, graph._version)
+        return graph
+
+    def __getattr__(self, name):
+        """
+        Only called for attributes that are not set, which for adj_list means a graph from
+        load() that has not needed it yet: it is built from the snapshot and kept.
+        """
+        if name != 'adj_list' or self._interned is None:
+            raise AttributeError(name)
+        names, offsets, targets = self._interned.names, self._interned.offsets, self._interned.targets
+        self.adj_list = {name: NeighborSet(names[j] for j in targets[offsets[i]:offsets[i + 1]])
+                         for i, name in enumerate(names)}
+        return self.adj_list
+
+    def _mapped(self):
+        """
+        Returns the InternedGraph from load() while adj_list has not been built from it, else None.
+        """
+        if 'adj_list' in self.__dict__:
+            return None
+        return self._interned
+
+    def _current_interned(self):
+        """
+        Returns the InternedGraph if it matches the graph as it is now, else None.
+        """
+        if self._interned is None or self._interned.version != self._version:
+            return None
+        return self._interned
+
+    def _snapshot(self) -> InternedGraph:
+        """
+        Returns the current InternedGraph, or a fresh one that is not kept.
+        """
+        compact = self._current_interned()
+        if compact is None:
+            compact = InternedGraph.from_adjacency(self.adj_list, self._version)
+        return compact
     
     #create a helper function that returns a list of vertices that are not in input list
 
@@ -250,38 +544,63 @@ class UndirectedGraph:
         return list(set(vert_list).difference(fert_list))
 
 
+    def _component_sets(self) -> UnionFind:
+        """
+        Returns the union-find of connected components, rebuilding it from the edges if a
+        removal invalidated it. Between removals it is updated in place as edges are added.
+        """
+        if self._components is None:
+            components = UnionFind(self.get_vertices())
+            for u, v in self.iter_edges():
+                components.union(u, v)
+            self._components = components
+        return self._components
+
     def count_connected_components(self) -> int:
         """
         This method returns the number of connected components in the graph.
+
+        Components are tracked with union-find: adding vertices and edges updates them in
+        near-constant time, and only a removal forces a rebuild, done once on the next query.
         """
-        to_find = self.get_vertices()
-        # length = len(to_find)
-        components_list = []
-        found = []
-
-        start_v = to_find[0]
-        some_comp = self.dfs(start_v)
-        found.extend(some_comp)
-        components_list.append(some_comp)
-        missing = self.missing_vertices(to_find, found)
-
-        while len(missing) > 0:
-            v_start = missing[0]
-            some_comp = self.dfs(v_start)
-            found.extend(some_comp)
-            components_list.append(some_comp)
-            missing = self.missing_vertices(to_find, found)
-        
-        return len(components_list)
+        return self._component_sets().count
+
+    def same_component(self, u: str, v: str) -> bool:
+        """
+        This method returns True if vertices U and V are connected by some path.
+        If either vertex is not in the graph, the method returns False.
+        """
+        if not (self.key_exists(u) and self.key_exists(v)):
+            return False
+
+        return self._component_sets().same(u, v)
+
+    def reachable(self, u: str, v: str) -> bool:
+        """
+        This method returns True if there is a path between vertices U and V (every vertex
+        reaches itself). If either vertex is not in the graph, the method returns False.
+
+        In an undirected graph this is the same as same_component(), answered from the
+        union-find component index without searching the graph.
+        """
+        return self.same_component(u, v)
+
+    def reachable_many(self, pairs) -> []:
+        """
+        This method answers reachable(u, v) for every (u, v) in PAIRS and returns a list of bools.
+        """
+        components = self._component_sets()
+        return [u in components and v in components and components.same(u, v) for u, v in pairs]
 
     def has_cycle(self) -> bool:
         """
         This method returns True if there is at least one cycle in the graph. If the graph is acyclic,
         the method returns False.
         """
-        num_verts = len(self.get_vertices())
+        snapshot = self._mapped()
+        num_verts = len(snapshot) if snapshot is not None else len(self.adj_list)
         num_components = self.count_connected_components()
-        num_edges = len(self.get_edges())
+        num_edges = self.edge_count()
 
         test_cycle = num_verts - num_components
         if test_cycle == num_edges:
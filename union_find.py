@@ -0,0 +1,65 @@
+# Course: CS261 - Data Structures
+# Author: Elizabeth Ponce
+# Assignment: Portfolio Project
+# Description: Disjoint set (union-find) structure for tracking connected components
+
+
+class UnionFind:
+    """
+    Disjoint sets over hashable items
+    - union by rank keeps the trees shallow
+    - find() halves the path it walks, so repeated lookups get close to O(1)
+    - count is the number of separate sets
+    """
+
+    def __init__(self, items=()):
+        self.parent = {}
+        self.rank = {}
+        self.count = 0
+        for x in items:
+            self.add(x)
+
+    def __contains__(self, x) -> bool:
+        return x in self.parent
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self, x) -> None:
+        """
+        This method adds X as a set of its own. Items already present are left alone.
+        """
+        if x in self.parent:
+            return
+        self.parent[x] = x
+        self.rank[x] = 0
+        self.count += 1
+
+    def find(self, x):
+        """
+        This method returns the representative item of the set containing X.
+        """
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b) -> bool:
+        """
+        This method merges the sets containing A and B. It returns False if they were
+        already in the same set.
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        self.count -= 1
+        return True
+
+    def same(self, a, b) -> bool:
+        return self.find(a) == self.find(b)